@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Test-results ingest throughput and memory benchmark
+Writes synthetic JUnit XML and JSON results of 10,000 and 1,000,000 test
+cases and reports tests/sec and peak RSS for summarizing each, every case
+in a fresh interpreter. Peak RSS should stay flat as the case count grows.
+Usage: python benchmarks/ingest.py [--sizes 10000 1000000] [-o results.json]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from throughput import peak_rss_mb  # noqa: E402
+
+DEFAULT_SIZES = (10000, 1000000)
+AGENTS = ("Policy", "Claims", "Member", "Integration", "Security", "Analytics")
+SUITES = 200
+
+
+def synthetic_cases(cases):
+    """(suite, name, status, seconds, agent) of `cases` deterministic test results"""
+    for index in range(cases):
+        suite = f"regression.{AGENTS[index % len(AGENTS)].lower()}.suite_{index % SUITES:03d}"
+        status = "failed" if index % 97 == 0 else "skipped" if index % 53 == 0 else "passed"
+        yield suite, f"test_case_{index}", status, (index * 7919 % 100000) / 1000, AGENTS[index % len(AGENTS)]
+
+
+def write_junit(path, cases):
+    """Write `cases` synthetic results as JUnit XML, one <testsuite> per suite run"""
+    with open(path, "w", encoding="utf-8") as handle:
+        handle.write('<?xml version="1.0" encoding="utf-8"?>\n<testsuites>\n')
+        current = None
+        for suite, name, status, seconds, agent in synthetic_cases(cases):
+            if suite != current:
+                if current is not None:
+                    handle.write("</testsuite>\n")
+                handle.write(f'<testsuite name="{suite}">\n')
+                current = suite
+            handle.write(f'<testcase name="{name}" classname="{suite}" time="{seconds}">'
+                         f'<properties><property name="agent" value="{agent}"/></properties>')
+            if status == "failed":
+                handle.write('<failure message="assertion failed">Traceback...\nAssertionError</failure>')
+            elif status == "skipped":
+                handle.write("<skipped/>")
+            handle.write("</testcase>\n")
+        if current is not None:
+            handle.write("</testsuite>\n")
+        handle.write("</testsuites>\n")
+
+
+def write_json(path, cases):
+    """Write `cases` synthetic results as a JSON document with a "tests" array"""
+    with open(path, "w", encoding="utf-8") as handle:
+        handle.write('{"summary": {}, "tests": [\n')
+        for index, (suite, name, status, seconds, agent) in enumerate(synthetic_cases(cases)):
+            record = {"suite": suite, "name": name, "outcome": status, "duration": seconds, "agent": agent}
+            handle.write(("," if index else "") + json.dumps(record) + "\n")
+        handle.write("]}\n")
+
+
+def run_case(path):
+    """Summarize one results file in this process and return its measurements"""
+    from deck_results import summarize
+
+    started = time.perf_counter()
+    summary = summarize([path])
+    seconds = time.perf_counter() - started
+    return {
+        "name": os.path.basename(path),
+        "tests": summary.total.tests,
+        "seconds": round(seconds, 3),
+        "tests_per_sec": round(summary.total.tests / seconds) if seconds else 0,
+        "peak_rss_mb": peak_rss_mb(),
+        "input_mb": round(os.path.getsize(path) / (1024 * 1024), 1),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES), help="test cases per file")
+    parser.add_argument("-o", "--output", help="write the results as JSON to this path")
+    parser.add_argument("--case", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.case:
+        print(json.dumps(run_case(args.case)))
+        return 0
+
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for size in args.sizes:
+            for ext, write in ((".xml", write_junit), (".json", write_json)):
+                path = os.path.join(directory, f"results_{size}{ext}")
+                write(path, size)
+                run = subprocess.run([sys.executable, os.path.abspath(__file__), "--case", path],
+                                     check=True, stdout=subprocess.PIPE, text=True)
+                results.append(json.loads(run.stdout))
+                os.remove(path)
+
+    print(f"{'file':<24} {'tests':>9} {'input MiB':>10} {'tests/s':>9} {'seconds':>8} {'RSS MiB':>8}")
+    for case in results:
+        rss = case["peak_rss_mb"] if case["peak_rss_mb"] is not None else "n/a"
+        print(f"{case['name']:<24} {case['tests']:>9} {case['input_mb']:>10} {case['tests_per_sec']:>9} "
+              f"{case['seconds']:>8} {rss:>8}")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump({"cases": results}, handle, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Startup-time benchmark for the non-rendering CLI paths
+Runs `convert_to_pptx.py --help` and `--check` in fresh interpreters and
+fails if either exceeds the time budget or pulls in python-pptx / lxml.
+Usage: python benchmarks/startup.py [--budget 0.25] [--runs 7]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CLI = os.path.join(REPO_ROOT, "convert_to_pptx.py")
+DEFAULT_BUDGET = 0.25  # seconds, median wall time per invocation
+HEAVY_MODULES = ("pptx", "lxml", "PIL")
+
+CASES = {
+    "--help": [CLI, "--help"],
+    "--check": [CLI, "--check"],
+}
+
+
+def time_command(args, runs):
+    """Median wall time of `python args...` over `runs` fresh interpreters"""
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, *args], cwd=REPO_ROOT, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples)
+
+
+def heavy_imports(args):
+    """Heavy top-level packages imported by `python args...`, via -X importtime"""
+    result = subprocess.run([sys.executable, "-X", "importtime", *args], cwd=REPO_ROOT,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    found = set()
+    for line in result.stderr.splitlines():
+        module = line.rsplit("|", 1)[-1].strip()
+        if module.split(".")[0] in HEAVY_MODULES:
+            found.add(module.split(".")[0])
+    return sorted(found)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check convert_to_pptx.py startup time stays within budget")
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET, help="seconds per invocation (median)")
+    parser.add_argument("--runs", type=int, default=7, help="interpreter launches per case")
+    args = parser.parse_args(argv)
+
+    baseline = time_command(["-c", "pass"], args.runs)
+    print(f"🐍 bare interpreter: {baseline * 1000:.0f} ms")
+
+    failed = False
+    for name, command in CASES.items():
+        seconds = time_command(command, args.runs)
+        heavy = heavy_imports(command)
+        ok = seconds <= args.budget and not heavy
+        failed |= not ok
+        status = "✅" if ok else "❌"
+        print(f"{status} {name}: {seconds * 1000:.0f} ms (budget {args.budget * 1000:.0f} ms)"
+              + (f", imports {', '.join(heavy)}" if heavy else ""))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Deck generation throughput and memory benchmark
+Renders synthetic decks of 10, 1,000 and 10,000 slides (bullet, two_column,
+table and big-number slides plus the three architecture diagrams) and
+reports slides/sec, peak RSS and the build vs prs.save() time split.
+With --stream, decks are written by the streaming package writer instead
+(the save time is then the zip writing interleaved with rendering), and
+with --workers N their slides are rendered in N processes and merged
+(peak RSS is then the parent's, which writes the package).
+Usage: python benchmarks/throughput.py -o results.json [--baseline old.json]
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+DEFAULT_SIZES = (10, 1000, 10000)
+DEFAULT_TOLERANCE = 0.15  # allowed relative regression before failing
+
+# Metric name -> True if higher is better
+METRICS = {
+    "slides_per_sec": True,
+    "build_seconds": False,
+    "save_seconds": False,
+    "peak_rss_mb": False,
+}
+
+
+def synthetic_deck(slides):
+    """Yield the Markdown lines of a deck with `slides` sections of mixed kinds"""
+    yield "# Synthetic Benchmark Deck"
+    yield ""
+    yield "## Slide 1: Title"
+    yield "# Agentic Testing Framework"
+    yield "## Benchmark Edition"
+    yield "*Synthetic content for throughput measurements*"
+    for number in range(2, slides):
+        yield "---"
+        yield ""
+        yield f"## Slide {number}: Section {number}"
+        kind = number % 4
+        if kind == 0:
+            yield f"# Problem Statement {number}"
+            for item in range(6):
+                yield f"- **Point {item}**: automated agents cover regression item {item} in claims flow {number}"
+        elif kind == 1:
+            yield "<!-- layout: two_column -->"
+            yield f"# Domain Coverage {number}"
+            for group in ("Claims", "Eligibility"):
+                yield f"### {group}"
+                for item in range(4):
+                    yield f"- {group} rule {item} validated against policy {number}"
+        elif kind == 2:
+            yield f"# Comparison {number}"
+            yield "| Capability | Manual | Scripted | Agentic |"
+            yield "|---|---|---|---|"
+            for row in range(8):
+                yield f"| Capability {row} | {row * 3}h | {row * 2}h | {row}m |"
+        else:
+            yield "<!-- slide: big_number -->"
+            yield f"# Impact {number}"
+            yield f"- **{number % 97}%** cost reduction"
+            yield f"- **{number % 13}x** faster cycles"
+            yield f"- **{number % 50}+** agents"
+        yield ""
+    yield "---"
+    yield ""
+    yield f"## Slide {slides}: Thank You"
+    yield "# Thank You"
+    yield "## Questions?"
+
+
+def run_case(slides, backend, stream=False, workers=None):
+    """Build and save one synthetic deck in this process and return its measurements"""
+    if stream or workers:
+        build_seconds, save_seconds, rendered, output_bytes = _stream_case(slides, backend, workers)
+    else:
+        build_seconds, save_seconds, rendered, output_bytes = _save_case(slides, backend)
+    total = build_seconds + save_seconds
+    return {
+        "name": f"{slides}_slides",
+        "source_slides": slides,
+        "rendered_slides": rendered,
+        "build_seconds": round(build_seconds, 4),
+        "save_seconds": round(save_seconds, 4),
+        "save_fraction": round(save_seconds / total, 4) if total else 0.0,
+        "slides_per_sec": round(rendered / total, 2) if total else 0.0,
+        "peak_rss_mb": peak_rss_mb(),
+        "output_bytes": output_bytes,
+    }
+
+
+def _save_case(slides, backend):
+    from deck_package import save_presentation
+    from deck_render import iter_deck_specs, new_presentation, render_slide
+
+    prs = new_presentation()
+    started = time.perf_counter()
+    for spec in iter_deck_specs(synthetic_deck(slides), diagrams=True):
+        render_slide(prs, spec, backend)
+    build_seconds = time.perf_counter() - started
+
+    with tempfile.TemporaryDirectory() as directory:
+        started = time.perf_counter()
+        save_presentation(prs, os.path.join(directory, "bench.pptx"))
+        save_seconds = time.perf_counter() - started
+        output_bytes = os.path.getsize(os.path.join(directory, "bench.pptx"))
+    return build_seconds, save_seconds, len(prs.slides), output_bytes
+
+
+def _stream_case(slides, backend, workers=None):
+    from deck_package import read_skeleton, write_package
+    from deck_render import iter_deck_specs, new_presentation, render_parts, render_sharded
+
+    build_seconds = 0.0
+
+    def timed(parts):
+        # Time spent producing parts is build time; the rest is zip writing
+        nonlocal build_seconds
+        parts = iter(parts)
+        while True:
+            started = time.perf_counter()
+            part = next(parts, None)
+            build_seconds += time.perf_counter() - started
+            if part is None:
+                return
+            yield part
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "bench.pptx")
+        started = time.perf_counter()
+        specs = iter_deck_specs(synthetic_deck(slides), diagrams=True)
+        if workers and workers > 1:
+            parts = render_sharded(specs, workers, backend)
+        else:
+            parts = render_parts(specs, backend)
+        rendered = write_package(path, read_skeleton(new_presentation()), timed(parts))
+        total = time.perf_counter() - started
+        output_bytes = os.path.getsize(path)
+    return build_seconds, total - build_seconds, rendered, output_bytes
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MiB, or None where unsupported"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in KiB on Linux and bytes on macOS
+    scale = 1 if sys.platform == "darwin" else 1024
+    return round(peak * scale / (1024 * 1024), 1)
+
+
+def run_isolated(slides, backend, repeat=1, stream=False, workers=None):
+    """
+    Run one case `repeat` times, each in a fresh interpreter so peak RSS is
+    not shared between cases, and keep the fastest run.
+    """
+    runs = []
+    for _ in range(repeat):
+        result = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--case", str(slides), "--backend", backend]
+            + (["--stream"] if stream else []) + (["--workers", str(workers)] if workers else []),
+            check=True, stdout=subprocess.PIPE, text=True,
+        )
+        runs.append(json.loads(result.stdout))
+    return min(runs, key=lambda run: run["build_seconds"] + run["save_seconds"])
+
+
+def compare(results, baseline, tolerance):
+    """Return regression messages for `results` against a baseline results document"""
+    previous = {case["name"]: case for case in baseline.get("cases", [])}
+    regressions = []
+    for case in results:
+        old = previous.get(case["name"])
+        if old is None:
+            continue
+        for metric, higher_is_better in METRICS.items():
+            new_value, old_value = case.get(metric), old.get(metric)
+            if not new_value or not old_value:
+                continue
+            change = (new_value - old_value) / old_value
+            if (-change if higher_is_better else change) > tolerance:
+                regressions.append(f"{case['name']}: {metric} {old_value} -> {new_value} ({change:+.0%})")
+    return regressions
+
+
+def print_table(results):
+    """Print the per-case summary"""
+    print(f"{'case':<14} {'slides':>7} {'slides/s':>9} {'build s':>8} {'save s':>8} {'save %':>7} {'RSS MiB':>8}")
+    for case in results:
+        rss = case["peak_rss_mb"] if case["peak_rss_mb"] is not None else "n/a"
+        print(f"{case['name']:<14} {case['rendered_slides']:>7} {case['slides_per_sec']:>9} "
+              f"{case['build_seconds']:>8} {case['save_seconds']:>8} "
+              f"{case['save_fraction'] * 100:>6.1f}% {rss:>8}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark deck generation throughput and memory")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES),
+                        help="synthetic deck sizes in source slides")
+    parser.add_argument("--backend", choices=("lxml", "proxy"), default="lxml")
+    parser.add_argument("--stream", action="store_true",
+                        help="write decks with the streaming package writer instead of prs.save()")
+    parser.add_argument("-j", "--workers", type=int,
+                        help="render each deck's slides in this many processes (implies --stream)")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="runs per case, fastest kept (sizes of 1,000+ run once)")
+    parser.add_argument("-o", "--output", help="write results JSON here")
+    parser.add_argument("--baseline", help="results JSON from an earlier run to compare against")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="relative regression allowed per metric (default: 0.15)")
+    parser.add_argument("--case", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.case is not None:
+        print(json.dumps(run_case(args.case, args.backend, args.stream, args.workers)))
+        return 0
+
+    results = []
+    for slides in args.sizes:
+        print(f"⏱️  {slides} slides...", flush=True)
+        repeat = args.repeat if slides < 1000 else 1
+        results.append(run_isolated(slides, args.backend, repeat, args.stream, args.workers))
+    print_table(results)
+
+    document = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "backend": args.backend,
+        "stream": args.stream or bool(args.workers),
+        "workers": args.workers or 1,
+        "cases": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(document, handle, indent=2)
+        print(f"📄 Results: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as handle:
+            regressions = compare(results, json.load(handle), args.tolerance)
+        for regression in regressions:
+            print(f"❌ {regression}")
+        if regressions:
+            return 1
+        print(f"✅ No regressions beyond {args.tolerance:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
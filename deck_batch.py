@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Batch conversion of many Markdown decks on a process pool
+Usage: python deck_batch.py decks/ "variants/*.md" -o out/ -j 8
+
+Slide decks (`## Slide N:` sections) convert like convert_to_pptx.py;
+prose documents without slide headings become one slide per `## `
+section. A source that yields no slides fails rather than producing a
+deck of diagram slides alone.
+"""
+
+import argparse
+import glob
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from deck_styles import DEFAULT_THEME, THEMES
+
+
+def collect_sources(patterns):
+    """Expand directories and glob patterns into a sorted, de-duplicated list of .md files"""
+    sources = set()
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            sources.update(glob.glob(os.path.join(pattern, "*.md")))
+        else:
+            sources.update(path for path in glob.glob(pattern) if os.path.isfile(path))
+    return sorted(sources)
+
+
+def output_path(source, output_dir=None):
+    """Map a Markdown source to its .pptx output path"""
+    stem = os.path.splitext(os.path.basename(source))[0]
+    directory = output_dir or os.path.dirname(source)
+    return os.path.join(directory, stem + ".pptx")
+
+
+def check_outputs(sources, output_dir=None):
+    """Raise ValueError when two sources would write the same .pptx (same file name, one --output-dir)"""
+    claimed = {}
+    for source in sources:
+        output = os.path.normcase(os.path.abspath(output_path(source, output_dir)))
+        if output in claimed:
+            raise ValueError(f"{claimed[output]} and {source} would both be written to "
+                             f"{output_path(source, output_dir)}")
+        claimed[output] = source
+
+
+def convert_one(source, output, diagrams=True, theme=None):
+    """Convert one deck in a worker; returns (source, output, slides, seconds, error)"""
+    started = time.perf_counter()
+    try:
+        # Imported here so the parent process never pays for python-pptx
+        import deck_styles
+        from deck_markdown import is_slide_deck, iter_section_specs
+        from deck_render import create_presentation, write_presentation
+        if is_slide_deck(source):
+            slides = create_presentation(source, output, diagrams=diagrams, theme=theme)
+        else:
+            specs = list(iter_section_specs(source))
+            if not specs:
+                raise ValueError("no `## Slide N:` or `## ` sections to convert")
+            deck_styles.use_theme(theme or DEFAULT_THEME)
+            slides = write_presentation(specs, output)
+        error = None
+    except Exception as e:
+        slides, error = 0, f"{type(e).__name__}: {e}"
+    return source, output, slides, time.perf_counter() - started, error
+
+
+def convert_batch(sources, output_dir=None, workers=None, diagrams=True, theme=None):
+    """
+    Convert `sources` concurrently and return their results in source order.
+
+    Each output is written atomically by create_presentation, so a failed or
+    interrupted conversion never leaves a truncated .pptx behind. Sources
+    that would overwrite each other's output raise ValueError before any
+    conversion starts.
+    """
+    check_outputs(sources, output_dir)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    results = {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(convert_one, source, output_path(source, output_dir), diagrams, theme)
+                   for source in sources]
+        for future in as_completed(futures):
+            result = future.result()
+            results[result[0]] = result
+    return [results[source] for source in sources]
+
+
+def print_summary(results, wall_seconds):
+    """Print the per-file timing summary"""
+    width = max((len(os.path.basename(source)) for source, *_ in results), default=10)
+    print(f"{'deck':<{width}}  {'slides':>6}  {'seconds':>8}  status")
+    for source, output, slides, seconds, error in sorted(results, key=lambda r: -r[3]):
+        status = "ok" if error is None else error
+        print(f"{os.path.basename(source):<{width}}  {slides:>6}  {seconds:>8.2f}  {status}")
+
+    failed = sum(1 for result in results if result[4] is not None)
+    cpu_seconds = sum(result[3] for result in results)
+    print(f"📊 {len(results) - failed} converted, {failed} failed, "
+          f"{wall_seconds:.2f}s wall / {cpu_seconds:.2f}s summed "
+          f"({cpu_seconds / wall_seconds if wall_seconds else 0:.1f}x parallel speedup)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Convert many Markdown decks to PowerPoint in parallel")
+    parser.add_argument("inputs", nargs="+", help="directories or glob patterns of Markdown decks")
+    parser.add_argument("-o", "--output-dir", help="directory for the .pptx files (default: next to each source)")
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count(), help="worker processes")
+    parser.add_argument("--no-diagrams", action="store_true", help="skip the architecture diagram slides")
+    parser.add_argument("--theme", choices=THEMES, default=DEFAULT_THEME, help="color theme for every slide")
+    args = parser.parse_args(argv)
+
+    sources = collect_sources(args.inputs)
+    if not sources:
+        parser.error("no Markdown files matched")
+    try:
+        check_outputs(sources, args.output_dir)
+    except ValueError as e:
+        parser.error(str(e))
+
+    started = time.perf_counter()
+    results = convert_batch(sources, args.output_dir, args.workers, diagrams=not args.no_diagrams,
+                            theme=args.theme)
+    print_summary(results, time.perf_counter() - started)
+    return 1 if any(result[4] for result in results) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
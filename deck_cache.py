@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Sidecar cache of rendered slide parts for incremental rebuilds
+Each slide spec is stored under a key derived from its source section and
+the renderer fingerprint, so unchanged slides are reused byte-for-byte.
+Pictures are stored once, by their content-addressed part name, however
+many cached slides use them.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import uuid
+
+from deck_media import file_digest
+
+
+def slide_key(fingerprint, spec):
+    """Cache key for one slide spec: renderer fingerprint + slide kind + section, image and chart data hashes"""
+    digest = spec.digest or hashlib.sha256(spec.title.encode("utf-8")).hexdigest()
+    images = [file_digest(path) for _, path in spec.images]
+    if spec.kind == "chart" and spec.source:
+        images.append(file_digest(spec.source))
+    material = "\0".join((fingerprint, spec.kind, spec.layout_type, digest, *images))
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class SlideCache:
+    """
+    Directory of rendered slide parts keyed by slide_key()
+
+    One spec can render to several slides (a paginated table), so each key
+    maps to a directory of numbered XML/rels part pairs, plus a list of the
+    media parts each slide uses; the media bytes live in a shared
+    directory named by part.
+    """
+
+    INDEX = "index.json"
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.slides_dir = os.path.join(directory, "slides")
+        self.media_dir = os.path.join(directory, "media")
+        os.makedirs(self.slides_dir, exist_ok=True)
+        os.makedirs(self.media_dir, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """Return the cached list of (slide_xml, rels_xml, media) parts, or None"""
+        entry = os.path.join(self.slides_dir, key)
+        try:
+            count = sum(1 for name in os.listdir(entry) if name.endswith(".xml"))
+            parts = []
+            for index in range(count):
+                base = os.path.join(entry, str(index))
+                with open(base + ".xml", "rb") as xml_file, open(base + ".rels", "rb") as rels_file:
+                    parts.append((xml_file.read(), rels_file.read(), self._read_media(base + ".media")))
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return parts
+
+    def put(self, key, parts):
+        """Store the rendered slide parts for one spec"""
+        entry = os.path.join(self.slides_dir, key)
+        tmp_entry = os.path.join(self.slides_dir, f".{key}.{uuid.uuid4().hex}.tmp")
+        os.makedirs(tmp_entry)
+        for index, (slide_xml, rels_xml, media) in enumerate(parts):
+            base = os.path.join(tmp_entry, str(index))
+            with open(base + ".xml", "wb") as handle:
+                handle.write(slide_xml)
+            with open(base + ".rels", "wb") as handle:
+                handle.write(rels_xml)
+            if media:
+                self._write_media(base + ".media", media)
+        shutil.rmtree(entry, ignore_errors=True)
+        os.replace(tmp_entry, entry)
+
+    def _media_path(self, name):
+        return os.path.join(self.media_dir, os.path.basename(name))
+
+    def _read_media(self, listing):
+        if not os.path.exists(listing):
+            return ()
+        media = []
+        with open(listing, encoding="utf-8") as handle:
+            for name in handle.read().split():
+                with open(self._media_path(name), "rb") as blob_file:
+                    media.append((name, blob_file.read()))
+        return tuple(media)
+
+    def _write_media(self, listing, media):
+        for name, blob in media:
+            path = self._media_path(name)
+            if not os.path.exists(path):  # content-addressed: same name, same bytes
+                tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+                with open(tmp_path, "wb") as handle:
+                    handle.write(blob)
+                os.replace(tmp_path, path)
+        with open(listing, "w", encoding="utf-8") as handle:
+            handle.write("\n".join(name for name, _ in media))
+
+    def prune(self, keys):
+        """Drop cached parts that the latest build (slide keys in order) no longer uses"""
+        live_keys = set(keys)
+        for name in os.listdir(self.slides_dir):
+            if name not in live_keys:
+                shutil.rmtree(os.path.join(self.slides_dir, name), ignore_errors=True)
+
+        live_media = set()
+        for key in live_keys:
+            entry = os.path.join(self.slides_dir, key)
+            for listing in os.listdir(entry) if os.path.isdir(entry) else ():
+                if listing.endswith(".media"):
+                    with open(os.path.join(entry, listing), encoding="utf-8") as handle:
+                        live_media.update(os.path.basename(name) for name in handle.read().split())
+        for name in os.listdir(self.media_dir):
+            if name not in live_media:
+                os.remove(os.path.join(self.media_dir, name))
+        with open(os.path.join(self.directory, self.INDEX), "w", encoding="utf-8") as handle:
+            json.dump({"keys": list(keys)}, handle, indent=2)
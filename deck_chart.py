@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Series data for native chart slides
+A chart's data is a table: the first column holds the x values (numbers,
+or labels such as release names and dates) and every other column one
+numeric series. It comes from a Markdown table on the slide or a CSV
+file, read row by row into compact arrays.
+
+Series longer than MAX_POINTS are downsampled with Largest-Triangle-
+Three-Buckets (LTTB), which keeps the peaks, dips and trend of the line
+while dropping the points a viewer could not tell apart, so the embedded
+workbook stays small however long the history. NumPy speeds up long
+series when it is installed; the pure Python fallback selects the same
+points.
+"""
+
+import csv
+import math
+from array import array
+from dataclasses import dataclass
+from functools import lru_cache
+
+MAX_POINTS = 500  # per series, after downsampling
+NUMPY_MIN_POINTS = 2048  # below this, array setup costs more than it saves
+
+
+@lru_cache(maxsize=None)
+def _numpy():
+    try:
+        import numpy
+    except ImportError:  # optional: the pure Python path downsamples too
+        return None
+    return numpy
+
+
+@dataclass
+class SeriesTable:
+    """
+    Chart data: x values and named y series of equal length.
+
+    `xs` are floats when every x value is numeric; otherwise they are the
+    row positions and `labels` holds the x texts. Missing y values are NaN.
+    """
+    x_label: str
+    xs: array
+    series: list  # (name, array of floats)
+    labels: list = None
+
+    def __len__(self):
+        return len(self.xs)
+
+
+def _number(text):
+    """Float of a cell such as '1,250', '$3.5', '42%'; None when it is not a number"""
+    text = text.strip().replace(",", "").lstrip("$€£").rstrip("%").strip()
+    try:
+        return float(text)
+    except ValueError:
+        return None
+
+
+def table_from_rows(headers, rows):
+    """
+    SeriesTable from a header row and rows of cell texts (Markdown table or CSV)
+
+    Numeric x values are sorted ascending, with their rows, as downsampling
+    and line charts expect; labelled x values keep their row order.
+    """
+    if len(headers) < 2:
+        raise ValueError("chart data needs an x column and at least one series column")
+    names = [name or f"Series {index}" for index, name in enumerate(headers[1:], 1)]
+    xs, labels = array("d"), None
+    columns = [array("d") for _ in names]
+    for row in rows:
+        if not row or not any(cell.strip() for cell in row):
+            continue
+        label = row[0].strip()
+        x = _number(label) if labels is None else None
+        if x is None and labels is None:
+            # A label turned up after numeric x values: every row is positioned by index
+            labels = [f"{value:.15g}" for value in xs]
+        if labels is not None:
+            labels.append(label)
+            x = len(xs)
+        xs.append(x)
+        for column, cell in zip(columns, row[1:] + [""] * (len(columns) - len(row) + 1)):
+            value = _number(cell)
+            column.append(math.nan if value is None else value)
+    if labels is not None:
+        xs = array("d", range(len(labels)))
+    elif any(later < earlier for earlier, later in zip(xs, xs[1:])):
+        order = sorted(range(len(xs)), key=xs.__getitem__)
+        xs = array("d", (xs[index] for index in order))
+        columns = [array("d", (column[index] for index in order)) for column in columns]
+    return SeriesTable(headers[0], xs, list(zip(names, columns)), labels)
+
+
+def read_csv(path):
+    """SeriesTable from a CSV file whose first row is the header, read one row at a time"""
+    with open(path, newline="", encoding="utf-8-sig") as handle:
+        reader = csv.reader(handle)
+        headers = next(reader, None)
+        if headers is None:
+            raise ValueError(f"{path}: empty CSV file")
+        return table_from_rows([header.strip() for header in headers], reader)
+
+
+def _buckets(count, threshold):
+    """(start, end) index ranges of the threshold - 2 LTTB buckets between the first and last point"""
+    every = (count - 2) / (threshold - 2)
+    edges = [int(index * every) + 1 for index in range(threshold - 1)]
+    edges[-1] = count - 1
+    return list(zip(edges, edges[1:]))
+
+
+def _lttb_python(xs, ys, threshold):
+    buckets = _buckets(len(xs), threshold)
+    selected = [0]
+    a = 0
+    for index, (start, end) in enumerate(buckets):
+        # The next bucket's average point (the last point after the final bucket)
+        next_start, next_end = buckets[index + 1] if index + 1 < len(buckets) else (len(xs) - 1, len(xs))
+        span = next_end - next_start
+        cx = sum(xs[next_start:next_end]) / span
+        cy = sum(ys[next_start:next_end]) / span
+        ax, ay = xs[a], ys[a]
+        best, best_area = start, -1.0
+        for point in range(start, end):
+            area = abs((ax - cx) * (ys[point] - ay) - (ax - xs[point]) * (cy - ay))
+            if area > best_area:
+                best, best_area = point, area
+        selected.append(best)
+        a = best
+    selected.append(len(xs) - 1)
+    return selected
+
+
+def _lttb_numpy(numpy, xs, ys, threshold):
+    x = numpy.frombuffer(xs, dtype=numpy.float64)
+    y = numpy.frombuffer(ys, dtype=numpy.float64)
+    buckets = _buckets(len(x), threshold)
+    # Every bucket's average point at once, from running sums
+    starts = numpy.array([start for start, _ in buckets[1:]] + [len(x) - 1])
+    ends = numpy.array([end for _, end in buckets[1:]] + [len(x)])
+    x_sums = numpy.concatenate(([0.0], numpy.cumsum(x)))
+    y_sums = numpy.concatenate(([0.0], numpy.cumsum(y)))
+    cxs = (x_sums[ends] - x_sums[starts]) / (ends - starts)
+    cys = (y_sums[ends] - y_sums[starts]) / (ends - starts)
+
+    selected = [0]
+    a = 0
+    for (start, end), cx, cy in zip(buckets, cxs.tolist(), cys.tolist()):
+        ax, ay = xs[a], ys[a]
+        areas = numpy.abs((ax - cx) * (y[start:end] - ay) - (ax - x[start:end]) * (cy - ay))
+        a = start + int(numpy.argmax(areas))
+        selected.append(a)
+    selected.append(len(x) - 1)
+    return selected
+
+
+def lttb(xs, ys, threshold=MAX_POINTS):
+    """
+    Indices of the `threshold` points of (xs, ys) that best preserve the
+    line's shape (Largest-Triangle-Three-Buckets), first and last included.
+    `xs` must be ascending and `ys` free of NaN; series no longer than
+    `threshold` are kept whole.
+    """
+    if threshold < 3 or len(xs) <= threshold:
+        return list(range(len(xs)))
+    numpy = _numpy() if len(xs) >= NUMPY_MIN_POINTS else None
+    if numpy is None:
+        return _lttb_python(xs, ys, threshold)
+    as_doubles = [values if isinstance(values, array) and values.typecode == "d" else array("d", values)
+                  for values in (xs, ys)]
+    return _lttb_numpy(numpy, *as_doubles, threshold)
+
+
+def _series_points(xs, ys, threshold):
+    """lttb() indices of one series, over only the rows where it has a value"""
+    if not math.isnan(sum(ys)):
+        return lttb(xs, ys, threshold)
+    present = [index for index, y in enumerate(ys) if not math.isnan(y)]
+    selected = lttb(array("d", (xs[index] for index in present)),
+                    array("d", (ys[index] for index in present)), threshold)
+    return [present[index] for index in selected]
+
+
+def downsample(table, threshold=MAX_POINTS):
+    """
+    `table` with at most about `threshold` points per series: the union of
+    every series' LTTB points, so all series keep their shape on shared x values.
+    """
+    if len(table) <= threshold:
+        return table
+    keep = sorted(set().union(*(_series_points(table.xs, ys, threshold) for _, ys in table.series)))
+    return SeriesTable(table.x_label, array("d", (table.xs[index] for index in keep)),
+                       [(name, array("d", (ys[index] for index in keep))) for name, ys in table.series],
+                       [table.labels[index] for index in keep] if table.labels is not None else None)
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Streaming reader for draw.io (mxfile) diagrams
+Reads the file with an incremental XML parser and yields one DrawioPage
+per `<diagram>` page, discarding each parsed element as soon as its cell
+is recorded, so memory is bounded by the largest page rather than the
+file. Style strings are parsed once and shared between the cells that
+repeat them.
+"""
+
+import base64
+import hashlib
+import io
+import re
+import sys
+import zlib
+from dataclasses import dataclass, field
+from functools import lru_cache
+from html import unescape
+from urllib.parse import unquote
+from xml.etree.ElementTree import XMLPullParser
+
+CHUNK_SIZE = 1 << 16
+
+# '&' that does not start a character or entity reference (hand-edited exports)
+BARE_AMPERSAND = re.compile(r"&(?!#\d+;|#x[0-9a-fA-F]+;|[A-Za-z][\w.-]*;)")
+
+
+@dataclass(frozen=True)
+class CellStyle:
+    """A parsed cell style: read-only (name, value) pairs, looked up like a dict"""
+    items: tuple = ()
+
+    def get(self, name, default=None):
+        for key, value in self.items:
+            if key == name:
+                return value
+        return default
+
+    def __contains__(self, name):
+        return any(key == name for key, _ in self.items)
+
+    def __iter__(self):
+        return (key for key, _ in self.items)
+
+
+class DrawioCell:
+    """One vertex or edge mxCell, with geometry in page units"""
+    __slots__ = ("id", "value", "style", "parent", "edge", "source", "target", "x", "y", "width", "height",
+                 "source_point", "target_point", "points")
+
+    def __init__(self, id, value, style, parent, edge=False, source=None, target=None):
+        self.id = id
+        self.value = value
+        self.style = style
+        self.parent = parent
+        self.edge = edge
+        self.source = source
+        self.target = target
+        self.x = self.y = self.width = self.height = 0.0
+        self.source_point = self.target_point = None
+        self.points = []
+
+    def __repr__(self):
+        return f"DrawioCell(id={self.id!r}, value={self.value!r}, edge={self.edge})"
+
+
+@dataclass
+class DrawioPage:
+    """One `<diagram>` page; cells are in z-order with absolute vertex positions"""
+    name: str
+    id: str
+    cells: list = field(default_factory=list)
+    digest: str = ""
+
+
+@lru_cache(maxsize=4096)
+def parse_style(style):
+    """
+    Parse 'rounded=1;fillColor=#64B5F6;text' into a CellStyle.
+
+    Bare tokens (the shape name such as 'text' or 'ellipse') map to "1";
+    a repeated name keeps its last value. Results are cached and shared,
+    so identical style strings across hundreds of cells cost one parse.
+    """
+    parsed = {}
+    for token in style.split(";"):
+        if not token:
+            continue
+        name, has_value, value = token.partition("=")
+        parsed[sys.intern(name)] = sys.intern(value) if has_value else "1"
+    return CellStyle(tuple(parsed.items()))
+
+
+def cell_text(value, style):
+    """Plain text of a cell value, converting HTML labels to lines"""
+    if not value:
+        return ""
+    if style.get("html") == "1" and "<" in value:
+        value = re.sub(r"<br\s*/?>|</div>|</p>", "\n", value, flags=re.IGNORECASE)
+        value = unescape(re.sub(r"<[^>]+>", "", value)).replace("\xa0", " ")
+    return value.strip("\n")
+
+
+def _point(element):
+    return float(element.get("x", 0)), float(element.get("y", 0))
+
+
+def _read_cell(element):
+    """Build a DrawioCell from a finished mxCell element, or None for layer/root cells"""
+    is_vertex, is_edge = element.get("vertex") == "1", element.get("edge") == "1"
+    if not (is_vertex or is_edge):
+        return None
+    cell = DrawioCell(
+        id=element.get("id"),
+        value=element.get("value", ""),
+        style=parse_style(sys.intern(element.get("style", ""))),
+        parent=element.get("parent"),
+        edge=is_edge,
+        source=element.get("source"),
+        target=element.get("target"),
+    )
+    cell.value = cell_text(cell.value, cell.style)
+    geometry = element.find("mxGeometry")
+    if geometry is not None:
+        cell.x, cell.y = float(geometry.get("x", 0)), float(geometry.get("y", 0))
+        cell.width, cell.height = float(geometry.get("width", 0)), float(geometry.get("height", 0))
+        for point in geometry.iter("mxPoint"):
+            role = point.get("as")
+            if role == "sourcePoint":
+                cell.source_point = _point(point)
+            elif role == "targetPoint":
+                cell.target_point = _point(point)
+            elif role is None:
+                cell.points.append(_point(point))
+    return cell
+
+
+def _iter_chunks(handle):
+    """Read text in chunks, escaping bare '&' that would make the XML ill-formed"""
+    pending = ""
+    while True:
+        chunk = handle.read(CHUNK_SIZE)
+        text = pending + chunk
+        if not chunk:
+            if text:
+                yield BARE_AMPERSAND.sub("&amp;", text)
+            return
+        # Hold back a trailing '&...' that the next chunk may complete
+        cut = text.rfind("&", max(0, len(text) - 16))
+        if cut < 0 or ";" in text[cut:]:
+            cut = len(text)
+        pending = text[cut:]
+        yield BARE_AMPERSAND.sub("&amp;", text[:cut])
+
+
+def _iter_events(handle):
+    """(event, element) pairs for start/end tags, parsed incrementally"""
+    parser = XMLPullParser(events=("start", "end"))
+    for chunk in _iter_chunks(handle):
+        parser.feed(chunk)
+        yield from parser.read_events()
+    parser.close()
+    yield from parser.read_events()
+
+
+def _hash_element(hasher, element):
+    hasher.update(element.tag.encode("utf-8"))
+    for name, value in sorted(element.attrib.items()):
+        hasher.update(f"\0{name}={value}".encode("utf-8"))
+    for child in element:
+        _hash_element(hasher, child)
+
+
+def _release(element, stack):
+    """Free a fully read element and detach it from its (still open) parent"""
+    element.clear()
+    if stack:
+        stack[-1].remove(element)
+
+
+def _take_cell(element, stack, page, hasher):
+    _hash_element(hasher, element)
+    cell = _read_cell(element)
+    if cell is not None:
+        page.cells.append(cell)
+    _release(element, stack)
+
+
+def _read_compressed(text, page, hasher):
+    """Read the cells of a compressed page body (base64, raw deflate, URL-encoded XML)"""
+    data = unquote(zlib.decompress(base64.b64decode(text), -zlib.MAX_WBITS).decode("utf-8"))
+    stack = []
+    for event, element in _iter_events(io.StringIO(data)):
+        if event == "start":
+            stack.append(element)
+            continue
+        stack.pop()
+        if element.tag == "mxCell":
+            _take_cell(element, stack, page, hasher)
+
+
+def _make_absolute(cells):
+    """Resolve positions nested in groups/containers to page coordinates"""
+    by_id = {cell.id: cell for cell in cells}
+    resolved = set()
+
+    def resolve(cell):
+        if cell.id in resolved:
+            return
+        resolved.add(cell.id)
+        parent = by_id.get(cell.parent)
+        if parent is None or parent.edge:
+            return
+        resolve(parent)
+        dx, dy = parent.x, parent.y
+        if not cell.edge:
+            cell.x, cell.y = cell.x + dx, cell.y + dy
+            return
+        cell.points = [(x + dx, y + dy) for x, y in cell.points]
+        if cell.source_point:
+            cell.source_point = (cell.source_point[0] + dx, cell.source_point[1] + dy)
+        if cell.target_point:
+            cell.target_point = (cell.target_point[0] + dx, cell.target_point[1] + dy)
+
+    for cell in cells:
+        resolve(cell)
+
+
+def iter_drawio_pages(path):
+    """
+    Yield a DrawioPage per `<diagram>` in a .drawio / mxfile document.
+
+    Pages are parsed incrementally; only the page being built is held in
+    memory. Compressed page bodies are inflated one page at a time.
+    """
+    page = hasher = None
+    stack = []
+    with open(path, encoding="utf-8") as handle:
+        for event, element in _iter_events(handle):
+            if event == "start":
+                stack.append(element)
+                if element.tag == "diagram":
+                    page = DrawioPage(element.get("name", ""), element.get("id", ""))
+                    hasher = hashlib.sha256(page.name.encode("utf-8"))
+                continue
+
+            stack.pop()
+            if page is None:
+                continue
+            if element.tag == "mxCell":
+                _take_cell(element, stack, page, hasher)
+            elif element.tag == "diagram":
+                if not page.cells and element.text and element.text.strip():
+                    _read_compressed(element.text.strip(), page, hasher)
+                _make_absolute(page.cells)
+                page.digest = hasher.hexdigest()
+                yield page
+                page = None
+                _release(element, stack)
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Column and grid geometry for multi-item slides
+Two-column slides split their items where the estimated column heights
+balance, and big-number slides place any number of metrics on the grid
+that lets them be largest while staying inside the content area.
+Splits for many slides are computed as one batch (vectorized when numpy
+is installed, plain Python otherwise); grids depend only on the metric
+count and are computed once per count.
+"""
+
+import math
+from functools import lru_cache
+
+NUMPY_MIN_BATCH = 64  # below this, array setup costs more than it saves
+MIN_METRIC_SCALE = 0.05  # floor for metric blocks once cells get narrower than the gap
+
+
+@lru_cache(maxsize=None)
+def _numpy():
+    try:
+        import numpy
+    except ImportError:  # optional: the pure Python path gives the same answers
+        return None
+    return numpy
+
+
+def balanced_split(heights):
+    """
+    Index k splitting `heights` into columns [:k] and [k:] with the shortest
+    taller column; ties go to the smaller k (a shorter left column).
+    """
+    total = sum(heights)
+    best, best_index, prefix = total, 0, 0.0
+    for index, height in enumerate(heights, 1):
+        prefix += height
+        cost = max(prefix, total - prefix)
+        if cost < best:
+            best, best_index = cost, index
+    return best_index
+
+
+def balanced_splits(height_lists):
+    """balanced_split() for every list in `height_lists`, computed as one batch"""
+    numpy = _numpy() if len(height_lists) >= NUMPY_MIN_BATCH else None
+    if numpy is None:
+        return [balanced_split(heights) for heights in height_lists]
+
+    # One row per slide, padded with zero heights; padding splits cost more than any real one
+    width = max(len(heights) for heights in height_lists) + 1
+    prefix = numpy.zeros((len(height_lists), width))
+    lengths = numpy.array([len(heights) for heights in height_lists])
+    for row, heights in enumerate(height_lists):
+        prefix[row, 1:len(heights) + 1] = heights
+    prefix = numpy.cumsum(prefix, axis=1)
+    totals = prefix[numpy.arange(len(height_lists)), lengths]
+    cost = numpy.maximum(prefix, totals[:, None] - prefix)
+    cost[numpy.arange(width)[None, :] > lengths[:, None]] = numpy.inf
+    return numpy.argmin(cost, axis=1).tolist()
+
+
+@lru_cache(maxsize=256)
+def metric_grid(count, area, block, gap):
+    """
+    Place `count` metric blocks in `area`; returns (scale, positions).
+
+    `area` is (left, top, width, height) and `block` the (width, height)
+    of one metric at full size, in any one unit. Every column count is
+    tried and the one allowing the largest blocks wins (on a tie, the most
+    nearly square grid, then the wider one); blocks never grow past full
+    size, and never shrink below MIN_METRIC_SCALE. Once there are so many
+    that a cell is smaller than `gap`, the blocks overlap rather than get a
+    zero or negative size. `positions` are the top-left corners of the
+    scaled blocks, each centered in its cell, with a short last row
+    centered in the area.
+    """
+    if count <= 0:
+        return 1.0, ()
+    left, top, width, height = area
+    block_width, block_height = block
+
+    def scale_for(cols):
+        rows = math.ceil(count / cols)
+        return min(1.0, (width / cols - gap) / block_width, (height / rows - gap) / block_height)
+
+    cols = max(range(1, count + 1),
+               key=lambda cols: (scale_for(cols), -abs(cols - math.ceil(count / cols)), cols))
+    scale = max(MIN_METRIC_SCALE, scale_for(cols))
+    rows = math.ceil(count / cols)
+    cell_width, cell_height = width / cols, height / rows
+    scaled_width, scaled_height = block_width * scale, block_height * scale
+
+    positions = []
+    for index in range(count):
+        row, col = divmod(index, cols)
+        in_row = min(cols, count - row * cols)
+        row_left = left + (width - in_row * cell_width) / 2
+        positions.append((round(row_left + col * cell_width + (cell_width - scaled_width) / 2),
+                          round(top + row * cell_height + (cell_height - scaled_height) / 2)))
+    return scale, tuple(positions)
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Build several decks from a declarative JSON manifest
+Usage: python deck_manifest.py decks.json -j 4
+
+A manifest lists output decks and, in order, the source slides each one
+pulls in:
+
+    {"decks": [
+        {"output": "Proposal.pptx", "theme": "emerald", "template": "deck-template.pptx", "slides": [
+            {"deck": "pitch-deck.md", "only": [1]},
+            {"document": "production-grade-proposal.md", "only": ["Executive Summary", "3-5"]},
+            {"mermaid": "architecture-diagram.md"},
+            {"drawio": "architecture-diagrams.drawio", "only": ["System Architecture"]},
+            {"results": "nightly-junit.xml"}
+        ]}
+    ]}
+
+`deck` sources are slide decks (`## Slide N:` sections), `document`
+sources are prose split into one slide per `## ` section, `mermaid` /
+`drawio` sources give one diagram slide per flowchart or page, and
+`results` sources (JUnit XML / JSON) give test result summary slides.
+`only` picks slides by number, "first-last" range or name (a slide's
+title or its section name); an entry that picks no slide is an error.
+The optional `template` is a master .pptx the deck is built on (see
+deck_template).
+Paths are relative to the manifest.
+
+Every source is parsed once, however many decks use it, and each deck is
+rendered on a process pool as soon as its own sources are parsed.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from deck_batch import print_summary
+from deck_styles import DEFAULT_THEME, THEMES
+
+SOURCE_KINDS = ("deck", "document", "mermaid", "drawio", "results")
+RANGE = re.compile(r"^(\d+)-(\d+)$")
+
+
+class ManifestError(ValueError):
+    """A manifest that does not describe a buildable set of decks"""
+
+
+def load_manifest(path):
+    """
+    Read and validate a manifest; returns a list of deck dicts.
+
+    Each deck has `output`, `theme`, `template` (or None) and `slides`, a list of
+    (kind, source path, only) entries with paths made absolute.
+    """
+    base_dir = os.path.dirname(os.path.abspath(path))
+    with open(path, encoding="utf-8") as handle:
+        try:
+            document = json.load(handle)
+        except json.JSONDecodeError as e:
+            raise ManifestError(f"{path}: {e}") from None
+
+    decks = document.get("decks") if isinstance(document, dict) else None
+    if not isinstance(decks, list) or not decks:
+        raise ManifestError(f"{path}: expected a non-empty \"decks\" list")
+    outputs = set()
+    loaded = []
+    for index, deck in enumerate(decks):
+        where = f"decks[{index}]"
+        if not isinstance(deck, dict) or not isinstance(deck.get("output"), str):
+            raise ManifestError(f"{where}: every deck needs an \"output\" path")
+        output = os.path.join(base_dir, deck["output"])
+        if output in outputs:
+            raise ManifestError(f"{where}: output {deck['output']} is built twice")
+        outputs.add(output)
+        theme = deck.get("theme", DEFAULT_THEME)
+        if theme not in THEMES:
+            raise ManifestError(f"{where}: unknown theme {theme} (choose from {', '.join(THEMES)})")
+        template = deck.get("template")
+        if template is not None:
+            template = os.path.join(base_dir, template)
+            if not os.path.isfile(template):
+                raise ManifestError(f"{where}: template not found: {deck['template']}")
+        if not isinstance(deck.get("slides"), list) or not deck["slides"]:
+            raise ManifestError(f"{where}: expected a non-empty \"slides\" list")
+
+        entries = []
+        for position, entry in enumerate(deck["slides"]):
+            kinds = [kind for kind in SOURCE_KINDS if kind in entry] if isinstance(entry, dict) else []
+            if len(kinds) != 1:
+                raise ManifestError(f"{where}.slides[{position}]: name exactly one of {', '.join(SOURCE_KINDS)}")
+            source = os.path.join(base_dir, entry[kinds[0]])
+            if not os.path.isfile(source):
+                raise ManifestError(f"{where}.slides[{position}]: source not found: {entry[kinds[0]]}")
+            only = entry.get("only")
+            if only is not None and not isinstance(only, list):
+                raise ManifestError(f"{where}.slides[{position}]: \"only\" must be a list")
+            entries.append((kinds[0], source, only))
+        loaded.append({"output": output, "theme": theme, "template": template, "slides": entries})
+    return loaded
+
+
+def parse_source(kind, path):
+    """Parse one source into its full list of SlideSpecs"""
+    from deck_markdown import iter_section_specs, iter_slide_specs
+    if kind == "deck":
+        return list(iter_slide_specs(path))
+    if kind == "document":
+        return list(iter_section_specs(path))
+    if kind == "results":
+        from deck_results import result_specs, summarize
+        return result_specs(summarize([path]))
+    import deck_render
+    if kind == "mermaid":
+        return list(deck_render.iter_mermaid_specs(path))
+    return list(deck_render.iter_drawio_specs(path))
+
+
+def _matches(spec, item):
+    """True when the `only` entry `item` picks `spec`"""
+    if isinstance(item, int):
+        return spec.number == item
+    match = RANGE.match(item) if isinstance(item, str) else None
+    if match:
+        return int(match.group(1)) <= spec.number <= int(match.group(2))
+    name = str(item).casefold()
+    return name in (spec.title.casefold(), spec.section.casefold())
+
+
+def select(specs, only, source=""):
+    """
+    The specs picked by an `only` list, in source order.
+
+    Entries are slide numbers, "first-last" ranges, or names matched against
+    a slide's title or its section name (`## Slide 19: Investment Ask`).
+    An entry that picks no slide raises ManifestError.
+    """
+    if only is None:
+        return list(specs)
+    for item in only:
+        if not any(_matches(spec, item) for spec in specs):
+            raise ManifestError(f"{os.path.basename(source) or 'source'}: \"only\" entry {item!r} matches no slide")
+    return [spec for spec in specs if any(_matches(spec, item) for item in only)]
+
+
+def render_deck(output, specs, theme, backend=None, template=None):
+    """Render one deck in a worker; returns (name, output, slides, seconds, error)"""
+    started = time.perf_counter()
+    try:
+        import deck_render
+        import deck_styles
+        deck_styles.use_theme(theme)  # workers are reused across decks
+        slides = deck_render.write_presentation(specs, output, backend or deck_render.DEFAULT_BACKEND,
+                                                template=template)
+        error = None
+    except Exception as e:
+        slides, error = 0, f"{type(e).__name__}: {e}"
+    return output, output, slides, time.perf_counter() - started, error
+
+
+async def build_decks(decks, workers=None, backend=None):
+    """
+    Parse every distinct source once and render each deck as soon as its
+    sources are ready; returns render_deck() results in manifest order.
+    """
+    loop = asyncio.get_running_loop()
+    with ThreadPoolExecutor() as parse_pool, ProcessPoolExecutor(max_workers=workers) as render_pool:
+        parsed = {}
+        for deck in decks:
+            os.makedirs(os.path.dirname(deck["output"]), exist_ok=True)
+            for kind, source, _ in deck["slides"]:
+                if (kind, source) not in parsed:
+                    parsed[kind, source] = loop.run_in_executor(parse_pool, parse_source, kind, source)
+
+        async def build(deck):
+            specs = []
+            try:
+                for kind, source, only in deck["slides"]:
+                    specs.extend(select(await parsed[kind, source], only, source))
+            except Exception as e:
+                return deck["output"], deck["output"], 0, 0.0, f"{type(e).__name__}: {e}"
+            return await loop.run_in_executor(render_pool, render_deck, deck["output"], specs,
+                                              deck["theme"], backend, deck["template"])
+
+        return await asyncio.gather(*(build(deck) for deck in decks))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the decks listed in a JSON manifest")
+    parser.add_argument("manifest", nargs="?", default="decks.json", help="manifest path (default: decks.json)")
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count(), help="render processes")
+    parser.add_argument("--backend", choices=("lxml", "proxy"),
+                        help="lxml fragment cloning (default) or the python-pptx proxy setters")
+    args = parser.parse_args(argv)
+
+    try:
+        decks = load_manifest(args.manifest)
+    except (OSError, ManifestError) as e:
+        print(f"❌ {e}")
+        return 1
+
+    started = time.perf_counter()
+    results = asyncio.run(build_decks(decks, args.workers, args.backend))
+    print_summary(results, time.perf_counter() - started)
+    return 1 if any(result[4] for result in results) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
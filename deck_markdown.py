@@ -0,0 +1,505 @@
+#!/usr/bin/env python3
+"""
+Streaming Markdown parser for the pitch deck
+Splits pitch-deck.md on its `---` / `## Slide N:` boundaries and yields one
+SlideSpec at a time, so memory stays proportional to a single slide section.
+
+Slide kinds are inferred (each table makes a table slide, with the rest of
+the section on content slides around it; a heading plus subtitle with no
+body makes a title/closing slide) and can be forced per section with
+`<!-- slide: big_number -->` or `<!-- layout: two_column -->`. Big-number
+slides read their metrics from `- **value** label` bullets; `![alt](path)`
+lines place pictures on a content slide (paths relative to the deck).
+`<!-- chart: line -->` (or column, bar, area, scatter) makes a native chart
+of the slide's table, or of a CSV file named by `<!-- data: path.csv -->`.
+Prose documents without slide headings (the proposal, the framework
+overview) can be sliced into one slide per `## ` section instead.
+"""
+
+import hashlib
+import os
+import re
+from dataclasses import dataclass, field
+
+DEFAULT_SOURCE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pitch-deck.md")
+DEFAULT_MERMAID_SOURCE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "architecture-diagram.md")
+DEFAULT_DRAWIO_SOURCE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "architecture-diagrams.drawio")
+
+# Slide boundaries and per-slide directives, e.g. <!-- layout: two_column -->
+SLIDE_HEADING = re.compile(r"^##\s+Slide\s+(\d+)\s*:\s*(.*?)\s*$")
+DIRECTIVE = re.compile(r"^<!--\s*(slide|layout|chart)\s*:\s*([\w-]+)\s*-->$")
+DATA_DIRECTIVE = re.compile(r"^<!--\s*data\s*:\s*(\S+)\s*-->$")
+SEPARATOR = re.compile(r"^-{3,}\s*$")
+HEADING = re.compile(r"^(#{1,6})\s+(.*?)\s*#*\s*$")
+BULLET = re.compile(r"^(\s*)[-*+]\s+(.*)$")
+NUMBERED = re.compile(r"^(\s*)(\d+)[.)]\s+(.*)$")
+METRIC = re.compile(r"^\*\*(.+?)\*\*\s*[:\-–—]?\s*(.+)$")
+TABLE_RULE = re.compile(r"^\|?\s*:?-{2,}:?\s*(\|\s*:?-{2,}:?\s*)*\|?\s*$")
+TREE_BRANCH = re.compile(r"^[├└]──\s*")
+BOX_CHARS = re.compile(r"[┌┐└┘├┤┬┴┼─│]+")
+IMAGE = re.compile(r'^!\[([^\]]*)\]\(\s*<?([^)\s>]+)>?(?:\s+"[^"]*")?\s*\)$')
+
+SLIDE_KINDS = ("title", "content", "table", "big_number", "chart", "closing")
+CHART_TYPES = ("line", "column", "bar", "area", "scatter")
+LAYOUT_TYPES = ("bullet", "two_column")
+
+
+@dataclass
+class SlideSpec:
+    """One parsed slide, ready to hand to an add_*_slide helper"""
+    number: int
+    kind: str
+    title: str
+    subtitle: str = ""
+    tagline: str = ""
+    items: list = field(default_factory=list)
+    layout_type: str = "bullet"
+    headers: list = field(default_factory=list)
+    rows: list = field(default_factory=list)
+    numbers: list = field(default_factory=list)
+    digest: str = ""  # hash of the raw section, for incremental rebuilds
+    warnings: list = field(default_factory=list)  # problems noticed while parsing
+    source: str = ""  # file a diagram slide is read from
+    images: list = field(default_factory=list)  # (alt text, absolute path) pictures
+    chart: str = ""  # chart type of a chart slide; its data is headers/rows or the `source` CSV
+    part: int = 0  # index among the specs one section produced (a section may hold several tables)
+    section: str = ""  # name of the section the spec came from (`## Slide N: name` / `## name`)
+
+
+def clean_inline(text):
+    """Strip inline Markdown (emphasis, code, links, hard breaks) from text"""
+    text = re.sub(r"<br\s*/?>", " ", text)
+    text = re.sub(r"!?\[([^\]]*)\]\([^)]*\)", r"\1", text)
+    text = re.sub(r"\*\*(.+?)\*\*", r"\1", text)
+    text = re.sub(r"__(.+?)__", r"\1", text)
+    text = re.sub(r"(?<![\w*])\*(?!\s)(.+?)(?<!\s)\*(?![\w*])", r"\1", text)
+    text = re.sub(r"`([^`]*)`", r"\1", text)
+    return text.strip()
+
+
+def _split_row(line):
+    """Split a Markdown table row into cleaned cell texts"""
+    cells = line.strip().strip("|").split("|")
+    return [clean_inline(cell) for cell in cells]
+
+
+class _SlideBuilder:
+    """Accumulates the lines of a single slide section"""
+
+    def __init__(self, number, heading, first, base_dir=""):
+        self.number = number
+        self.base_dir = base_dir
+        self.heading = clean_inline(heading)
+        self.first = first
+        self.title = ""
+        self.subtitle = ""
+        self.italics = []
+        self.items = []
+        self.numbers = []
+        self.headers = []  # the first table; the one a chart slide plots
+        self.rows = []
+        self.tables = []  # (caption, headers, rows, index into items where the table sits)
+        self.heading_at = None  # index of the last sub-heading in items
+        self.images = []
+        self.chart = ""
+        self.data_path = ""
+        self.kind = None
+        self.layout_type = "bullet"
+        self.in_code = False
+        self.in_table = False
+        self.under_heading = False
+        self.has_body = False
+        self.warnings = []
+        self.hasher = hashlib.sha256(self.heading.encode("utf-8"))
+
+    def feed(self, line):
+        """Consume one raw line of the section"""
+        self.hasher.update(line.encode("utf-8") + b"\n")
+        stripped = line.strip()
+
+        if stripped.startswith("```"):
+            self.in_code = not self.in_code
+            return
+        if self.in_code:
+            self._add_code_line(line)
+            return
+
+        if stripped.startswith("|"):
+            self._add_table_line(stripped)
+            return
+        self.in_table = False
+
+        if not stripped:
+            return
+
+        directive = DIRECTIVE.match(stripped)
+        if directive:
+            name, value = directive.groups()
+            if name == "slide" and value in SLIDE_KINDS:
+                self.kind = value
+            elif name == "layout" and value in LAYOUT_TYPES:
+                self.layout_type = value
+            elif name == "chart" and value in CHART_TYPES:
+                self.kind, self.chart = "chart", value
+            else:
+                self.warnings.append(f"unknown {name} directive '{value}'")
+            return
+
+        data = DATA_DIRECTIVE.match(stripped)
+        if data:
+            self.data_path = os.path.normpath(os.path.join(self.base_dir, data.group(1)))
+            self.kind = self.kind or "chart"
+            return
+
+        image = IMAGE.match(stripped)
+        if image:
+            self._add_image(*image.groups())
+            return
+
+        heading = HEADING.match(stripped)
+        if heading:
+            level, text = len(heading.group(1)), clean_inline(heading.group(2))
+            if level == 1 and not self.title:
+                self.title = text
+            elif level == 2 and self.title and not self.subtitle and not self.items:
+                self.subtitle = text
+            else:
+                self._add_heading(text)
+            return
+
+        bullet = BULLET.match(line)
+        if bullet:
+            indent, text = bullet.groups()
+            metric = METRIC.match(text.strip())
+            if metric:
+                self.numbers.append((clean_inline(metric.group(1)), clean_inline(metric.group(2))))
+            self._add_bullet(clean_inline(text), len(indent.expandtabs(4)) // 2)
+            return
+
+        numbered = NUMBERED.match(line)
+        if numbered:
+            indent, num, text = numbered.groups()
+            self.has_body = True
+            self.items.append(f"{num}. {clean_inline(text)}")
+            return
+
+        if stripped.startswith(">"):
+            text = clean_inline(stripped.lstrip("> ").strip())
+            if text:
+                self.items.append(text)
+            return
+
+        # Bold-only paragraphs act as sub-headings ("**Policy Management**")
+        if re.fullmatch(r"\*\*[^*]+\*\*:?", stripped):
+            self._add_heading(clean_inline(stripped))
+            return
+
+        text = clean_inline(stripped)
+        if re.fullmatch(r"\*[^*]+\*", stripped) or re.fullmatch(r"_[^_]+_", stripped):
+            self.italics.append(text.strip("_"))
+        self.items.append(text)
+
+    def _add_heading(self, text):
+        if self.items:
+            self.items.append("")
+        if ":" not in text and not text.endswith(("?", "!", ".", ")")):
+            text += ":"
+        self.heading_at = len(self.items)
+        self.items.append(text)
+        self.under_heading = True
+
+    def _add_bullet(self, text, depth):
+        self.has_body = True
+        if depth > 0:
+            self.items.append("    – " + text)
+        elif self.under_heading:
+            self.items.append("  • " + text)
+        else:
+            self.items.append(text)
+
+    def _add_image(self, alt, path):
+        if "://" in path:
+            self.warnings.append(f"remote image '{path}' is not supported")
+            return
+        self.has_body = True
+        self.images.append((clean_inline(alt), os.path.normpath(os.path.join(self.base_dir, path))))
+
+    def _add_code_line(self, line):
+        text = line.rstrip()
+        branch = TREE_BRANCH.match(text.strip())
+        text = BOX_CHARS.sub(" ", text)
+        text = " ".join(text.split())
+        if not text:
+            return
+        self.has_body = True
+        self.items.append("  • " + TREE_BRANCH.sub("", text) if branch else text)
+
+    def _add_table_line(self, stripped):
+        if TABLE_RULE.match(stripped):
+            return
+        if not self.in_table:
+            self.in_table = True
+            caption = ""
+            # A sub-heading right above the table is its caption, not slide content
+            if self.heading_at is not None and self.heading_at == len(self.items) - 1:
+                caption = self.items.pop().rstrip(":")
+                if self.items and not self.items[-1]:
+                    self.items.pop()
+            self.heading_at = None
+            self.tables.append((caption, _split_row(stripped), [], len(self.items)))
+            if len(self.tables) == 1:
+                self.headers, self.rows = self.tables[0][1], self.tables[0][2]
+            return
+        headers, rows = self.tables[-1][1], self.tables[-1][2]
+        row = _split_row(stripped)
+        if len(row) != len(headers):
+            self.warnings.append(f"table row has {len(row)} cells, header has {len(headers)}")
+        rows.append(row)
+
+    def build(self):
+        """
+        Resolve the slide kind and return the section's SlideSpecs.
+
+        A section is one slide, except when its kind is inferred from its
+        tables: then each table becomes a table slide and the content
+        between them a content slide, in document order.
+        """
+        title = self.title or self.heading
+        kind = self.kind
+        if kind is None:
+            if self.tables:
+                kind = "table"
+            elif self.subtitle and not self.has_body:
+                kind = "title" if self.first else "closing"
+            else:
+                kind = "content"
+
+        if self.in_code:
+            self.warnings.append("unterminated code fence")
+        if kind == "table":
+            return self._build_tables(title)
+        if len(self.tables) > (1 if kind == "chart" else 0):
+            self.warnings.append(f"{len(self.tables)} table(s) are not shown on a {kind} slide")
+        if kind == "big_number":
+            dropped = sum(1 for item in self.items if item.strip()) - len(self.numbers)
+            if dropped:
+                self.warnings.append(f"{dropped} item(s) are not shown on a big_number slide")
+        if self.images and kind != "content":
+            self.warnings.append(f"images are only placed on content slides, not {kind}")
+        spec = SlideSpec(number=self.number, kind=kind, title=title, digest=self.hasher.hexdigest(),
+                         warnings=self.warnings, section=self.heading)
+        if kind in ("title", "closing"):
+            spec.subtitle = self.subtitle or (self.items[0] if self.items else "")
+            spec.tagline = self.italics[0] if self.italics else ""
+        elif kind == "big_number":
+            spec.numbers = self.numbers
+        elif kind == "chart":
+            spec.chart = self.chart or "line"
+            spec.source = self.data_path
+            if not self.data_path:
+                spec.headers, spec.rows = self.headers, self.rows
+        else:
+            spec.items = self._content(([self.subtitle, ""] if self.subtitle else []) + self.items)
+            spec.layout_type = self.layout_type
+            spec.images = self.images
+        return [spec]
+
+    @staticmethod
+    def _content(items):
+        start, end = 0, len(items)
+        while start < end and not items[start]:
+            start += 1
+        while end > start and not items[end - 1]:
+            end -= 1
+        return items[start:end]
+
+    def _build_tables(self, title):
+        """A table slide per table, and a content slide for each run of content around them"""
+        digest = self.hasher.hexdigest()
+        pieces = []  # ("content", items) and ("table", (caption, headers, rows)) in document order
+        start = 0
+        for caption, headers, rows, at in self.tables:
+            items = self._content(self.items[start:at])
+            if items:
+                pieces.append(("content", items))
+            pieces.append(("table", (caption, headers, rows)))
+            start = at
+        items = self._content(self.items[start:])
+        if items:
+            pieces.append(("content", items))
+        if self.subtitle:
+            first = next((index for index, (kind, _) in enumerate(pieces) if kind == "content"), None)
+            if first is None:
+                pieces.insert(0, ("content", [self.subtitle]))
+            else:
+                pieces[first] = ("content", [self.subtitle, ""] + pieces[first][1])
+        if self.images and not any(kind == "content" for kind, _ in pieces):
+            self.warnings.append("images are only placed on content slides, not table")
+
+        specs = []
+        images = self.images
+        for part, (kind, value) in enumerate(pieces):
+            spec = SlideSpec(number=self.number, kind=kind, title=title, part=part, section=self.heading,
+                             digest=digest if part == 0 else hashlib.sha256(f"{digest}:{part}".encode()).hexdigest(),
+                             warnings=self.warnings if part == 0 else [])
+            if kind == "content":
+                spec.items, spec.layout_type, spec.images = value, self.layout_type, images
+                images = []
+            else:
+                caption, headers, rows = value
+                if caption and len(self.tables) > 1:
+                    spec.title = f"{title} — {caption}"
+                width = len(headers)
+                spec.headers = headers
+                spec.rows = [(row + [""] * width)[:width] for row in rows]
+            specs.append(spec)
+        return specs
+
+
+def iter_slide_specs(lines):
+    """
+    Yield a SlideSpec per `## Slide N:` section, reading lines lazily.
+
+    `lines` may be a path or any iterable of lines (an open file, a
+    generator). Content before the first slide heading and any top-level
+    section that follows a `---` outside a slide (appendix, notes) is skipped.
+    Image paths are resolved against the file's directory (or the current
+    directory for other iterables).
+    """
+    if isinstance(lines, str):
+        with open(lines, encoding="utf-8") as handle:
+            yield from iter_slide_specs(handle)
+        return
+
+    name = getattr(lines, "name", None)
+    base_dir = os.path.dirname(os.path.abspath(name)) if isinstance(name, str) else os.getcwd()
+    builder = None
+    seen = 0
+    after_separator = False
+    in_code = False
+
+    for raw in lines:
+        line = raw.rstrip("\n").rstrip("\r")
+        stripped = line.strip()
+
+        if builder is not None and (in_code or stripped.startswith("```")):
+            if stripped.startswith("```"):
+                in_code = not in_code
+            builder.feed(line)
+            continue
+
+        slide = SLIDE_HEADING.match(stripped)
+        if slide:
+            if builder is not None:
+                yield from builder.build()
+            builder = _SlideBuilder(int(slide.group(1)), slide.group(2), first=seen == 0, base_dir=base_dir)
+            seen += 1
+            after_separator = False
+            continue
+
+        if SEPARATOR.match(stripped):
+            after_separator = True
+            continue
+
+        if after_separator and stripped:
+            after_separator = False
+            # A new top-level section after `---` ends the current slide
+            heading = HEADING.match(stripped)
+            if heading and len(heading.group(1)) <= 2 and builder is not None:
+                yield from builder.build()
+                builder = None
+                continue
+
+        if builder is not None:
+            builder.feed(line)
+
+    if builder is not None:
+        yield from builder.build()
+
+
+def is_slide_deck(path):
+    """True when `path` has `## Slide N:` sections; otherwise it is a prose document for iter_section_specs()"""
+    with open(path, encoding="utf-8") as handle:
+        return any(SLIDE_HEADING.match(line.strip()) for line in handle)
+
+
+def iter_section_specs(lines):
+    """
+    Yield a SlideSpec per `## ` section of a prose document, numbered from 1.
+
+    Each section is parsed like a slide whose heading is the section title,
+    so sub-headings, bullets, tables and code blocks become slide content.
+    The document's `# ` title and anything before the first section are
+    skipped.
+    """
+    if isinstance(lines, str):
+        with open(lines, encoding="utf-8") as handle:
+            yield from iter_section_specs(handle)
+        return
+
+    name = getattr(lines, "name", None)
+    base_dir = os.path.dirname(os.path.abspath(name)) if isinstance(name, str) else os.getcwd()
+    builder = None
+    seen = 0
+    in_code = False
+    for raw in lines:
+        line = raw.rstrip("\n").rstrip("\r")
+        stripped = line.strip()
+        if stripped.startswith("```"):
+            in_code = not in_code
+        elif not in_code:
+            heading = HEADING.match(stripped)
+            if heading and len(heading.group(1)) <= 2:
+                if builder is not None:
+                    yield from builder.build()
+                builder = None
+                if len(heading.group(1)) == 2:
+                    seen += 1
+                    builder = _SlideBuilder(seen, heading.group(2), first=False, base_dir=base_dir)
+                continue
+            if SEPARATOR.match(stripped):
+                continue
+        if builder is not None:
+            builder.feed(line)
+    if builder is not None:
+        yield from builder.build()
+
+
+def check_deck(lines):
+    """
+    Parse a deck without rendering it and return its problems as strings.
+
+    Covers parse warnings, slide numbering and slides that would render
+    empty. An empty list means the deck is ready to convert.
+    """
+    problems = []
+    expected = 1
+    numbers = set()
+    for spec in iter_slide_specs(lines):
+        where = f"Slide {spec.number}"
+        if not spec.part:  # further slides of a section share its number
+            if spec.number in numbers:
+                problems.append(f"{where}: duplicate slide number")
+            elif spec.number != expected:
+                problems.append(f"{where}: expected slide {expected}")
+            numbers.add(spec.number)
+            expected = spec.number + 1
+
+        problems.extend(f"{where}: {warning}" for warning in spec.warnings)
+        if not spec.title:
+            problems.append(f"{where}: missing title")
+        if spec.kind == "big_number" and not spec.numbers:
+            problems.append(f"{where}: big_number slide has no `- **value** label` bullets")
+        elif spec.kind == "content" and not spec.items and not spec.images:
+            problems.append(f"{where}: content slide has no content")
+        elif spec.kind == "table" and not spec.rows:
+            problems.append(f"{where}: table has no rows")
+        elif spec.kind == "chart" and spec.source and not os.path.isfile(spec.source):
+            problems.append(f"{where}: chart data not found: {spec.source}")
+        elif spec.kind == "chart" and not spec.source and not spec.rows:
+            problems.append(f"{where}: chart has no table or `<!-- data: path.csv -->` to plot")
+        problems.extend(f"{where}: image not found: {path}" for _, path in spec.images
+                        if not os.path.isfile(path))
+    if not numbers:
+        problems.append("no `## Slide N:` sections found")
+    return problems
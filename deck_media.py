@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Content-addressed pictures for deck slides
+Images are identified by the SHA-256 of their bytes. A picture larger than
+its slide box needs at PICTURE_DPI is scaled down and recompressed once;
+the result is kept in an on-disk cache keyed by (content hash, pixel
+size), so later builds - of this deck or of any variant that shows the
+same logos and screenshots - reuse it without decoding the image again.
+Pillow (already a python-pptx dependency) is imported on first use.
+"""
+
+import hashlib
+import io
+import os
+import uuid
+from dataclasses import dataclass
+from functools import lru_cache
+
+MEDIA_CACHE_DIR = ".media-cache"
+PICTURE_DPI = 150  # pixels per inch kept for embedded pictures
+EMU_PER_INCH = 914400
+RESIZE_THRESHOLD = 1.1  # only downscale images at least this much larger than needed
+JPEG_QUALITY = 85
+
+# Pillow formats python-pptx embeds as-is, and their part extensions
+EMBEDDABLE = {"PNG": "png", "JPEG": "jpg", "GIF": "gif", "BMP": "bmp", "TIFF": "tiff"}
+
+
+@dataclass(frozen=True)
+class Picture:
+    """Image bytes ready to embed, with their pixel size"""
+    digest: str  # SHA-256 of the source file
+    blob: bytes
+    ext: str
+    width: int
+    height: int
+
+
+@lru_cache(maxsize=1024)
+def _file_digest(path, mtime_ns, size):
+    hasher = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def file_digest(path):
+    """SHA-256 of a file's bytes, remembered until the file's mtime or size changes"""
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    return _file_digest(path, stat.st_mtime_ns, stat.st_size)
+
+
+def default_cache_dir(path):
+    """Variant cache for an image: `.media-cache` in the image's own directory"""
+    return os.path.join(os.path.dirname(os.path.abspath(path)), MEDIA_CACHE_DIR)
+
+
+class MediaCache:
+    """Directory of resized image variants, one file per (content hash, pixel size)"""
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, digest, size, ext):
+        return os.path.join(self.directory, f"{digest}-{size[0]}x{size[1]}.{ext}")
+
+    def get(self, digest, size, ext):
+        """Cached variant bytes, or None"""
+        try:
+            with open(self._path(digest, size, ext), "rb") as handle:
+                blob = handle.read()
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return blob
+
+    def put(self, digest, size, ext, blob):
+        """Store a variant atomically, so concurrent builds never read a partial file"""
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(digest, size, ext)
+        tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        with open(tmp_path, "wb") as handle:
+            handle.write(blob)
+        os.replace(tmp_path, path)
+
+
+def target_size(size, cx, cy):
+    """Pixel size for an image of `size` shown in a cx x cy EMU box, or `size` if close enough"""
+    width, height = size
+    needed = min(cx * PICTURE_DPI / EMU_PER_INCH / width, cy * PICTURE_DPI / EMU_PER_INCH / height)
+    if needed * RESIZE_THRESHOLD >= 1:
+        return size
+    return max(1, round(width * needed)), max(1, round(height * needed))
+
+
+def _encode(image, ext):
+    buffer = io.BytesIO()
+    if ext == "jpg":
+        if image.mode not in ("RGB", "L"):
+            image = image.convert("RGB")
+        image.save(buffer, "JPEG", quality=JPEG_QUALITY, optimize=True)
+    else:
+        image.save(buffer, "PNG", optimize=True)
+    return buffer.getvalue()
+
+
+def _load_picture(path, cx, cy, cache):
+    from PIL import Image
+
+    digest = file_digest(path)
+    with Image.open(path) as image:
+        ext = EMBEDDABLE.get(image.format)
+        size = target_size(image.size, cx, cy)
+        if ext is not None and size == image.size:
+            with open(path, "rb") as handle:
+                return Picture(digest, handle.read(), ext, *size)
+
+        # Scaled or converted variant: JPEG stays JPEG, anything else becomes PNG
+        ext = "jpg" if ext == "jpg" else "png"
+        cache = cache or MediaCache(default_cache_dir(path))
+        blob = cache.get(digest, size, ext)
+        if blob is None:
+            image.draft(None, size)  # let JPEG decode at a reduced scale
+            blob = _encode(image.resize(size, Image.LANCZOS), ext)
+            cache.put(digest, size, ext, blob)
+    return Picture(digest, blob, ext, *size)
+
+
+@lru_cache(maxsize=64)
+def _cached_picture(path, mtime_ns, file_size, cx, cy, cache_dir):
+    return _load_picture(path, cx, cy, MediaCache(cache_dir) if cache_dir else None)
+
+
+def load_picture(path, cx, cy, cache_dir=None):
+    """
+    Return the Picture to embed for `path` in a cx x cy EMU box.
+
+    Images no larger than the box needs are embedded byte-for-byte;
+    larger ones come from the variant cache (`cache_dir`, by default
+    `.media-cache` next to the image), encoded on the first miss only.
+    A picture repeated across a deck is loaded once per process.
+    """
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    return _cached_picture(path, stat.st_mtime_ns, stat.st_size, int(cx), int(cy), cache_dir)
@@ -0,0 +1,975 @@
+#!/usr/bin/env python3
+"""
+Mermaid flowchart parsing and layered layout for diagram slides
+Parses `graph TB` / `flowchart LR` blocks (nodes, subgraphs, edges, styles)
+and lays them out with the Sugiyama method: cycle removal, longest-path
+layering, barycenter crossing reduction and isotonic coordinate
+placement. Layouts are plain JSON-able dicts in points, memoized on disk
+by a hash of the diagram source and the text metrics node sizes come
+from, so unchanged diagrams are never re-laid.
+"""
+
+import bisect
+import hashlib
+import json
+import os
+import re
+import uuid
+from dataclasses import dataclass, field
+
+from deck_textfit import LINE_SPACING, metrics_fingerprint, text_width
+
+LAYOUT_VERSION = "2"  # bump when the layout algorithm or its constants change
+
+# Layout metrics, in points
+NODE_FONT_SIZE = 12
+NODE_PADDING = 8
+NODE_MIN_WIDTH = 60
+NODE_GAP = 18
+LAYER_GAP = 54  # free space between layers, where edge labels sit; subgraph borders come on top
+LABEL_CLEARANCE = 4  # between an edge label and the nodes or borders around it
+LABEL_STOPS = (0.5, 0.0, 1.0, 0.25, 0.75)  # spots across a gap's free space tried for a crowded label
+GROUP_PADDING = 10
+GROUP_TITLE = 16
+DUMMY_GAP = 8
+CROSSING_PASSES = 12
+GROUP_LAYERING_PASSES = 8
+PLACEMENT_PASSES = 6
+LABEL_PASSES = 6
+
+FENCE = re.compile(r"^\s*```\s*mermaid\s*$")
+GRAPH_HEADER = re.compile(r"^(?:graph|flowchart)(?:\s+(TB|TD|BT|LR|RL))?\s*;?$")
+SUBGRAPH = re.compile(r"^subgraph\s+(?:([\w-]+)\s*\[\s*\"?(.*?)\"?\s*\]|\"(.*?)\"|(.+?))\s*$")
+STYLE = re.compile(r"^style\s+([\w-]+)\s+(.+?);?$")
+CLASS_DEF = re.compile(r"^classDef\s+([\w-]+)\s+(.+?);?$")
+CLASS = re.compile(r"^class\s+([\w,\s-]+?)\s+([\w-]+);?$")
+IGNORED = re.compile(r"^(?:direction\s|linkStyle\s|click\s|%%)")
+
+# A node reference with its optional shape, e.g. VDB[(Vector DB)] or ORCH:::hot
+NODE_ID = re.compile(r"\s*([\w-]+)")
+NODE_SHAPES = (
+    ("[[", "]]", "subroutine"),
+    ("[(", ")]", "cylinder"),
+    ("[/", "/]", "parallelogram"),
+    ("[\\", "\\]", "parallelogram"),
+    ("((", "))", "circle"),
+    ("([", "])", "stadium"),
+    ("{{", "}}", "hexagon"),
+    ("[", "]", "rect"),
+    ("(", ")", "round"),
+    ("{", "}", "diamond"),
+    (">", "]", "flag"),
+)
+CLASS_SUFFIX = re.compile(r":::([\w-]+)")
+AMPERSAND = re.compile(r"\s*&\s*")
+LINK = re.compile(
+    r"""\s*(?P<head><)?(?:
+        -\.(?P<dotted_text>[^.>|]*?)\.?->(?P<dotted>) | -\.-(?P<dotted_open>) |
+        ={2}(?P<thick_text>[^=>|]+?)={2,}>(?P<thick>) | ={2,}>(?P<thick_plain>) | ={3,}(?P<thick_open>) |
+        --(?P<solid_text>[^\->|][^>|]*?)-{2,}>(?P<solid>) | -{2,}>(?P<solid_plain>) | -{3,}(?P<solid_open>)
+    )(?:\|(?P<label>[^|]*)\|)?\s*""",
+    re.VERBOSE,
+)
+
+
+@dataclass
+class MermaidNode:
+    """One flowchart node"""
+    id: str
+    label: str
+    shape: str = "rect"
+    style: dict = field(default_factory=dict)
+    group: str = None
+
+
+@dataclass
+class MermaidEdge:
+    """One flowchart link; `style` is solid/dotted/thick, `arrow` end/both/none"""
+    source: str
+    target: str
+    label: str = ""
+    style: str = "solid"
+    arrow: str = "end"
+
+
+@dataclass
+class MermaidGroup:
+    """One subgraph, nested under `parent` when not top-level"""
+    id: str
+    title: str
+    parent: str = None
+
+
+@dataclass
+class MermaidGraph:
+    """A parsed flowchart, ready for layout_graph()"""
+    direction: str = "TB"
+    nodes: dict = field(default_factory=dict)
+    edges: list = field(default_factory=list)
+    groups: dict = field(default_factory=dict)
+    warnings: list = field(default_factory=list)
+
+
+def clean_label(text):
+    """Strip quotes and Markdown from a node label, turning <br/> into line breaks"""
+    text = text.strip()
+    if len(text) >= 2 and text[0] == text[-1] == '"':
+        text = text[1:-1]
+    lines = re.split(r"<br\s*/?>", text)
+    return "\n".join(re.sub(r"[*_`]", "", line).strip() for line in lines)
+
+
+def _parse_style(text):
+    style = {}
+    for part in text.split(","):
+        name, _, value = part.partition(":")
+        if value:
+            style[name.strip()] = value.strip()
+    return style
+
+
+def _parse_node(text, pos, graph, group, classes):
+    """Parse a node reference at `pos`; returns (node_id, new_pos) or (None, pos)"""
+    match = NODE_ID.match(text, pos)
+    if not match:
+        return None, pos
+    node_id, pos = match.group(1), match.end()
+    label = shape = None
+    for opener, closer, name in NODE_SHAPES:
+        if text.startswith(opener, pos):
+            end = text.find(closer, pos + len(opener))
+            if end < 0:
+                continue
+            label, shape = text[pos + len(opener):end], name
+            pos = end + len(closer)
+            break
+    class_name = CLASS_SUFFIX.match(text, pos)
+    if class_name:
+        pos = class_name.end()
+
+    node = graph.nodes.get(node_id)
+    if node is None:
+        node = graph.nodes[node_id] = MermaidNode(node_id, node_id, group=group)
+    if label is not None:
+        node.label, node.shape = clean_label(label), shape
+        if group is not None:
+            node.group = group
+    if class_name:
+        node.style.update(classes.get(class_name.group(1), {}))
+    return node_id, pos
+
+
+def _parse_statement(text, graph, group, classes):
+    """Parse a node or edge chain statement: A --> B & C -->|label| D"""
+    pos = 0
+    sources = []
+    while True:
+        node_id, pos = _parse_node(text, pos, graph, group, classes)
+        if node_id is None:
+            return False
+        sources.append(node_id)
+        amp = AMPERSAND.match(text, pos)
+        if not amp:
+            break
+        pos = amp.end()
+
+    while pos < len(text.rstrip(" ;")):
+        link = LINK.match(text, pos)
+        if not link:
+            return False
+        pos = link.end()
+        targets = []
+        while True:
+            node_id, pos = _parse_node(text, pos, graph, group, classes)
+            if node_id is None:
+                return False
+            targets.append(node_id)
+            amp = AMPERSAND.match(text, pos)
+            if not amp:
+                break
+            pos = amp.end()
+
+        kinds = link.groupdict()
+        style = ("dotted" if kinds["dotted"] is not None or kinds["dotted_open"] is not None else
+                 "thick" if any(kinds[k] is not None for k in ("thick", "thick_plain", "thick_open")) else
+                 "solid")
+        is_open = any(kinds[k] is not None for k in ("dotted_open", "thick_open", "solid_open"))
+        arrow = "none" if is_open else ("both" if link.group("head") else "end")
+        label = link.group("label") or kinds["dotted_text"] or kinds["thick_text"] or kinds["solid_text"] or ""
+        for source in sources:
+            for target in targets:
+                graph.edges.append(MermaidEdge(source, target, clean_label(label), style, arrow))
+        sources = targets
+    return True
+
+
+def parse_flowchart(lines):
+    """Parse the lines of one Mermaid flowchart block into a MermaidGraph"""
+    graph = MermaidGraph()
+    classes = {}
+    stack = []
+    header_seen = False
+    for number, raw in enumerate(lines, 1):
+        line = raw.strip()
+        if not line or line.startswith("%%"):
+            continue
+        if not header_seen:
+            header = GRAPH_HEADER.match(line)
+            if not header:
+                raise ValueError(f"not a Mermaid flowchart: {line!r}")
+            direction = header.group(1) or "TB"
+            graph.direction = "TB" if direction == "TD" else direction
+            header_seen = True
+            continue
+
+        for statement in filter(None, (part.strip() for part in line.split(";"))):
+            group = stack[-1] if stack else None
+            subgraph = SUBGRAPH.match(statement)
+            if subgraph:
+                group_id, bracket_title, quoted, bare = subgraph.groups()
+                title = bracket_title if group_id else (quoted if quoted is not None else bare)
+                group_id = group_id or title
+                while group_id in graph.groups:
+                    group_id += "'"
+                graph.groups[group_id] = MermaidGroup(group_id, clean_label(title).replace("\n", " "), group)
+                stack.append(group_id)
+            elif statement == "end":
+                if stack:
+                    stack.pop()
+                else:
+                    graph.warnings.append(f"line {number}: 'end' without subgraph")
+            elif STYLE.match(statement):
+                node_id, style = STYLE.match(statement).groups()
+                node = graph.nodes.setdefault(node_id, MermaidNode(node_id, node_id, group=group))
+                node.style.update(_parse_style(style))
+            elif CLASS_DEF.match(statement):
+                name, style = CLASS_DEF.match(statement).groups()
+                classes[name] = _parse_style(style)
+            elif CLASS.match(statement):
+                node_ids, name = CLASS.match(statement).groups()
+                for node_id in re.split(r"[,\s]+", node_ids.strip()):
+                    if node_id in graph.nodes:
+                        graph.nodes[node_id].style.update(classes.get(name, {}))
+            elif IGNORED.match(statement):
+                continue
+            elif not _parse_statement(statement, graph, group, classes):
+                graph.warnings.append(f"line {number}: could not parse {statement!r}")
+    if stack:
+        graph.warnings.append(f"{len(stack)} unterminated subgraph(s)")
+    return graph
+
+
+def iter_mermaid_blocks(lines):
+    """
+    Yield (heading, block_lines) for each Mermaid flowchart in a Markdown file.
+
+    `heading` is the nearest `#`-heading above the block. Other Mermaid
+    diagram types (sequenceDiagram, gantt, ...) are skipped.
+    """
+    if isinstance(lines, str):
+        with open(lines, encoding="utf-8") as handle:
+            yield from iter_mermaid_blocks(handle)
+        return
+
+    heading = ""
+    block = None
+    for raw in lines:
+        line = raw.rstrip("\n").rstrip("\r")
+        if block is None:
+            if FENCE.match(line):
+                block = []
+            elif line.startswith("#"):
+                heading = line.lstrip("#").strip()
+            continue
+        if line.strip().startswith("```"):
+            first = next((item.strip() for item in block if item.strip()), "")
+            if GRAPH_HEADER.match(first):
+                yield heading, block
+            block = None
+            continue
+        block.append(line)
+
+
+def source_key(block_lines):
+    """
+    Hash identifying one diagram's layout for the layout cache
+
+    Node sizes are measured text, so the key covers the font metrics in use
+    (Pillow and the font file found, see DECK_FONT_PATH) along with the
+    source: installing a font re-lays the diagrams.
+    """
+    hasher = hashlib.sha256(f"{LAYOUT_VERSION}\0{metrics_fingerprint()}\0".encode("utf-8"))
+    for line in block_lines:
+        hasher.update(line.rstrip().encode("utf-8") + b"\n")
+    return hasher.hexdigest()
+
+
+def label_size(label):
+    """(width, height) of the text box of an edge label, in points"""
+    return text_width(label, size=NODE_FONT_SIZE) + 8, NODE_FONT_SIZE * 1.6
+
+
+def node_size(label):
+    """(width, height) of a node box for `label`, in points"""
+    lines = label.split("\n")
+    width = max(text_width(line, size=NODE_FONT_SIZE) for line in lines) + 2 * NODE_PADDING
+    height = len(lines) * NODE_FONT_SIZE * LINE_SPACING + 2 * NODE_PADDING
+    return max(width, NODE_MIN_WIDTH), height
+
+
+# ---------------------------------------------------------------------------
+# Sugiyama layout
+
+def _reverse_back_edges(count, successors):
+    """Iterative DFS; returns the set of (u, v) edges to reverse to make the graph acyclic"""
+    state = [0] * count  # 0 unvisited, 1 on stack, 2 done
+    reversed_edges = set()
+    for root in range(count):
+        if state[root]:
+            continue
+        state[root] = 1
+        stack = [(root, iter(successors[root]))]
+        while stack:
+            node, children = stack[-1]
+            for child in children:
+                if state[child] == 1:
+                    reversed_edges.add((node, child))
+                elif state[child] == 0:
+                    state[child] = 1
+                    stack.append((child, iter(successors[child])))
+                    break
+            else:
+                state[node] = 2
+                stack.pop()
+    return reversed_edges
+
+
+def _assign_layers(count, edges, lower=None):
+    """
+    Longest-path layering of a DAG, with sources pulled down next to their successors.
+
+    `lower` optionally gives a minimum layer per node.
+    """
+    successors = [[] for _ in range(count)]
+    indegree = [0] * count
+    for u, v in edges:
+        successors[u].append(v)
+        indegree[v] += 1
+
+    order = [node for node in range(count) if indegree[node] == 0]
+    remaining = indegree[:]
+    for node in order:
+        for child in successors[node]:
+            remaining[child] -= 1
+            if remaining[child] == 0:
+                order.append(child)
+
+    layer = list(lower) if lower else [0] * count
+    for node in order:
+        for child in successors[node]:
+            layer[child] = max(layer[child], layer[node] + 1)
+    for node in reversed(order):
+        if indegree[node] == 0 and successors[node]:
+            layer[node] = max(layer[node], min(layer[child] for child in successors[node]) - 1)
+    return layer
+
+
+def _flat_groups(graph, index, edges):
+    """Node indices of each subgraph that has no edges between its own nodes"""
+    members = {}
+    for node in graph.nodes.values():
+        if node.group is not None:
+            members.setdefault(node.group, []).append(index[node.id])
+    group_of = {index[node.id]: node.group for node in graph.nodes.values()}
+    internal = {group_of[u] for u, v in edges if group_of[u] is not None and group_of[u] == group_of[v]}
+    return [nodes for group, nodes in members.items() if group not in internal and len(nodes) > 1]
+
+
+def _layer_groups(count, edges, groups):
+    """
+    Layering that keeps each flat subgraph on one layer where the edges allow.
+
+    Members are raised to their subgraph's deepest layer and the layering is
+    recomputed, a bounded number of times (cyclic dependencies between
+    subgraphs could otherwise keep pushing them down).
+    """
+    layer = _assign_layers(count, edges)
+    for _ in range(GROUP_LAYERING_PASSES):
+        lower = layer[:]
+        for nodes in groups:
+            deepest = max(layer[node] for node in nodes)
+            for node in nodes:
+                lower[node] = deepest
+        if lower == layer:
+            break
+        layer = _assign_layers(count, edges, lower)
+    return layer
+
+
+def _count_crossings(upper_pos, edges):
+    """Crossings between two adjacent layers given (u, v) edges and positions"""
+    if len(edges) < 2:
+        return 0
+    lower = sorted((upper_pos[u], upper_pos[v]) for u, v in edges)
+    seen = []
+    crossings = 0
+    for _, v_pos in lower:
+        index = bisect.bisect_right(seen, v_pos)
+        crossings += len(seen) - index
+        seen.insert(index, v_pos)
+    return crossings
+
+
+def _place(targets, gaps):
+    """
+    Closest positions to `targets` (least squares) keeping x[i+1] - x[i] >= gaps[i].
+
+    Pool-adjacent-violators on the gap-shifted targets, O(n).
+    """
+    offsets = [0.0]
+    for gap in gaps:
+        offsets.append(offsets[-1] + gap)
+    blocks = []  # [sum, count]
+    for target, offset in zip(targets, offsets):
+        blocks.append([target - offset, 1])
+        while len(blocks) > 1 and blocks[-2][0] * blocks[-1][1] > blocks[-1][0] * blocks[-2][1]:
+            total, count = blocks.pop()
+            blocks[-1][0] += total
+            blocks[-1][1] += count
+    placed = []
+    for total, count in blocks:
+        placed.extend([total / count] * count)
+    return [value + offset for value, offset in zip(placed, offsets)]
+
+
+def _median(values):
+    values = sorted(values)
+    middle = len(values) // 2
+    return values[middle] if len(values) % 2 else (values[middle - 1] + values[middle]) / 2
+
+
+class _Layering:
+    """Working state of one layout: real nodes followed by dummy nodes for long edges"""
+
+    def __init__(self, graph):
+        horizontal = self.horizontal = graph.direction in ("LR", "RL")
+        self.ids = list(graph.nodes)
+        index = {node_id: i for i, node_id in enumerate(self.ids)}
+        sizes = [node_size(graph.nodes[node_id].label) for node_id in self.ids]
+        # Sizes along the layer (across) and between layers (along)
+        self.across = [h if horizontal else w for w, h in sizes]
+        self.along = [w if horizontal else h for w, h in sizes]
+        self.path = [self._group_path(graph, graph.nodes[node_id].group) for node_id in self.ids]
+
+        count = len(self.ids)
+        successors = [[] for _ in range(count)]
+        self.edges = []  # (u, v, edge) with u != v, in original direction
+        for edge in graph.edges:
+            u, v = index[edge.source], index[edge.target]
+            if u != v:
+                successors[u].append(v)
+                self.edges.append((u, v, edge))
+        flipped = _reverse_back_edges(count, successors)
+        dag = [(v, u) if (u, v) in flipped else (u, v) for u, v, _ in self.edges]
+        self.flipped = [(u, v) in flipped for u, v, _ in self.edges]
+        self.layer = _layer_groups(count, dag, _flat_groups(graph, index, dag))
+
+        # Split long edges into unit-length segments through dummy nodes
+        self.up = [[] for _ in range(count)]
+        self.down = [[] for _ in range(count)]
+        self.chains = []
+        for u, v in dag:
+            chain = [u]
+            for level in range(self.layer[u] + 1, self.layer[v]):
+                dummy = len(self.layer)
+                self.layer.append(level)
+                self.across.append(0.0)
+                self.along.append(0.0)
+                self.path.append(())
+                self.up.append([])
+                self.down.append([])
+                chain.append(dummy)
+            chain.append(v)
+            for a, b in zip(chain, chain[1:]):
+                self.down[a].append(b)
+                self.up[b].append(a)
+            self.chains.append(chain)
+
+        self.real = count
+        depth = max(self.layer, default=-1) + 1
+        self.layers = [[] for _ in range(depth)]
+        for node in range(len(self.layer)):
+            self.layers[self.layer[node]].append(node)
+        self.pos = [0] * len(self.layer)
+        for nodes in self.layers:
+            self._reorder(nodes, {node: i for i, node in enumerate(nodes)})
+
+    @staticmethod
+    def _group_path(graph, group):
+        path = []
+        while group is not None:
+            path.append(group)
+            group = graph.groups[group].parent
+        return tuple(reversed(path))
+
+    def _reorder(self, nodes, key):
+        """Sort a layer by `key`, keeping members of each subgraph contiguous"""
+        sums = {}
+        for node in nodes:
+            for depth in range(1, len(self.path[node]) + 1):
+                prefix = self.path[node][:depth]
+                total, count = sums.get(prefix, (0.0, 0))
+                sums[prefix] = (total + key[node], count + 1)
+
+        def sort_key(node):
+            path = self.path[node]
+            levels = [sums[path[:depth]][0] / sums[path[:depth]][1] for depth in range(1, len(path) + 1)]
+            return (*levels, key[node]) if levels else (key[node],)
+
+        nodes.sort(key=sort_key)
+        for i, node in enumerate(nodes):
+            self.pos[node] = i
+
+    def crossings(self):
+        total = 0
+        for nodes in self.layers[:-1]:
+            total += _count_crossings(self.pos, [(u, v) for u in nodes for v in self.down[u]])
+        return total
+
+    def reduce_crossings(self):
+        """Alternating barycenter sweeps, keeping the best ordering seen"""
+        best = self.crossings()
+        best_layers = [nodes[:] for nodes in self.layers]
+        stale = 0
+        for sweep in range(CROSSING_PASSES):
+            downward = sweep % 2 == 0
+            indices = range(1, len(self.layers)) if downward else range(len(self.layers) - 2, -1, -1)
+            for index in indices:
+                nodes = self.layers[index]
+                key = {}
+                for node in nodes:
+                    neighbors = self.up[node] if downward else self.down[node]
+                    key[node] = (sum(self.pos[n] for n in neighbors) / len(neighbors)
+                                 if neighbors else self.pos[node])
+                self._reorder(nodes, key)
+            crossings = self.crossings()
+            if crossings < best:
+                best, stale = crossings, 0
+                best_layers = [nodes[:] for nodes in self.layers]
+            else:
+                stale += 1
+            if best == 0 or stale >= 4:
+                break
+        self.layers = best_layers
+        self._order_groups()
+
+    def _order_groups(self):
+        """Put subgraphs in the same relative order on every layer, by their mean position"""
+        relative = {}
+        for nodes in self.layers:
+            for i, node in enumerate(nodes):
+                relative[node] = (i + 0.5) / len(nodes)
+        sums = {}
+        for node, value in relative.items():
+            for depth in range(1, len(self.path[node]) + 1):
+                total, count = sums.get(self.path[node][:depth], (0.0, 0))
+                sums[self.path[node][:depth]] = (total + value, count + 1)
+        self.group_rank = {prefix: total / count for prefix, (total, count) in sums.items()}
+
+        def sort_key(node):
+            path = self.path[node]
+            return (*(self.group_rank[path[:depth]] for depth in range(1, len(path) + 1)), relative[node])
+
+        for nodes in self.layers:
+            nodes.sort(key=sort_key)
+            for i, node in enumerate(nodes):
+                self.pos[node] = i
+
+    def _gaps(self, nodes):
+        gaps = []
+        for a, b in zip(nodes, nodes[1:]):
+            if a >= self.real or b >= self.real:
+                gap = DUMMY_GAP
+            else:
+                shared = 0
+                for x, y in zip(self.path[a], self.path[b]):
+                    if x != y:
+                        break
+                    shared += 1
+                boundaries = len(self.path[a]) + len(self.path[b]) - 2 * shared
+                gap = NODE_GAP + boundaries * GROUP_PADDING + (GROUP_TITLE if boundaries else 0)
+            gaps.append((self.across[a] + self.across[b]) / 2 + gap)
+        return gaps
+
+    def assign_coordinates(self):
+        """Center coordinates across each layer; returns a list indexed by node"""
+        center = [0.0] * len(self.layer)
+        for nodes in self.layers:
+            for node, value in zip(nodes, _place([0.0] * len(nodes), self._gaps(nodes))):
+                center[node] = value
+        for sweep in range(PLACEMENT_PASSES):
+            downward = sweep % 2 == 0
+            order = self.layers[1:] if downward else self.layers[-2::-1]
+            for nodes in order:
+                targets = []
+                for node in nodes:
+                    neighbors = self.up[node] if downward else self.down[node]
+                    targets.append(_median([center[n] for n in neighbors]) if neighbors else center[node])
+                for node, value in zip(nodes, _place(targets, self._gaps(nodes))):
+                    center[node] = value
+        for _ in range(3):
+            if not self._separate_groups(center):
+                break
+        return center
+
+    def _separate_groups(self, center):
+        """
+        Shift sibling subgraphs that share layers apart so their boxes do not
+        overlap, then push apart any nodes the shifts made collide.
+        Returns True if anything moved.
+        """
+        prefixes = sorted(self.group_rank, key=len, reverse=True)
+        members = {prefix: [] for prefix in prefixes}
+        for node in range(self.real):
+            for depth in range(1, len(self.path[node]) + 1):
+                members[self.path[node][:depth]].append(node)
+        title = GROUP_TITLE if self.horizontal else 0
+
+        def extent(prefix):
+            nodes = members[prefix]
+            nesting = [len(self.path[node]) - len(prefix) + 1 for node in nodes]
+            low = min(center[node] - self.across[node] / 2 - level * (GROUP_PADDING + title)
+                      for node, level in zip(nodes, nesting))
+            high = max(center[node] + self.across[node] / 2 + level * GROUP_PADDING
+                       for node, level in zip(nodes, nesting))
+            layers = {self.layer[node] for node in nodes}
+            return low, high, min(layers), max(layers)
+
+        moved = False
+        parents = sorted({prefix[:-1] for prefix in prefixes}, key=len, reverse=True)
+        for parent in parents:
+            siblings = sorted((prefix for prefix in prefixes if prefix[:-1] == parent), key=self.group_rank.get)
+            placed = []
+            for prefix in siblings:
+                low, high, first, last = extent(prefix)
+                limit = max((other_high + NODE_GAP for other_high, other_first, other_last in placed
+                             if other_first <= last and first <= other_last), default=low)
+                if limit > low:
+                    for node in members[prefix]:
+                        center[node] += limit - low
+                    low, high = limit, high + limit - low
+                    moved = True
+                placed.append((high, first, last))
+
+        for nodes in self.layers:
+            for (a, b), gap in zip(zip(nodes, nodes[1:]), self._gaps(nodes)):
+                if center[b] < center[a] + gap - 1e-6:
+                    center[b] = center[a] + gap
+                    moved = True
+        return moved
+
+
+def layout_graph(graph):
+    """
+    Lay out a MermaidGraph; returns a JSON-able dict in points.
+
+    Nodes carry top-left x/y plus w/h, edges a polyline of points from
+    source to target and the center of their label, groups the boxes of
+    their subgraphs (outermost first); warnings lists what could not be
+    parsed. Runs in roughly O((V + E) log V) per sweep.
+    """
+    if not graph.nodes:
+        return {"version": LAYOUT_VERSION, "direction": graph.direction, "width": 0, "height": 0,
+                "nodes": [], "edges": [], "groups": [], "warnings": list(graph.warnings)}
+
+    state = _Layering(graph)
+    state.reduce_crossings()
+    center = state.assign_coordinates()
+    horizontal = graph.direction in ("LR", "RL")
+    closing, opening = _group_borders(state, GROUP_TITLE if not horizontal else 0)
+
+    # Each edge's label sits in the free space of the middle gap its chain crosses
+    label_level = []
+    free = [LAYER_GAP] * len(state.layers)
+    for (u, v, edge), chain in zip(state.edges, state.chains):
+        level = state.layer[chain[(len(chain) - 2) // 2]] if edge.label else None
+        if level is not None:
+            width, height = label_size(edge.label)
+            free[level] = max(free[level], (width if horizontal else height) + 2 * LABEL_CLEARANCE)
+        label_level.append(level)
+    layer_size = [max((state.along[node] for node in nodes), default=0.0) for nodes in state.layers]
+
+    def along_start(node):
+        level = state.layer[node]
+        return layer_start[level] + (layer_size[level] - state.along[node]) / 2
+
+    # Labels crowding a gap are stacked in it, which may take a taller gap and another pass
+    for _ in range(LABEL_PASSES):
+        # Distance of each layer from the first, along the flow
+        layer_start, offset = [], 0.0
+        for level, size in enumerate(layer_size):
+            layer_start.append(offset)
+            offset += size + closing[level] + free[level] + (opening[level + 1] if level + 1 < len(opening) else 0)
+
+        # (across, along) of every bend of every edge, from the upper layer down
+        routes = []
+        for chain in state.chains:
+            bends = [(center[chain[0]], along_start(chain[0]) + state.along[chain[0]])]
+            for dummy in chain[1:-1]:
+                bends.append((center[dummy], layer_start[state.layer[dummy]] + layer_size[state.layer[dummy]] / 2))
+            bends.append((center[chain[-1]], along_start(chain[-1])))
+            routes.append(bends)
+        label_spots, crowded = _spot_labels(state, routes, label_level, layer_start, layer_size, closing, free,
+                                            horizontal)
+        if not crowded:
+            break
+        for level, height in crowded.items():
+            free[level] += height + LABEL_CLEARANCE
+
+    def point(across, along):
+        return (along, across) if horizontal else (across, along)
+
+    boxes = {}
+    for node in range(state.real):
+        x, y = point(center[node] - state.across[node] / 2, along_start(node))
+        w, h = point(state.across[node], state.along[node])
+        boxes[state.ids[node]] = [x, y, w, h]
+
+    edges = []
+    for (u, v, edge), flipped, bends, spot in zip(state.edges, state.flipped, routes, label_spots):
+        points = [point(*bend) for bend in bends]
+        if flipped:
+            points.reverse()
+        edges.append({"source": edge.source, "target": edge.target, "label": edge.label,
+                      "style": edge.style, "arrow": edge.arrow, "points": [list(p) for p in points],
+                      "label_at": point(*spot) if spot is not None else None})
+
+    # A label over a subgraph border widens the innermost subgraph it touches to take it in
+    groups = _group_boxes(graph, boxes)
+    depth = {group["id"]: group["depth"] for group in groups}
+    extra = {}
+    for edge in edges:
+        if edge["label_at"] is None:
+            continue
+        width, height = label_size(edge["label"])
+        box = [edge["label_at"][0] - width / 2, edge["label_at"][1] - height / 2, width, height]
+        touched = [group for group in groups if _crosses(box, group["box"])]
+        if touched and not all(_inside(box, group["box"]) for group in touched):
+            extra.setdefault(max(touched, key=lambda group: depth[group["id"]])["id"], []).append(box)
+    if extra:
+        groups = _group_boxes(graph, boxes, extra)
+
+    # Shift everything to start at (0, 0) and flip bottom-up / right-to-left flows
+    shapes = list(boxes.values()) + [group["box"] for group in groups]
+    min_x = min(box[0] for box in shapes)
+    min_y = min(box[1] for box in shapes)
+    width = max(box[0] + box[2] for box in shapes) - min_x
+    height = max(box[1] + box[3] for box in shapes) - min_y
+
+    def transform(x, y):
+        x, y = x - min_x, y - min_y
+        if graph.direction == "BT":
+            y = height - y
+        elif graph.direction == "RL":
+            x = width - x
+        return round(x, 2), round(y, 2)
+
+    def transform_box(box):
+        x, y, w, h = box
+        if graph.direction == "BT":
+            y += h
+        elif graph.direction == "RL":
+            x += w
+        x, y = transform(x, y)
+        return {"x": x, "y": y, "w": round(w, 2), "h": round(h, 2)}
+
+    nodes = []
+    for node_id, box in boxes.items():
+        node = graph.nodes[node_id]
+        nodes.append({"id": node_id, "label": node.label, "shape": node.shape, "style": node.style,
+                      **transform_box(box)})
+    for edge in edges:
+        edge["points"] = [list(transform(x, y)) for x, y in edge["points"]]
+        if edge["label_at"] is not None:
+            edge["label_at"] = list(transform(*edge["label_at"]))
+    for group in groups:
+        group.update(transform_box(group.pop("box")))
+    return {"version": LAYOUT_VERSION, "direction": graph.direction,
+            "width": round(width, 2), "height": round(height, 2),
+            "nodes": nodes, "edges": edges, "groups": groups, "warnings": list(graph.warnings)}
+
+
+def _spot_labels(state, routes, label_level, layer_start, layer_size, closing, free, horizontal):
+    """
+    (across, along) of each edge label, or None for unlabelled edges, and the
+    gaps too crowded to hold their labels as {layer: label height}.
+
+    Labels go on their edge's segment through the free space of their gap,
+    at the first of LABEL_STOPS clear of the labels already placed there;
+    short edges have the fewest alternatives, so they are placed first.
+    """
+    spots = [None] * len(routes)
+    placed = {}
+    crowded = {}
+    for index in sorted(range(len(routes)), key=lambda index: len(routes[index])):
+        level = label_level[index]
+        if level is None:
+            continue
+        width, height = label_size(state.edges[index][2].label)
+        across_size, along_size = (height, width) if horizontal else (width, height)
+        low = layer_start[level] + layer_size[level] + closing[level] + LABEL_CLEARANCE + along_size / 2
+        high = low + max(0.0, free[level] - 2 * LABEL_CLEARANCE - along_size)
+        chain = state.chains[index]
+        (across0, along0), (across1, along1) = routes[index][(len(chain) - 2) // 2:(len(chain) - 2) // 2 + 2]
+        candidates = []
+        for stop in LABEL_STOPS:
+            along = low + (high - low) * stop
+            t = (along - along0) / (along1 - along0) if along1 != along0 else 0.5
+            candidates.append((across0 + (across1 - across0) * t, along))
+        taken = placed.setdefault(level, [])
+        for across, along in candidates:
+            box = [across - across_size / 2 - LABEL_CLEARANCE, along - along_size / 2 - LABEL_CLEARANCE,
+                   across_size + 2 * LABEL_CLEARANCE, along_size + 2 * LABEL_CLEARANCE]
+            if not any(_crosses(box, other) for other in taken):
+                break
+        else:
+            across, along = candidates[0]
+            crowded[level] = max(crowded.get(level, 0.0), along_size)
+        spots[index] = (across, along)
+        taken.append([across - across_size / 2, along - along_size / 2, across_size, along_size])
+    return spots, crowded
+
+
+def _crosses(box, other):
+    """True if two [x, y, w, h] boxes share any area"""
+    return (box[0] < other[0] + other[2] and other[0] < box[0] + box[2]
+            and box[1] < other[1] + other[3] and other[1] < box[1] + box[3])
+
+
+def _inside(box, other):
+    """True if [x, y, w, h] `box` lies entirely within `other`"""
+    return (other[0] <= box[0] and box[0] + box[2] <= other[0] + other[2]
+            and other[1] <= box[1] and box[1] + box[3] <= other[1] + other[3])
+
+
+def _group_borders(state, title):
+    """
+    Room subgraph borders take at each layer along the flow, as (closing, opening) lists.
+
+    closing[i] is GROUP_PADDING per nesting level of the subgraphs whose last
+    layer is i, below it; opening[i] is GROUP_PADDING plus `title` per level of
+    those whose first layer is i, above it (see _group_boxes()).
+    """
+    first, last = {}, {}
+    for node in range(state.real):
+        path, layer = state.path[node], state.layer[node]
+        for depth in range(1, len(path) + 1):
+            first[path[:depth]] = min(first.get(path[:depth], layer), layer)
+            last[path[:depth]] = max(last.get(path[:depth], layer), layer)
+    closing, opening = [0.0] * len(state.layers), [0.0] * len(state.layers)
+    for node in range(state.real):
+        path, layer = state.path[node], state.layer[node]
+        prefixes = [path[:depth] for depth in range(1, len(path) + 1)]
+        closing[layer] = max(closing[layer], GROUP_PADDING * sum(last[prefix] == layer for prefix in prefixes))
+        opening[layer] = max(opening[layer],
+                             (GROUP_PADDING + title) * sum(first[prefix] == layer for prefix in prefixes))
+    return closing, opening
+
+
+def _group_boxes(graph, boxes, extra=None):
+    """
+    Bounding boxes of every subgraph around its nodes and nested subgraphs,
+    outermost first; `extra` maps subgraph ids to further boxes to take in.
+    """
+    children = {group_id: [] for group_id in graph.groups}
+    for group in graph.groups.values():
+        if group.parent is not None:
+            children[group.parent].append(group.id)
+    members = {group_id: [] for group_id in graph.groups}
+    for node in graph.nodes.values():
+        if node.group is not None:
+            members[node.group].append(boxes[node.id])
+    for group_id, extra_boxes in (extra or {}).items():
+        members[group_id].extend(extra_boxes)
+
+    computed = {}
+
+    def compute(group_id):
+        inner = members[group_id] + [compute(child) for child in children[group_id]]
+        inner = [box for box in inner if box is not None]
+        if not inner:
+            computed[group_id] = None
+            return None
+        x = min(box[0] for box in inner) - GROUP_PADDING
+        y = min(box[1] for box in inner) - GROUP_PADDING - GROUP_TITLE
+        right = max(box[0] + box[2] for box in inner) + GROUP_PADDING
+        bottom = max(box[1] + box[3] for box in inner) + GROUP_PADDING
+        computed[group_id] = [x, y, right - x, bottom - y]
+        return computed[group_id]
+
+    result = []
+    for group_id, group in graph.groups.items():
+        if group.parent is None:
+            compute(group_id)
+    for group_id, group in graph.groups.items():
+        if computed.get(group_id) is None:
+            continue
+        depth, parent = 0, group.parent
+        while parent is not None:
+            depth, parent = depth + 1, graph.groups[parent].parent
+        result.append({"id": group_id, "title": group.title, "depth": depth, "box": computed[group_id]})
+    result.sort(key=lambda group: group["depth"])
+    return result
+
+
+class LayoutCache:
+    """Directory of computed layouts as JSON, keyed by source_key()"""
+
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """Return the cached layout for `key`, or None"""
+        try:
+            with open(os.path.join(self.directory, key + ".json"), encoding="utf-8") as handle:
+                layout = json.load(handle)
+        except (FileNotFoundError, ValueError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return layout
+
+    def put(self, key, layout):
+        """Store one layout"""
+        path = os.path.join(self.directory, key + ".json")
+        tmp_path = os.path.join(self.directory, f".{key}.{uuid.uuid4().hex}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            json.dump(layout, handle)
+        os.replace(tmp_path, path)
+
+
+def default_cache_dir(output):
+    """Layout cache directory of a deck: `mermaid` in the output's sidecar cache (`deck.pptx.cache`)"""
+    return os.path.join(output + ".cache", "mermaid")
+
+
+def cached_layout(block_lines, cache=None):
+    """Layout for one flowchart block, from `cache` when its source is unchanged"""
+    key = source_key(block_lines)
+    layout = cache.get(key) if cache is not None else None
+    if layout is None:
+        layout = layout_graph(parse_flowchart(block_lines))
+        if cache is not None:
+            cache.put(key, layout)
+    return layout
+
+
+def check_mermaid(path, cache=None):
+    """Parse warnings of every flowchart in `path` as "heading: warning" strings, via cached_layout()"""
+    problems = []
+    for heading, block in iter_mermaid_blocks(path):
+        problems.extend(f"{heading}: {warning}" for warning in cached_layout(block, cache)["warnings"])
+    return problems
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+Low-level .pptx package assembly
+Writes a presentation from a slide-less skeleton package plus a stream of
+rendered slide parts, without going through the python-pptx object model.
+Pictures and charts (with their embedded workbooks) are content-addressed
+media parts, written once per package however many slides show them.
+Packages are reproducible: entries carry a fixed timestamp and are written
+in a stable order, so identical input gives a byte-identical .pptx, and an
+unchanged output file is left untouched rather than rewritten.
+"""
+
+import hashlib
+import io
+import os
+import uuid
+import zipfile
+from contextlib import contextmanager
+
+from lxml import etree
+from pptx.opc.oxml import serialize_part_xml
+from pptx.opc.packuri import CONTENT_TYPES_URI, PACKAGE_URI, PackURI
+from pptx.opc.serialized import _ContentTypesItem
+
+P_NS = "http://schemas.openxmlformats.org/presentationml/2006/main"
+R_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+PKG_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+CT_NS = "http://schemas.openxmlformats.org/package/2006/content-types"
+
+SLIDE_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.presentationml.slide+xml"
+SLIDE_RELTYPE = R_NS + "/slide"
+IMAGE_RELTYPE = R_NS + "/image"
+CHART_RELTYPE = R_NS + "/chart"
+CHART_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.drawingml.chart+xml"
+
+# Default content types for media part extensions
+MEDIA_CONTENT_TYPES = {
+    "png": "image/png", "jpg": "image/jpeg", "jpeg": "image/jpeg", "gif": "image/gif",
+    "bmp": "image/bmp", "tiff": "image/tiff", "tif": "image/tiff",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+
+CONTENT_TYPES_PART = "[Content_Types].xml"
+PRESENTATION_PART = "ppt/presentation.xml"
+PRESENTATION_RELS_PART = "ppt/_rels/presentation.xml.rels"
+
+ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)  # earliest zip timestamp; stamped on every entry
+
+# Elements that follow p:sldIdLst in CT_Presentation, in schema order
+_AFTER_SLD_ID_LST = ("sldSz", "notesSz", "smartTags", "embeddedFontLst", "custShowLst",
+                     "photoAlbum", "custDataLst", "kinsoku", "defaultTextStyle", "modifyVerifier", "extLst")
+
+
+@contextmanager
+def atomic_output(path):
+    """
+    Yield a temporary path next to `path` and move it into place on success.
+
+    Readers never observe a half-written deck; on error the temporary file
+    is removed and any existing output is left untouched. When the new file
+    is byte-identical to the existing output, the existing file is kept, so
+    its mtime (and anything keyed on it) does not change.
+    """
+    directory, name = os.path.split(os.path.abspath(path))
+    tmp_path = os.path.join(directory, f".~{name}.{uuid.uuid4().hex}.tmp")
+    try:
+        yield tmp_path
+        if same_contents(tmp_path, path):
+            os.remove(tmp_path)
+        else:
+            os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _file_hash(path):
+    hasher = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b""):
+            hasher.update(chunk)
+    return hasher.digest()
+
+
+def same_contents(path, other):
+    """True when `other` exists and holds exactly the bytes of `path`"""
+    try:
+        if os.path.getsize(path) != os.path.getsize(other):
+            return False
+    except FileNotFoundError:
+        return False
+    return _file_hash(path) == _file_hash(other)
+
+
+def _entry(name, compress_type=zipfile.ZIP_DEFLATED):
+    """ZipInfo for `name` with the fixed timestamp and writestr()'s default permissions"""
+    info = zipfile.ZipInfo(name, ZIP_DATE_TIME)
+    info.compress_type = compress_type
+    info.external_attr = 0o600 << 16
+    return info
+
+
+def save_presentation(prs, path):
+    """
+    Save `prs` like prs.save(), but reproducibly.
+
+    Parts are written in python-pptx's own order (content types, package
+    rels, then each part and its rels), with fixed entry timestamps.
+    """
+    package = prs.part.package
+    parts = tuple(package.iter_parts())
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr(_entry(CONTENT_TYPES_URI.membername),
+                         serialize_part_xml(_ContentTypesItem.xml_for(parts)))
+        archive.writestr(_entry(PACKAGE_URI.rels_uri.membername), package._rels.xml)
+        for part in parts:
+            archive.writestr(_entry(part.partname.membername), part.blob)
+            if part._rels:
+                archive.writestr(_entry(part.partname.rels_uri.membername), part.rels.xml)
+
+
+def read_skeleton(prs):
+    """Return the parts of a slide-less presentation as an ordered {name: bytes} dict"""
+    if len(prs.slides):
+        raise ValueError("skeleton presentation must not contain slides")
+    buffer = io.BytesIO()
+    prs.save(buffer)
+    with zipfile.ZipFile(buffer) as package:
+        return {info.filename: package.read(info.filename) for info in package.infolist()}
+
+
+def media_name(sha1, ext):
+    """Content-addressed part name of a picture"""
+    return f"ppt/media/media-{sha1}.{ext}"
+
+
+def _chart_parts(chart_part):
+    """
+    Rename a chart part and its embedded workbook by content; return their (name, blob) pairs.
+
+    The workbook is renamed first, so the chart's rels point at its new
+    name before they are hashed with the chart XML.
+    """
+    parts = []
+    for rel in chart_part.rels.values():
+        if rel.is_external:
+            continue
+        embedded = rel.target_part
+        digest = hashlib.sha1(embedded.blob).hexdigest()
+        name = f"ppt/embeddings/workbook-{digest}.{embedded.partname.ext}"
+        embedded.partname = PackURI("/" + name)
+        parts.append((name, embedded.blob))
+    blob, rels_xml = chart_part.blob, chart_part.rels.xml
+    name = f"ppt/charts/chart-{hashlib.sha1(blob + rels_xml).hexdigest()}.xml"
+    chart_part.partname = PackURI("/" + name)
+    return [(name, blob), (chart_part.partname.rels_uri.membername, rels_xml)] + parts
+
+
+def slide_part(slide):
+    """
+    Return the (slide_xml, rels_xml, media) of a rendered python-pptx slide.
+
+    Picture and chart parts are renamed by content before the rels are
+    serialized, so slides rendered into separate scratch presentations
+    still point at one shared copy of each image or chart. `media` is a
+    tuple of (part name, blob) pairs.
+    """
+    media = []
+    for rel in slide.part.rels.values():
+        if rel.is_external:
+            continue
+        if rel.reltype == IMAGE_RELTYPE:
+            image_part = rel.target_part
+            name = media_name(image_part.sha1, image_part.partname.ext)
+            image_part.partname = PackURI("/" + name)
+            media.append((name, image_part.blob))
+        elif rel.reltype == CHART_RELTYPE:
+            media.extend(_chart_parts(rel.target_part))
+    return slide.part.blob, slide.part.rels.xml, tuple(media)
+
+
+def drop_slides(prs):
+    """
+    Remove every slide from `prs` and release its part.
+
+    Used on the scratch presentation of a streaming build once the slides'
+    XML has been taken, so it never holds more than one section's slides
+    and add_slide() stays constant-time instead of growing with the deck.
+    """
+    sld_id_lst = prs.slides._sldIdLst
+    for sld_id in list(sld_id_lst):
+        sld_id_lst.remove(sld_id)
+        prs.part.drop_rel(sld_id.rId)
+
+
+def _serialize(root):
+    return etree.tostring(root, xml_declaration=True, encoding="UTF-8", standalone=True)
+
+
+def _add_content_types(blob, count, extensions=(), charts=()):
+    root = etree.fromstring(blob)
+    declared = {default.get("Extension").lower() for default in root.iter(f"{{{CT_NS}}}Default")}
+    for extension in sorted(set(extensions) - declared):
+        default = etree.Element(f"{{{CT_NS}}}Default")
+        default.set("Extension", extension)
+        default.set("ContentType", MEDIA_CONTENT_TYPES[extension])
+        root.insert(0, default)
+    for index in range(1, count + 1):
+        override = etree.SubElement(root, f"{{{CT_NS}}}Override")
+        override.set("PartName", f"/ppt/slides/slide{index}.xml")
+        override.set("ContentType", SLIDE_CONTENT_TYPE)
+    for name in charts:
+        override = etree.SubElement(root, f"{{{CT_NS}}}Override")
+        override.set("PartName", "/" + name)
+        override.set("ContentType", CHART_CONTENT_TYPE)
+    return _serialize(root)
+
+
+def _add_presentation_rels(blob, count):
+    root = etree.fromstring(blob)
+    used = {rel.get("Id") for rel in root}
+    next_id = len(used) + 1
+    rel_ids = []
+    for index in range(1, count + 1):
+        while f"rId{next_id}" in used:
+            next_id += 1
+        rel_id = f"rId{next_id}"
+        used.add(rel_id)
+        rel = etree.SubElement(root, f"{{{PKG_REL_NS}}}Relationship")
+        rel.set("Id", rel_id)
+        rel.set("Type", SLIDE_RELTYPE)
+        rel.set("Target", f"slides/slide{index}.xml")
+        rel_ids.append(rel_id)
+    return _serialize(root), rel_ids
+
+
+def _add_slide_id_list(blob, rel_ids):
+    root = etree.fromstring(blob)
+    for old in root.findall(f"{{{P_NS}}}sldIdLst"):
+        root.remove(old)
+    sld_id_lst = etree.Element(f"{{{P_NS}}}sldIdLst")
+    for index, rel_id in enumerate(rel_ids):
+        sld_id = etree.SubElement(sld_id_lst, f"{{{P_NS}}}sldId")
+        sld_id.set("id", str(256 + index))
+        sld_id.set(f"{{{R_NS}}}id", rel_id)
+
+    successor = next((child for child in root
+                      if etree.QName(child).localname in _AFTER_SLD_ID_LST), None)
+    if successor is None:
+        root.append(sld_id_lst)
+    else:
+        successor.addprevious(sld_id_lst)
+    return _serialize(root)
+
+
+def write_package(path, skeleton, slides):
+    """
+    Write `skeleton` plus the (slide_xml, rels_xml, media) parts from `slides` to `path`.
+
+    `slides` may be any iterable; each slide part is compressed into the zip
+    as soon as it is produced, and each media part the first time a slide
+    uses it. The parts that list the slides ([Content_Types].xml,
+    presentation.xml and its rels) are written last. Returns the number of
+    slides written.
+    """
+    listing_parts = (CONTENT_TYPES_PART, PRESENTATION_PART, PRESENTATION_RELS_PART)
+    written_media = set()
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as package:
+        count = 0
+        for count, (slide_xml, rels_xml, media) in enumerate(slides, 1):
+            package.writestr(_entry(f"ppt/slides/slide{count}.xml"), slide_xml)
+            package.writestr(_entry(f"ppt/slides/_rels/slide{count}.xml.rels"), rels_xml)
+            for name, blob in media:
+                if name not in written_media:
+                    written_media.add(name)
+                    # Images and workbooks are already compressed; deflating them again only costs time
+                    compressed = name.endswith((".xml", ".rels"))
+                    package.writestr(_entry(name, zipfile.ZIP_DEFLATED if compressed else zipfile.ZIP_STORED), blob)
+
+        for name, blob in skeleton.items():
+            if name not in listing_parts:
+                package.writestr(_entry(name), blob)
+
+        rels_xml, rel_ids = _add_presentation_rels(skeleton[PRESENTATION_RELS_PART], count)
+        package.writestr(_entry(PRESENTATION_PART), _add_slide_id_list(skeleton[PRESENTATION_PART], rel_ids))
+        package.writestr(_entry(PRESENTATION_RELS_PART), rels_xml)
+        extensions = {name.rsplit(".", 1)[1].lower() for name in written_media} - {"xml", "rels"}
+        charts = sorted(name for name in written_media if name.startswith("ppt/charts/") and name.endswith(".xml"))
+        package.writestr(_entry(CONTENT_TYPES_PART),
+                         _add_content_types(skeleton[CONTENT_TYPES_PART], count, extensions, charts))
+    return count
@@ -0,0 +1,843 @@
+#!/usr/bin/env python3
+"""
+SVG/HTML preview of a deck, for review without PowerPoint
+Usage: python deck_preview.py pitch-deck.md -o preview/ -j 8
+
+Every slide spec is rendered by the same add_*_slide helpers as the .pptx
+and its DrawingML (text boxes, autoshapes, connectors, freeforms, tables,
+pictures and charts) is drawn as one lightweight SVG page; index.html
+shows the pages in deck order and opens in any browser or CI artifact
+viewer.
+
+Pages are named by their content hash and indexed by the same slide key
+as incremental builds, so a rebuild only renders the slides whose source
+changed; those are rendered in parallel worker processes. Master
+templates are not previewed: pages show the inline (Blank layout) styling.
+"""
+
+import argparse
+import base64
+import hashlib
+import html
+import json
+import math
+import os
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+
+from deck_markdown import DEFAULT_DRAWIO_SOURCE, DEFAULT_MERMAID_SOURCE, DEFAULT_SOURCE
+from deck_styles import DEFAULT_THEME, THEMES
+from deck_textfit import LINE_SPACING, text_width
+
+DEFAULT_PREVIEW_DIR = "preview"
+INDEX_FILE = "index.json"
+PAGE_WIDTH = 960  # px the pages are drawn at in index.html
+PREVIEW_SHARD_SIZE = 50  # specs rendered per worker task
+
+EMU_PER_POINT = 12700
+SLIDE_SIZE = (720, 540)  # 10 x 7.5 in, in points (the SVG user unit)
+FONT_FAMILY = "Calibri, Carlito, 'Segoe UI', Arial, sans-serif"
+DEFAULT_FONT_SIZE = 18
+
+# Text frame insets in points when a:bodyPr does not set them, and table cell margins
+BODY_INSETS = {"lIns": 7.2, "tIns": 3.6, "rIns": 7.2, "bIns": 3.6}
+CELL_MARGINS = {"marL": 7.2, "marT": 3.6, "marR": 7.2, "marB": 3.6}
+
+# Office theme colors used where a shape relies on its p:style instead of explicit formatting
+SHAPE_FILL = "4472C4"
+SHAPE_LINE = "2F528F"
+SHAPE_TEXT = "FFFFFF"
+CONNECTOR_LINE = "4472C4"
+# Medium Style 2 - Accent 1, python-pptx's default table style
+TABLE_HEADER_FILL = "4472C4"
+TABLE_BAND_FILLS = ("CFD5EA", "E9EBF5")
+TABLE_BORDER = "FFFFFF"
+
+CHART_GRID = "D9D9D9"
+CHART_AXIS = "8C8C8C"
+CHART_MARGINS = (48, 12, 14, 28)  # left, top, right, bottom of the plot inside the chart frame
+CHART_LEGEND_HEIGHT = 22
+CHART_MAX_LABELS = 12  # category labels drawn along an axis; the rest are skipped evenly
+DASHES = {"dash": "4 3", "sysDash": "3 1", "dot": "1 2", "sysDot": "1 1", "lgDash": "8 3", "dashDot": "4 3 1 3"}
+
+NS = {
+    "a": "http://schemas.openxmlformats.org/drawingml/2006/main",
+    "p": "http://schemas.openxmlformats.org/presentationml/2006/main",
+    "r": "http://schemas.openxmlformats.org/officeDocument/2006/relationships",
+    "c": "http://schemas.openxmlformats.org/drawingml/2006/chart",
+}
+
+
+def _q(tag):
+    """Clark name of a prefixed tag such as 'a:off'"""
+    prefix, name = tag.split(":")
+    return f"{{{NS[prefix]}}}{name}"
+
+
+def _find(element, path):
+    return None if element is None else element.find(path, NS)
+
+
+def _pt(emu):
+    return int(emu) / EMU_PER_POINT
+
+
+def _num(value):
+    """Compact SVG number: at most one decimal, no trailing zero"""
+    text = f"{value:.1f}"
+    return text[:-2] if text.endswith(".0") else text
+
+
+def _color(parent, default=None):
+    """'#RRGGBB' of the a:solidFill/a:srgbClr under `parent`; 'none' for a:noFill; else `default`"""
+    if parent is None:
+        return default
+    if _find(parent, "a:noFill") is not None:
+        return "none"
+    color = _find(parent, "a:solidFill/a:srgbClr")
+    return f"#{color.get('val')}" if color is not None else default
+
+
+def _xfrm(element):
+    """(x, y, cx, cy) in points and the xfrm element of a shape, picture or graphic frame"""
+    xfrm = _find(element, "p:spPr/a:xfrm")
+    if xfrm is None:
+        xfrm = _find(element, "p:xfrm")
+    if xfrm is None:
+        return None, None
+    off, ext = _find(xfrm, "a:off"), _find(xfrm, "a:ext")
+    return (_pt(off.get("x")), _pt(off.get("y")), _pt(ext.get("cx")), _pt(ext.get("cy"))), xfrm
+
+
+class SvgPage:
+    """One slide drawn as SVG elements, with marker definitions for arrowheads"""
+
+    def __init__(self):
+        self.body = []
+        self.markers = {}
+
+    def add(self, element):
+        self.body.append(element)
+
+    def marker(self, color):
+        """id of a triangle arrowhead marker in `color`"""
+        marker_id = self.markers.get(color)
+        if marker_id is None:
+            marker_id = self.markers[color] = f"arrow{len(self.markers)}"
+        return marker_id
+
+    def svg(self, background):
+        width, height = SLIDE_SIZE
+        defs = "".join(
+            f'<marker id="{marker_id}" viewBox="0 0 10 10" refX="9" refY="5" markerWidth="4" markerHeight="4" '
+            f'orient="auto-start-reverse"><path d="M0 0L10 5L0 10z" fill="{color}"/></marker>'
+            for color, marker_id in self.markers.items())
+        return (f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {width} {height}" '
+                f'font-family="{FONT_FAMILY}">' + (f"<defs>{defs}</defs>" if defs else "")
+                + f'<rect width="{width}" height="{height}" fill="{background}"/>'
+                + "".join(self.body) + "</svg>")
+
+
+# Text ---------------------------------------------------------------------------------------------
+
+def wrap_text(text, width, size):
+    """Lines of `text` greedily wrapped to `width` points, as deck_textfit measures them"""
+    if width <= 0:
+        return [text]
+    lines, line = [], ""
+    space = text_width(" ", size=size)
+    line_width = 0.0
+    for word in text.split(" "):
+        word_width = text_width(word, size=size)
+        if line and line_width + space + word_width > width:
+            lines.append(line)
+            line, line_width = "", 0.0
+        while word_width > width and len(word) > 1:
+            # A single word wider than the box breaks across lines on its own
+            cut = max(1, int(len(word) * width / word_width))
+            lines.append((line + " " if line else "") + word[:cut])
+            line, line_width = "", 0.0
+            word = word[cut:]
+            word_width = text_width(word, size=size)
+        line = f"{line} {word}" if line else word
+        line_width += (space if line_width else 0.0) + word_width
+    lines.append(line)
+    return lines
+
+
+def _paragraph_style(p, default_color):
+    """(size, bold, italic, color, align, space_before) of an a:p from its run or default properties"""
+    pPr = _find(p, "a:pPr")
+    sources = [_find(p, "a:r/a:rPr"), _find(pPr, "a:defRPr"), _find(p, "a:endParaRPr")]
+    size = next((int(rPr.get("sz")) / 100 for rPr in sources if rPr is not None and rPr.get("sz")),
+                DEFAULT_FONT_SIZE)
+    bold = next((rPr.get("b") in ("1", "true") for rPr in sources if rPr is not None and rPr.get("b")), False)
+    italic = next((rPr.get("i") in ("1", "true") for rPr in sources if rPr is not None and rPr.get("i")), False)
+    color = next((_color(rPr) for rPr in sources if _color(rPr) not in (None, "none")), default_color)
+    spacing = _find(pPr, "a:spcBef/a:spcPts")
+    space_before = int(spacing.get("val")) / 100 if spacing is not None else 0
+    align = pPr.get("algn", "l") if pPr is not None else "l"
+    return size, bold, italic, color, align, space_before
+
+
+def _paragraph_text(p):
+    return "".join("\n" if child.tag == _q("a:br") else (child.findtext("a:t", "", NS))
+                   for child in p if child.tag in (_q("a:r"), _q("a:br"), _q("a:fld")))
+
+
+def draw_text(page, txBody, box, default_color="#000000", insets=None, anchor=None, wrap=None):
+    """Draw the paragraphs of a p:txBody / a:txBody inside `box` (x, y, cx, cy in points)"""
+    bodyPr = _find(txBody, "a:bodyPr")
+    bodyPr_get = bodyPr.get if bodyPr is not None else {}.get
+    if insets is None:
+        insets = [_pt(bodyPr_get(name)) if bodyPr_get(name) else default for name, default in BODY_INSETS.items()]
+    left, top, right, bottom = insets
+    x, y, cx, cy = box
+    width = cx - left - right
+    wrap = bodyPr_get("wrap") != "none" if wrap is None else wrap
+
+    lines = []  # (text, size, bold, italic, color, align, top offset)
+    height = 0.0
+    for p in txBody.findall("a:p", NS):
+        size, bold, italic, color, align, space_before = _paragraph_style(p, default_color)
+        height += space_before
+        for text in _paragraph_text(p).split("\n"):
+            for line in (wrap_text(text, width, size) if wrap else [text]):
+                lines.append((line, size, bold, italic, color, align, height))
+                height += size * LINE_SPACING
+
+    anchor = anchor or bodyPr_get("anchor", "t")
+    inner_height = cy - top - bottom
+    offset = y + top + {"ctr": (inner_height - height) / 2, "b": inner_height - height}.get(anchor, 0)
+    for text, size, bold, italic, color, align, line_top in lines:
+        if not text.strip():
+            continue
+        if align == "ctr":
+            tx, text_anchor = x + left + width / 2, "middle"
+        elif align == "r":
+            tx, text_anchor = x + cx - right, "end"
+        else:
+            tx, text_anchor = x + left, None
+        # Baseline about 0.8 em below the top of the line box
+        attributes = f'x="{_num(tx)}" y="{_num(offset + line_top + size * (LINE_SPACING - 0.2))}" ' \
+                     f'font-size="{_num(size)}" fill="{color}"'
+        if text_anchor:
+            attributes += f' text-anchor="{text_anchor}"'
+        if bold:
+            attributes += ' font-weight="bold"'
+        if italic:
+            attributes += ' font-style="italic"'
+        page.add(f'<text {attributes} xml:space="preserve">{html.escape(text, quote=False)}</text>')
+
+
+# Shapes -------------------------------------------------------------------------------------------
+
+def _polygon(points):
+    return "M" + "L".join(f"{_num(px)} {_num(py)}" for px, py in points) + "Z"
+
+
+def _geometry_path(prst, x, y, cx, cy):
+    """SVG path data of preset geometry `prst` in the box; None draws a rectangle"""
+    right, bottom, mid_x, mid_y = x + cx, y + cy, x + cx / 2, y + cy / 2
+    if prst == "roundRect":
+        r = min(cx, cy) * 0.1667
+        return (f"M{_num(x + r)} {_num(y)}H{_num(right - r)}A{_num(r)} {_num(r)} 0 0 1 {_num(right)} {_num(y + r)}"
+                f"V{_num(bottom - r)}A{_num(r)} {_num(r)} 0 0 1 {_num(right - r)} {_num(bottom)}H{_num(x + r)}"
+                f"A{_num(r)} {_num(r)} 0 0 1 {_num(x)} {_num(bottom - r)}V{_num(y + r)}"
+                f"A{_num(r)} {_num(r)} 0 0 1 {_num(x + r)} {_num(y)}Z")
+    if prst in ("ellipse", "cloud"):
+        rx, ry = cx / 2, cy / 2
+        return (f"M{_num(x)} {_num(mid_y)}A{_num(rx)} {_num(ry)} 0 1 0 {_num(right)} {_num(mid_y)}"
+                f"A{_num(rx)} {_num(ry)} 0 1 0 {_num(x)} {_num(mid_y)}Z")
+    if prst == "diamond":
+        return _polygon([(mid_x, y), (right, mid_y), (mid_x, bottom), (x, mid_y)])
+    if prst == "triangle":
+        return _polygon([(mid_x, y), (right, bottom), (x, bottom)])
+    if prst == "hexagon":
+        inset = min(cx, cy) * 0.25
+        return _polygon([(x + inset, y), (right - inset, y), (right, mid_y), (right - inset, bottom),
+                         (x + inset, bottom), (x, mid_y)])
+    if prst == "parallelogram":
+        inset = min(cx, cy) * 0.25
+        return _polygon([(x + inset, y), (right, y), (right - inset, bottom), (x, bottom)])
+    if prst == "homePlate":
+        inset = min(cx, cy) * 0.5
+        return _polygon([(x, y), (right - inset, y), (right, mid_y), (right - inset, bottom), (x, bottom)])
+    if prst == "chevron":
+        inset = min(cx, cy) * 0.5
+        return _polygon([(x, y), (right - inset, y), (right, mid_y), (right - inset, bottom), (x, bottom),
+                         (x + inset, mid_y)])
+    if prst == "downArrow":
+        shaft, head = cx * 0.25, y + cy * 0.5
+        return _polygon([(x + shaft, y), (right - shaft, y), (right - shaft, head), (right, head), (mid_x, bottom),
+                         (x, head), (x + shaft, head)])
+    if prst == "rightArrow":
+        shaft, head = cy * 0.25, x + cx * 0.5
+        return _polygon([(x, y + shaft), (head, y + shaft), (head, y), (right, mid_y), (head, bottom),
+                         (head, bottom - shaft), (x, bottom - shaft)])
+    if prst == "can":
+        ry = min(cy * 0.25, cx * 0.25)
+        return (f"M{_num(x)} {_num(y + ry)}A{_num(cx / 2)} {_num(ry)} 0 0 1 {_num(right)} {_num(y + ry)}"
+                f"V{_num(bottom - ry)}A{_num(cx / 2)} {_num(ry)} 0 0 1 {_num(x)} {_num(bottom - ry)}Z"
+                f"M{_num(x)} {_num(y + ry)}A{_num(cx / 2)} {_num(ry)} 0 0 0 {_num(right)} {_num(y + ry)}")
+    if prst == "flowChartDocument":
+        wave = cy * 0.17
+        return (f"M{_num(x)} {_num(y)}H{_num(right)}V{_num(bottom - wave)}"
+                f"C{_num(right - cx * 0.25)} {_num(bottom - wave * 2)} {_num(x + cx * 0.5)} {_num(bottom + wave)} "
+                f"{_num(x)} {_num(bottom - wave / 2)}Z")
+    if prst == "flowChartPredefinedProcess":
+        inset = cx * 0.125
+        return (f"M{_num(x)} {_num(y)}H{_num(right)}V{_num(bottom)}H{_num(x)}Z"
+                f"M{_num(x + inset)} {_num(y)}V{_num(bottom)}M{_num(right - inset)} {_num(y)}V{_num(bottom)}")
+    return None
+
+
+def _custom_path(custGeom, x, y, cx, cy):
+    """SVG path data of an a:custGeom freeform scaled into the box"""
+    data = []
+    for path in custGeom.findall("a:pathLst/a:path", NS):
+        scale_x = cx / int(path.get("w") or 1) if int(path.get("w") or 0) else 1 / EMU_PER_POINT
+        scale_y = cy / int(path.get("h") or 1) if int(path.get("h") or 0) else 1 / EMU_PER_POINT
+        for command in path:
+            point = _find(command, "a:pt")
+            if command.tag == _q("a:close"):
+                data.append("Z")
+            elif point is not None:
+                letter = "M" if command.tag == _q("a:moveTo") else "L"
+                data.append(f"{letter}{_num(x + int(point.get('x')) * scale_x)} "
+                            f"{_num(y + int(point.get('y')) * scale_y)}")
+    return "".join(data)
+
+
+def _stroke(page, spPr, default_color=None, default_width=0.75):
+    """SVG stroke attributes of a spPr's a:ln (with arrowhead markers)"""
+    ln = _find(spPr, "a:ln")
+    color = _color(ln, default_color) if ln is not None else default_color
+    if not color or color == "none":
+        return ' stroke="none"'
+    width = _pt(ln.get("w")) if ln is not None and ln.get("w") else default_width
+    attributes = f' stroke="{color}" stroke-width="{_num(max(width, 0.25))}"'
+    dash = _find(ln, "a:prstDash")
+    if dash is not None and dash.get("val") in DASHES:
+        attributes += f' stroke-dasharray="{DASHES[dash.get("val")]}"'
+    for end, attribute in (("a:headEnd", "marker-start"), ("a:tailEnd", "marker-end")):
+        marker = _find(ln, end)
+        if marker is not None and marker.get("type", "none") != "none":
+            attributes += f' {attribute}="url(#{page.marker(color)})"'
+    return attributes
+
+
+def _transform(xfrm, box):
+    """rotate()/flip transform attribute of an a:xfrm about the box center"""
+    x, y, cx, cy = box
+    center_x, center_y = x + cx / 2, y + cy / 2
+    steps = []
+    rotation = int(xfrm.get("rot", 0)) / 60000
+    if rotation:
+        steps.append(f"rotate({_num(rotation)} {_num(center_x)} {_num(center_y)})")
+    flip_x, flip_y = xfrm.get("flipH") == "1", xfrm.get("flipV") == "1"
+    if flip_x or flip_y:
+        steps.append(f"translate({_num(center_x)} {_num(center_y)}) scale({-1 if flip_x else 1} {-1 if flip_y else 1}) "
+                     f"translate({_num(-center_x)} {_num(-center_y)})")
+    return f' transform="{" ".join(steps)}"' if steps else ""
+
+
+def draw_shape(page, sp):
+    """Draw a p:sp: its geometry, fill and outline, then its text"""
+    box, xfrm = _xfrm(sp)
+    if box is None:
+        return
+    spPr = _find(sp, "p:spPr")
+    styled = _find(sp, "p:style") is not None
+    fill = _color(spPr, SHAPE_FILL if styled else "none")
+    stroke = _stroke(page, spPr, SHAPE_LINE if styled else None)
+    custGeom = _find(spPr, "a:custGeom")
+    if custGeom is not None:
+        data = _custom_path(custGeom, *box)
+    else:
+        prstGeom = _find(spPr, "a:prstGeom")
+        data = _geometry_path(prstGeom.get("prst") if prstGeom is not None else "rect", *box)
+    if fill != "none" or stroke != ' stroke="none"':
+        transform = _transform(xfrm, box)
+        if data is None:
+            x, y, cx, cy = box
+            page.add(f'<rect x="{_num(x)}" y="{_num(y)}" width="{_num(cx)}" height="{_num(cy)}" '
+                     f'fill="{fill}"{stroke}{transform}/>')
+        else:
+            page.add(f'<path d="{data}" fill="{fill}"{stroke}{transform}/>')
+    txBody = _find(sp, "p:txBody")
+    if txBody is not None:
+        draw_text(page, txBody, box, f"#{SHAPE_TEXT}" if styled else "#000000")
+
+
+def draw_connector(page, cxnSp):
+    """Draw a p:cxnSp straight connector as a line between its box corners"""
+    box, xfrm = _xfrm(cxnSp)
+    if box is None:
+        return
+    x, y, cx, cy = box
+    x1, x2 = (x + cx, x) if xfrm.get("flipH") == "1" else (x, x + cx)
+    y1, y2 = (y + cy, y) if xfrm.get("flipV") == "1" else (y, y + cy)
+    styled = _find(cxnSp, "p:style") is not None
+    stroke = _stroke(page, _find(cxnSp, "p:spPr"), CONNECTOR_LINE if styled else None)
+    page.add(f'<line x1="{_num(x1)}" y1="{_num(y1)}" x2="{_num(x2)}" y2="{_num(y2)}"{stroke}/>')
+
+
+def draw_picture(page, pic, part):
+    """Draw a p:pic as an <image> carrying its picture part as a data URI"""
+    box, _ = _xfrm(pic)
+    blip = _find(pic, "p:blipFill/a:blip")
+    if box is None or blip is None:
+        return
+    image = part.related_part(blip.get(_q("r:embed")))
+    data = base64.b64encode(image.blob).decode("ascii")
+    x, y, cx, cy = box
+    page.add(f'<image x="{_num(x)}" y="{_num(y)}" width="{_num(cx)}" height="{_num(cy)}" '
+             f'preserveAspectRatio="none" href="data:{image.content_type};base64,{data}"/>')
+
+
+def draw_table(page, tbl, box):
+    """Draw an a:tbl: rows grow to fit their text, as PowerPoint lays them out"""
+    x, y, _, _ = box
+    widths = [_pt(column.get("w")) for column in tbl.findall("a:tblGrid/a:gridCol", NS)]
+    tblPr = _find(tbl, "a:tblPr")
+    first_row = tblPr is not None and tblPr.get("firstRow") == "1"
+    banded = tblPr is not None and tblPr.get("bandRow") == "1"
+
+    top = y
+    for row_index, tr in enumerate(tbl.findall("a:tr", NS)):
+        cells = tr.findall("a:tc", NS)
+        header = first_row and row_index == 0
+        heights = [_pt(tr.get("h"))]
+        for tc, width in zip(cells, widths):
+            tcPr = _find(tc, "a:tcPr")
+            margins = [_pt(tcPr.get(name)) if tcPr is not None and tcPr.get(name) else default
+                       for name, default in CELL_MARGINS.items()]
+            txBody = _find(tc, "a:txBody")
+            text_height = 0.0
+            for p in txBody.findall("a:p", NS) if txBody is not None else ():
+                size = _paragraph_style(p, None)[0]
+                inner = width - margins[0] - margins[2]
+                text_height += sum(len(wrap_text(text, inner, size)) for text in _paragraph_text(p).split("\n")) \
+                    * size * LINE_SPACING
+            heights.append(text_height + margins[1] + margins[3])
+        height = max(heights)
+
+        left = x
+        for tc, width in zip(cells, widths):
+            tcPr = _find(tc, "a:tcPr")
+            if header:
+                default_fill = f"#{TABLE_HEADER_FILL}"
+            else:
+                band = (row_index - first_row) % 2 if banded else 1
+                default_fill = f"#{TABLE_BAND_FILLS[band]}"
+            fill = _color(tcPr, default_fill)
+            page.add(f'<rect x="{_num(left)}" y="{_num(top)}" width="{_num(width)}" height="{_num(height)}" '
+                     f'fill="{fill}" stroke="#{TABLE_BORDER}"/>')
+            txBody = _find(tc, "a:txBody")
+            if txBody is not None:
+                margins = [_pt(tcPr.get(name)) if tcPr is not None and tcPr.get(name) else default
+                           for name, default in CELL_MARGINS.items()]
+                draw_text(page, txBody, (left, top, width, height), "#FFFFFF" if header else "#000000",
+                          insets=margins, anchor=tcPr.get("anchor", "t") if tcPr is not None else "t", wrap=True)
+            left += width
+        top += height
+
+
+# Charts -------------------------------------------------------------------------------------------
+
+def _cached_values(parent, numeric=True):
+    """Values of a c:cat / c:val / c:xVal / c:yVal cache, by point index"""
+    if parent is None:
+        return []
+    cache = _find(parent, "c:numRef/c:numCache") if numeric else None
+    if cache is None:
+        cache = _find(parent, "c:strRef/c:strCache")
+    if cache is None:
+        cache = _find(parent, "c:numRef/c:numCache")
+    if cache is None:
+        return []
+    count = int(_find(cache, "c:ptCount").get("val"))
+    values = [None] * count
+    for pt in cache.findall("c:pt", NS):
+        text = pt.findtext("c:v", "", NS)
+        values[int(pt.get("idx"))] = float(text) if numeric else text
+    return values
+
+
+def _nice_ticks(low, high, count=5):
+    """Round axis tick values spanning low..high"""
+    if low == high:
+        low, high = (low - 1, high + 1) if low else (0, 1)
+    step = (high - low) / count
+    magnitude = 10 ** math.floor(math.log10(step))
+    step = next(factor * magnitude for factor in (1, 2, 2.5, 5, 10) if factor * magnitude >= step)
+    start = math.floor(low / step) * step
+    ticks = []
+    value = start
+    while value < high + step * 0.999:
+        ticks.append(round(value, 10))
+        value += step
+    return ticks
+
+
+def _tick_label(value):
+    return f"{value:,.0f}" if abs(value) >= 1000 or value == int(value) else f"{value:g}"
+
+
+def _series(plot, xy):
+    """(name, color, xs, ys, markers) of each c:ser in a chart plot; `markers` when it has no line"""
+    series = []
+    for index, ser in enumerate(plot.findall("c:ser", NS)):
+        names = _cached_values(_find(ser, "c:tx"), numeric=False)
+        spPr = _find(ser, "c:spPr")
+        line = _color(_find(spPr, "a:ln"))
+        color = line if line not in (None, "none") else _color(spPr)
+        if color in (None, "none"):
+            color = _color(_find(ser, "c:marker/c:spPr"), f"#{SHAPE_FILL}")
+        if xy:
+            xs, ys = _cached_values(_find(ser, "c:xVal")), _cached_values(_find(ser, "c:yVal"))
+        else:
+            ys = _cached_values(_find(ser, "c:val"))
+            xs = list(range(len(ys)))
+        series.append((names[0] if names else f"Series {index + 1}", color, xs, ys, line == "none"))
+    return series
+
+
+def draw_chart(page, chart_space, box):
+    """Draw the first plot of a c:chartSpace: line, area, column/bar or scatter, with axes and legend"""
+    x, y, cx, cy = box
+    plot_area = _find(chart_space, "c:chart/c:plotArea")
+    plot = next((child for child in plot_area if child.tag in
+                 (_q("c:lineChart"), _q("c:barChart"), _q("c:areaChart"), _q("c:scatterChart"))), None)
+    if plot is None:
+        return
+    kind = plot.tag.split("}")[1]
+    xy = kind == "scatterChart"
+    horizontal = kind == "barChart" and _find(plot, "c:barDir").get("val") == "bar"
+    series = _series(plot, xy)
+    first_ser = _find(plot, "c:ser")
+    categories = [] if xy else _cached_values(_find(first_ser, "c:cat"), numeric=False)
+    text_size = _paragraph_style(_find(chart_space, "c:txPr/a:p"), "#404040")
+    size, color = text_size[0], text_size[3]
+    legend = _find(chart_space, "c:chart/c:legend") is not None
+
+    left, top, right, bottom = CHART_MARGINS
+    plot_x, plot_y = x + left, y + top
+    plot_w = cx - left - right
+    plot_h = cy - top - bottom - (CHART_LEGEND_HEIGHT if legend else 0)
+    values = [value for _, _, _, ys, _ in series for value in ys if value is not None]
+    if not values:
+        return
+    low, high = min(values), max(values)
+    if kind in ("barChart", "areaChart") or low > 0 and low < (high - low) * 0.5:
+        low = min(low, 0)
+    ticks = _nice_ticks(low, high)
+    low, high = ticks[0], ticks[-1]
+
+    def value_position(value):
+        fraction = (value - low) / (high - low)
+        return plot_x + fraction * plot_w if horizontal else plot_y + plot_h - fraction * plot_h
+
+    count = max((len(ys) for _, _, _, ys, _ in series), default=0)
+    if xy:
+        all_xs = [value for _, _, xs, _, _ in series for value in xs if value is not None]
+        x_ticks = _nice_ticks(min(all_xs), max(all_xs))
+
+        def x_position(value):
+            return plot_x + (value - x_ticks[0]) / (x_ticks[-1] - x_ticks[0]) * plot_w
+    else:
+        slot = (plot_h if horizontal else plot_w) / max(count, 1)
+
+        def x_position(index):
+            return (plot_y if horizontal else plot_x) + (index + 0.5) * slot
+
+    # Gridlines and value axis labels
+    for tick in ticks:
+        position = value_position(tick)
+        if horizontal:
+            page.add(f'<line x1="{_num(position)}" y1="{_num(plot_y)}" x2="{_num(position)}" '
+                     f'y2="{_num(plot_y + plot_h)}" stroke="#{CHART_GRID}" stroke-width="0.5"/>')
+            page.add(f'<text x="{_num(position)}" y="{_num(plot_y + plot_h + size * 1.2)}" font-size="{_num(size)}" '
+                     f'fill="{color}" text-anchor="middle">{_tick_label(tick)}</text>')
+        else:
+            page.add(f'<line x1="{_num(plot_x)}" y1="{_num(position)}" x2="{_num(plot_x + plot_w)}" '
+                     f'y2="{_num(position)}" stroke="#{CHART_GRID}" stroke-width="0.5"/>')
+            page.add(f'<text x="{_num(plot_x - 4)}" y="{_num(position + size * 0.35)}" font-size="{_num(size)}" '
+                     f'fill="{color}" text-anchor="end">{_tick_label(tick)}</text>')
+
+    # Category or x axis labels
+    if xy:
+        labels = [(x_position(tick), _tick_label(tick)) for tick in x_ticks]
+    else:
+        every = max(1, math.ceil(len(categories) / CHART_MAX_LABELS))
+        labels = [(x_position(index), str(label or "")) for index, label in enumerate(categories)
+                  if index % every == 0]
+    for position, label in labels:
+        label = html.escape(label, quote=False)
+        if horizontal:
+            page.add(f'<text x="{_num(plot_x - 4)}" y="{_num(position + size * 0.35)}" font-size="{_num(size)}" '
+                     f'fill="{color}" text-anchor="end">{label}</text>')
+        else:
+            page.add(f'<text x="{_num(position)}" y="{_num(plot_y + plot_h + size * 1.2)}" '
+                     f'font-size="{_num(size)}" fill="{color}" text-anchor="middle">{label}</text>')
+    axis = (f"M{_num(plot_x)} {_num(plot_y)}V{_num(plot_y + plot_h)}" if horizontal
+            else f"M{_num(plot_x)} {_num(plot_y + plot_h)}H{_num(plot_x + plot_w)}")
+    page.add(f'<path d="{axis}" stroke="#{CHART_AXIS}" stroke-width="0.75" fill="none"/>')
+
+    # Series
+    baseline = value_position(max(low, min(0, high)))
+    for index, (_, series_color, xs, ys, markers) in enumerate(series):
+        points = [(x_position(px), value_position(py)) for px, py in zip(xs, ys)
+                  if px is not None and py is not None]
+        if kind == "barChart":
+            bar = slot * 0.7 / len(series)
+            for px, py in zip(xs, ys):
+                if py is None:
+                    continue
+                start = x_position(px) - slot * 0.35 + index * bar
+                end = value_position(py)
+                if horizontal:
+                    page.add(f'<rect x="{_num(min(baseline, end))}" y="{_num(start)}" width="{_num(abs(end - baseline))}" '
+                             f'height="{_num(bar)}" fill="{series_color}"/>')
+                else:
+                    page.add(f'<rect x="{_num(start)}" y="{_num(min(baseline, end))}" width="{_num(bar)}" '
+                             f'height="{_num(abs(end - baseline))}" fill="{series_color}"/>')
+        elif kind == "areaChart" and points:
+            outline = [(points[0][0], baseline)] + points + [(points[-1][0], baseline)]
+            page.add(f'<path d="{_polygon(outline)}" fill="{series_color}" fill-opacity="0.7"/>')
+        elif points:
+            if markers:
+                page.add("".join(f'<circle cx="{_num(px)}" cy="{_num(py)}" r="2.5" fill="{series_color}"/>'
+                                 for px, py in points))
+            else:
+                data = "M" + "L".join(f"{_num(px)} {_num(py)}" for px, py in points)
+                page.add(f'<path d="{data}" fill="none" stroke="{series_color}" stroke-width="2" '
+                         f'stroke-linejoin="round"/>')
+
+    if legend:
+        widths = [12 + text_width(name, size=size) + 16 for name, *_ in series]
+        legend_x = x + (cx - sum(widths)) / 2
+        legend_y = y + cy - CHART_LEGEND_HEIGHT / 2
+        for (name, series_color, *_), width in zip(series, widths):
+            page.add(f'<rect x="{_num(legend_x)}" y="{_num(legend_y - 4)}" width="8" height="8" fill="{series_color}"/>')
+            page.add(f'<text x="{_num(legend_x + 12)}" y="{_num(legend_y + size * 0.35)}" font-size="{_num(size)}" '
+                     f'fill="{color}">{html.escape(name, quote=False)}</text>')
+            legend_x += width
+
+
+def draw_graphic_frame(page, frame, part):
+    """Draw a p:graphicFrame holding a table or a chart"""
+    box, _ = _xfrm(frame)
+    graphic_data = _find(frame, "a:graphic/a:graphicData")
+    if box is None or graphic_data is None:
+        return
+    tbl = _find(graphic_data, "a:tbl")
+    if tbl is not None:
+        draw_table(page, tbl, box)
+        return
+    chart = _find(graphic_data, "c:chart")
+    if chart is not None:
+        draw_chart(page, part.related_part(chart.get(_q("r:id")))._element, box)
+
+
+def _page_title(spec, slide, index):
+    """Caption of the `index`th page of a spec: its title, or the slide's own title for built-in diagrams"""
+    if spec.kind == "diagram":
+        for p in slide.part._element.iterfind("p:cSld/p:spTree/p:sp/p:txBody/a:p", NS):
+            text = _paragraph_text(p).strip()
+            if text:
+                return text
+    return f"{spec.title} (cont.)" if index else spec.title
+
+
+def slide_svg(slide):
+    """SVG text of a rendered python-pptx slide"""
+    page = SvgPage()
+    part = slide.part
+    cSld = part._element.find("p:cSld", NS)
+    background = _color(_find(cSld, "p:bg/p:bgPr"), "#FFFFFF")
+    for shape in _find(cSld, "p:spTree"):
+        if shape.tag == _q("p:sp"):
+            draw_shape(page, shape)
+        elif shape.tag == _q("p:cxnSp"):
+            draw_connector(page, shape)
+        elif shape.tag == _q("p:pic"):
+            draw_picture(page, shape, part)
+        elif shape.tag == _q("p:graphicFrame"):
+            draw_graphic_frame(page, shape, part)
+    return page.svg(background)
+
+
+# Rendering and caching ----------------------------------------------------------------------------
+
+def render_pages(specs):
+    """[(title, svg), ...] per spec: each rendered by the deck helpers into a scratch presentation"""
+    from deck_package import drop_slides
+    from deck_render import new_presentation, plan_layouts, render_slide
+
+    scratch = new_presentation()
+    pages = []
+    for spec in plan_layouts(specs):
+        slides = render_slide(scratch, spec)
+        pages.append([(_page_title(spec, slide, index), slide_svg(slide)) for index, slide in enumerate(slides)])
+        drop_slides(scratch)
+    return pages
+
+
+def _render_shard(specs, theme):
+    """Worker task of build_preview(): the pages of one shard of specs"""
+    import deck_styles
+
+    deck_styles.use_theme(theme)
+    return render_pages(specs)
+
+
+def preview_fingerprint():
+    """style_fingerprint() of the deck renderer, plus this module's own source"""
+    from deck_render import style_fingerprint
+
+    hasher = hashlib.sha256(style_fingerprint().encode("utf-8"))
+    with open(__file__, "rb") as handle:
+        hasher.update(handle.read())
+    return hasher.hexdigest()
+
+
+def _write_atomic(path, data):
+    tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as handle:
+        handle.write(data)
+    os.replace(tmp_path, path)
+
+
+def write_index_html(directory, pages, title):
+    """Write index.html listing `pages` ((file, title) in deck order) as lazily loaded images"""
+    figures = "\n".join(
+        f'<figure id="slide-{number}"><a href="pages/{name}"><img src="pages/{name}" loading="lazy" '
+        f'width="{PAGE_WIDTH}" height="{PAGE_WIDTH * SLIDE_SIZE[1] // SLIDE_SIZE[0]}" alt=""></a>'
+        f'<figcaption>{number}. {html.escape(page_title)}</figcaption></figure>'
+        for number, (name, page_title) in enumerate(pages, 1))
+    _write_atomic(os.path.join(directory, "index.html"), f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>{html.escape(title)} - preview</title>
+<style>
+body {{ margin: 0; padding: 24px; background: #2b2b2b; font-family: {FONT_FAMILY}; color: #eee; }}
+h1 {{ font-size: 20px; font-weight: normal; }}
+figure {{ margin: 0 auto 32px; width: {PAGE_WIDTH}px; max-width: 100%; }}
+img {{ display: block; width: 100%; height: auto; box-shadow: 0 2px 12px #0008; background: #fff; }}
+figcaption {{ padding-top: 6px; font-size: 13px; color: #bbb; }}
+</style>
+</head>
+<body>
+<h1>{html.escape(title)} &middot; {len(pages)} slides</h1>
+{figures}
+</body>
+</html>
+""")
+
+
+def build_preview(source=DEFAULT_SOURCE, output_dir=DEFAULT_PREVIEW_DIR, diagrams=True, mermaid=None, drawio=None,
+                  theme=None, results=None, workers=None):
+    """
+    Write the SVG pages and index.html previewing a deck; returns (pages, rendered_pages).
+
+    Pages are files named by the hash of their SVG under `output_dir`/pages,
+    and index.json maps each spec's slide key to its pages, so only specs
+    whose source (or the theme, or the renderer) changed are rendered
+    again - by `workers` processes when there are enough of them.
+    Pages no longer in the deck are removed.
+    """
+    import deck_styles
+    from deck_cache import slide_key
+    from deck_render import iter_deck_specs
+
+    if theme:
+        deck_styles.use_theme(theme)
+    pages_dir = os.path.join(output_dir, "pages")
+    os.makedirs(pages_dir, exist_ok=True)
+    index_path = os.path.join(output_dir, INDEX_FILE)
+    try:
+        with open(index_path, encoding="utf-8") as handle:
+            cached = json.load(handle)["pages"]
+    except (FileNotFoundError, ValueError, KeyError):
+        cached = {}
+    existing = set(os.listdir(pages_dir))
+
+    fingerprint = preview_fingerprint()
+    keys, missing = [], []
+    for spec in iter_deck_specs(source, diagrams, mermaid, drawio, results):
+        key = slide_key(fingerprint, spec)
+        keys.append(key)
+        if key not in cached or not all(name in existing for name, _ in cached[key]):
+            cached.pop(key, None)
+            missing.append((key, spec))
+
+    # Specs not in the cache, rendered in shards; a small batch stays in this process
+    shards = [missing[start:start + PREVIEW_SHARD_SIZE] for start in range(0, len(missing), PREVIEW_SHARD_SIZE)]
+    if len(shards) > 1 and (workers is None or workers > 1):
+        theme_name = deck_styles.current_theme().name
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            rendered = pool.map(_render_shard, [[spec for _, spec in shard] for shard in shards],
+                                [theme_name] * len(shards))
+            results_by_shard = list(rendered)
+    else:
+        results_by_shard = [render_pages([spec for _, spec in shard]) for shard in shards]
+
+    rendered_pages = 0
+    for shard, shard_pages in zip(shards, results_by_shard):
+        for (key, _), spec_pages in zip(shard, shard_pages):
+            entries = []
+            for page_title, svg in spec_pages:
+                name = hashlib.sha1(svg.encode("utf-8")).hexdigest() + ".svg"
+                if name not in existing:
+                    _write_atomic(os.path.join(pages_dir, name), svg)
+                    existing.add(name)
+                entries.append((name, page_title))
+                rendered_pages += 1
+            cached[key] = entries
+
+    ordered = [entry for key in keys for entry in cached[key]]
+    live = {name for name, _ in ordered}
+    for name in existing - live:
+        os.remove(os.path.join(pages_dir, name))
+    title = ordered[0][1] if ordered else os.path.basename(str(source))
+    write_index_html(output_dir, ordered, title)
+    _write_atomic(index_path, json.dumps({"pages": {key: cached[key] for key in dict.fromkeys(keys)}}, indent=1))
+    return len(ordered), rendered_pages
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Preview a Markdown deck as SVG pages and an index.html")
+    parser.add_argument("source", nargs="?", default=DEFAULT_SOURCE, help="Markdown deck to preview")
+    parser.add_argument("-o", "--output-dir", default=DEFAULT_PREVIEW_DIR,
+                        help=f"directory for index.html and the pages (default: {DEFAULT_PREVIEW_DIR})")
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count(), help="worker processes")
+    parser.add_argument("--no-diagrams", action="store_true", help="skip the architecture diagram slides")
+    diagram_source = parser.add_mutually_exclusive_group()
+    diagram_source.add_argument("--mermaid", nargs="?", const=DEFAULT_MERMAID_SOURCE, metavar="PATH",
+                                help="diagram slides from the Mermaid flowcharts in PATH")
+    diagram_source.add_argument("--drawio", nargs="?", const=DEFAULT_DRAWIO_SOURCE, metavar="PATH",
+                                help="one diagram slide per page of the draw.io file PATH")
+    parser.add_argument("--results", nargs="+", metavar="PATH",
+                        help="add test result summary slides from JUnit XML / JSON results files")
+    parser.add_argument("--theme", choices=THEMES, default=DEFAULT_THEME,
+                        help=f"color theme for every slide (default: {DEFAULT_THEME})")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    try:
+        total, rendered = build_preview(args.source, args.output_dir, not args.no_diagrams, args.mermaid,
+                                        args.drawio, args.theme, args.results, args.workers)
+    except (OSError, ValueError) as e:
+        print(f"❌ Error creating preview: {e}")
+        return 1
+    print(f"🖼️  Preview: {os.path.join(args.output_dir, 'index.html')}")
+    print(f"♻️  Rendered {rendered} of {total} pages in {time.perf_counter() - started:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
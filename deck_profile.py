@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Opt-in per-slide profiling for deck builds
+A SlideProfiler times each add_*_slide helper call and prs.save(), and
+records shape count and XML size for every slide produced. Builds only
+touch it when a profiler is passed in, so the default path is unchanged.
+Results export as a JSON trace or a Chrome trace-event file
+(chrome://tracing, Perfetto).
+"""
+
+import json
+import os
+import time
+
+FORMATS = ("json", "chrome")
+
+
+def slide_stats(slide):
+    """Shape count and serialized XML size of one rendered slide"""
+    return {"shapes": len(slide.shapes), "xml_bytes": len(slide.part.blob)}
+
+
+class SlideProfiler:
+    """Collects one timed event per helper call during a build"""
+
+    def __init__(self):
+        self.events = []
+        self._origin = time.perf_counter()
+
+    def call(self, name, func, *args, **meta):
+        """Run func(*args), record its wall time under `name`; returns (result, event)"""
+        started = time.perf_counter()
+        result = func(*args)
+        ended = time.perf_counter()
+        event = {"name": name, "start": started - self._origin, "seconds": ended - started, **meta}
+        self.events.append(event)
+        return result, event
+
+    def add_slides(self, event, slides):
+        """Attach per-slide shape counts and XML sizes to a recorded event"""
+        event["slides"] = [slide_stats(slide) for slide in slides]
+
+    def summary(self):
+        """Totals per helper name, slowest first"""
+        totals = {}
+        for event in self.events:
+            total = totals.setdefault(event["name"], {"calls": 0, "seconds": 0.0, "slides": 0,
+                                                      "shapes": 0, "xml_bytes": 0})
+            total["calls"] += 1
+            total["seconds"] += event["seconds"]
+            for stats in event.get("slides", ()):
+                total["slides"] += 1
+                total["shapes"] += stats["shapes"]
+                total["xml_bytes"] += stats["xml_bytes"]
+        return dict(sorted(totals.items(), key=lambda item: -item[1]["seconds"]))
+
+    def to_json(self):
+        """The full trace: every event plus the per-helper summary"""
+        return {"events": self.events, "summary": self.summary()}
+
+    def to_chrome_trace(self):
+        """The events as complete ("X") Chrome trace events, in microseconds"""
+        pid = os.getpid()
+        trace = []
+        for event in self.events:
+            args = {key: value for key, value in event.items() if key not in ("name", "start", "seconds")}
+            trace.append({
+                "name": event["name"],
+                "cat": "deck",
+                "ph": "X",
+                "ts": round(event["start"] * 1e6, 3),
+                "dur": round(event["seconds"] * 1e6, 3),
+                "pid": pid,
+                "tid": 0,
+                "args": args,
+            })
+        return {"traceEvents": trace, "displayTimeUnit": "ms"}
+
+    def write(self, path, format="json"):
+        """Write the trace to `path` as "json" or "chrome" trace events"""
+        if format not in FORMATS:
+            raise ValueError(f"unknown profile format: {format}")
+        document = self.to_chrome_trace() if format == "chrome" else self.to_json()
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(document, handle, indent=2)
@@ -0,0 +1,1445 @@
+#!/usr/bin/env python3
+"""
+Render pitch deck slide specs to a PowerPoint presentation
+Requires: pip install python-pptx
+Imported lazily by convert_to_pptx.py, only when a deck is actually rendered.
+Colors and fonts come from the named styles of the active deck_styles theme.
+"""
+
+import hashlib
+import io
+import math
+import os
+import weakref
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from copy import deepcopy
+from datetime import datetime
+from functools import lru_cache
+from itertools import chain, islice
+
+from pptx import Presentation
+from pptx.chart.data import CategoryChartData, XyChartData
+from pptx.chart.xlsx import CategoryWorkbookWriter, XyWorkbookWriter
+from pptx.enum.chart import XL_CHART_TYPE, XL_LEGEND_POSITION
+from pptx.util import Inches, Pt, lazyproperty
+from pptx.enum.dml import MSO_LINE_DASH_STYLE
+from pptx.enum.shapes import MSO_CONNECTOR, MSO_SHAPE
+from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
+from pptx.dml.color import RGBColor
+from pptx.oxml.ns import qn
+
+import deck_chart
+import deck_drawio
+import deck_layout
+import deck_markdown
+import deck_media
+import deck_mermaid
+import deck_results
+import deck_styles
+import deck_template
+import deck_textfit
+import deck_xml
+from deck_cache import SlideCache, slide_key
+from deck_markdown import DEFAULT_SOURCE, SlideSpec, iter_slide_specs
+from deck_package import atomic_output, drop_slides, read_skeleton, save_presentation, slide_part, write_package
+from deck_textfit import EMU_PER_POINT, fit_font_size, paginate, paragraph_heights, scaled_spacing
+
+DEFAULT_OUTPUT = 'Agentic_Testing_Framework_Pitch_Deck.pptx'
+DEFAULT_TAGLINE = "Reducing Testing Costs by 80% While Improving Quality"
+
+# Rendering backends: "lxml" clones pre-styled XML fragments (deck_xml),
+# "proxy" goes through the python-pptx property setters
+BACKENDS = ("lxml", "proxy")
+DEFAULT_BACKEND = "lxml"
+
+# TextStyle.align values to python-pptx paragraph alignments (proxy backend)
+ALIGNMENTS = {"l": PP_ALIGN.LEFT, "ctr": PP_ALIGN.CENTER, "r": PP_ALIGN.RIGHT}
+# ShapeStyle.anchor values to python-pptx vertical anchors (proxy backend)
+ANCHORS = {"t": MSO_ANCHOR.TOP, "ctr": MSO_ANCHOR.MIDDLE, "b": MSO_ANCHOR.BOTTOM}
+
+# Data rows per table slide before continuing on a new slide
+TABLE_ROWS_PER_SLIDE = 12
+
+# Content text boxes: (max font size, min font size, space before) in points
+# per layout; text and spacing shrink down to the minimum font size before
+# content continues on a new slide
+CONTENT_FONT_SIZES = {
+    "bullet": (20, 14, 12),
+    "two_column": (18, 12, 10),
+}
+CONTENT_WIDTHS = {"bullet": Inches(8.4), "two_column": Inches(4)}
+TITLE_BOX = (Inches(0.5), Inches(0.3), Inches(9), Inches(0.8))
+TITLE_MIN_FONT_SIZE = 20  # long titles shrink to stay on one line, down to this size
+CONTENT_HEIGHT = Inches(5.5)
+IMAGE_AREA = (Inches(5.2), Inches(1.5), Inches(4), Inches(5.5))  # beside a text column
+IMAGE_AREA_FULL = (Inches(0.8), Inches(1.5), Inches(8.4), Inches(5.5))  # pictures only
+IMAGE_GAP = Inches(0.2)
+LAYOUT_BATCH = 256  # specs whose column splits are computed together
+SHARD_SIZE = 100  # specs rendered per worker task in a sharded build
+
+# Big-number grid: a metric block is the number above its label
+METRIC_AREA = (Inches(0.5), Inches(1.5), Inches(9), Inches(5.7))
+METRIC_BLOCK = (Inches(3.5), Inches(1.5))
+METRIC_GAP = Inches(0.4)
+METRIC_MIN_FONT_SIZE = 10
+METRIC_MIN_NUMBER_SIZE = 20  # a grid that would shrink numbers below this continues on another slide
+FRAME_DEFAULT_SIZE = 18  # size of the empty first paragraph every new text box holds
+
+# Chart slides: plot area below the title, and series colors in theme order
+CHART_AREA = (Inches(0.5), Inches(1.3), Inches(9), Inches(5.9))
+CHART_SERIES_COLORS = ("accent", "success", "title", "edge", "group_line")
+CHART_FONT_SIZE = 12
+CHART_LINE_WIDTH = Pt(2.25)
+CHART_TYPES = {
+    "line": XL_CHART_TYPE.LINE,
+    "column": XL_CHART_TYPE.COLUMN_CLUSTERED,
+    "bar": XL_CHART_TYPE.BAR_CLUSTERED,
+    "area": XL_CHART_TYPE.AREA,
+    "scatter": XL_CHART_TYPE.LINE_MARKERS,  # scatter of labelled x values
+}
+# Numeric x values are plotted to scale on an XY chart
+XY_CHART_TYPES = {"line": XL_CHART_TYPE.XY_SCATTER_LINES_NO_MARKERS, "scatter": XL_CHART_TYPE.XY_SCATTER}
+WORKBOOK_CREATED = datetime(2000, 1, 1)  # embedded workbooks carry this date, not the build time
+
+# Mermaid diagram slides: drawing area below the title, and node shapes
+DIAGRAM_AREA = (Inches(0.4), Inches(1.3), Inches(9.2), Inches(5.9))
+DIAGRAM_MAX_SCALE = 1.5
+DIAGRAM_MIN_FONT_SIZE = 6
+MERMAID_SHAPES = {
+    "rect": MSO_SHAPE.RECTANGLE,
+    "subroutine": MSO_SHAPE.RECTANGLE,
+    "round": MSO_SHAPE.ROUNDED_RECTANGLE,
+    "stadium": MSO_SHAPE.ROUNDED_RECTANGLE,
+    "cylinder": MSO_SHAPE.CAN,
+    "circle": MSO_SHAPE.OVAL,
+    "diamond": MSO_SHAPE.DIAMOND,
+    "hexagon": MSO_SHAPE.HEXAGON,
+    "parallelogram": MSO_SHAPE.PARALLELOGRAM,
+    "flag": MSO_SHAPE.PENTAGON,
+}
+# Shapes whose connection sites 0-3 are the top, left, bottom and right midpoints
+GLUED_SHAPES = ("rect", "subroutine", "round", "stadium", "diamond")
+
+# draw.io pages are scaled to fit the whole slide inside this margin
+DRAWIO_MARGIN = Inches(0.3)
+DRAWIO_SHAPES = {
+    "ellipse": MSO_SHAPE.OVAL,
+    "rhombus": MSO_SHAPE.DIAMOND,
+    "triangle": MSO_SHAPE.ISOSCELES_TRIANGLE,
+    "hexagon": MSO_SHAPE.HEXAGON,
+    "cylinder": MSO_SHAPE.CAN,
+    "cylinder3": MSO_SHAPE.CAN,
+    "parallelogram": MSO_SHAPE.PARALLELOGRAM,
+    "cloud": MSO_SHAPE.CLOUD,
+    "document": MSO_SHAPE.FLOWCHART_DOCUMENT,
+    "process": MSO_SHAPE.FLOWCHART_PREDEFINED_PROCESS,
+    "step": MSO_SHAPE.CHEVRON,
+}
+DRAWIO_ALIGN = {"left": PP_ALIGN.LEFT, "center": PP_ALIGN.CENTER, "right": PP_ALIGN.RIGHT}
+DRAWIO_VERTICAL_ALIGN = {"top": MSO_ANCHOR.TOP, "middle": MSO_ANCHOR.MIDDLE, "bottom": MSO_ANCHOR.BOTTOM}
+
+
+_template_layouts = weakref.WeakKeyDictionary()  # presentation part -> {slide kind: layout}
+_layout_placeholders = weakref.WeakKeyDictionary()  # layout part -> placeholder <p:sp>s its slides start with
+_template_slides = weakref.WeakSet()  # parts of slides built on a template layout
+
+
+def new_presentation(template=None):
+    """
+    Create an empty 10x7.5 inch presentation
+
+    With `template` (a .pptx, see deck_template) the presentation starts
+    from its master and any slides it holds are dropped; slides then use
+    its layouts and fill their placeholders instead of the Blank layout.
+    """
+    if template:
+        prs = Presentation(template)
+        drop_slides(prs)
+        _template_layouts[prs.part] = deck_template.template_layouts(prs)
+    else:
+        prs = Presentation()
+    prs.slide_width = Inches(10)
+    prs.slide_height = Inches(7.5)
+    return prs
+
+
+def new_slide(prs, kind):
+    """
+    Add a slide on the template layout for `kind` (see
+    deck_template.LAYOUT_NAMES), or a Blank one without a template.
+
+    The placeholders python-pptx clones from a layout are the same for
+    every slide on it, so they are cloned once and copied afterwards.
+    """
+    layouts = _template_layouts.get(prs.part)
+    if not layouts:
+        return prs.slides.add_slide(prs.slide_layouts[6])
+    layout = layouts[kind]
+    placeholders = _layout_placeholders.get(layout.part)
+    if placeholders is None:
+        slide = prs.slides.add_slide(layout)
+        _layout_placeholders[layout.part] = tuple(deepcopy(sp) for sp in slide.shapes._spTree.iter_shape_elms())
+    else:
+        rId, slide = prs.part.add_slide(layout)
+        prs.slides._sldIdLst.add_sldId(rId)
+        slide.shapes._spTree.extend(deepcopy(sp) for sp in placeholders)
+    _template_slides.add(slide.part)
+    return slide
+
+
+def is_template_slide(slide):
+    """Whether `slide` was built on a template layout and has placeholders to fill"""
+    return slide.part in _template_slides
+
+
+def fill_text_placeholder(slide, idx, text, style=None, size=None):
+    """
+    Put `text` into placeholder `idx`, one paragraph per line inheriting the
+    template's formatting; a font `size` other than `style`'s is set inline.
+    An empty `text` removes the placeholder.
+    """
+    placeholder = deck_xml.find_placeholder(slide.shapes._spTree, idx)
+    if not text:
+        placeholder.getparent().remove(placeholder)
+        return
+    size = size if style is not None and size != style.size else None
+    deck_xml.fill_placeholder(placeholder, [deck_xml.placeholder_paragraph(line, size) for line in text.split("\n")])
+
+
+@lru_cache(maxsize=None)
+def rgb(hex_color):
+    """Shared RGBColor for an 'RRGGBB' theme color"""
+    return RGBColor.from_string(hex_color)
+
+
+def apply_font(paragraph, style):
+    """Set a TextStyle through the python-pptx paragraph setters (proxy backend)"""
+    font = paragraph.font
+    font.size = Pt(style.size)
+    if style.bold is not None:
+        font.bold = style.bold
+    if style.italic is not None:
+        font.italic = style.italic
+    font.color.rgb = rgb(style.color)
+    if style.space_before is not None:
+        paragraph.space_before = Pt(style.space_before)
+    if style.align:
+        paragraph.alignment = ALIGNMENTS[style.align]
+
+
+def add_text(slide, x, y, cx, cy, text, style, backend=DEFAULT_BACKEND):
+    """Add a text box whose first paragraph carries `style`"""
+    if backend == "lxml":
+        return deck_xml.add_textbox(slide, x, y, cx, cy, deck_xml.frame_paragraphs(style.template(), text))
+    text_box = slide.shapes.add_textbox(x, y, cx, cy)
+    text_box.text_frame.text = text
+    apply_font(text_box.text_frame.paragraphs[0], style)
+    return text_box._element
+
+
+def set_background(slide, style):
+    """Fill the slide background with a ShapeStyle's fill"""
+    fill = slide.background.fill
+    fill.solid()
+    fill.fore_color.rgb = rgb(style.fill)
+
+
+def add_styled_shape(slide, autoshape, x, y, cx, cy, style, text=None, fill=None, line=None, text_style=None,
+                     every_line=False, backend=DEFAULT_BACKEND):
+    """
+    Add an autoshape and apply a ShapeStyle to it in one pass.
+
+    Fill and outline are cloned from cached fragments and the text is
+    built from pre-styled paragraphs; `fill`, `line` and `text_style`
+    override the style for this one shape (per-item colors, scaled
+    fonts). Only the first line of `text` is styled unless `every_line`.
+    """
+    shape = slide.shapes.add_shape(autoshape, x, y, cx, cy)
+    if backend == "lxml":
+        deck_xml.style_shape(shape._element, fill or style.fill, line or style.line, style.line_width)
+        if text is not None:
+            make_paragraphs = deck_xml.styled_paragraphs if every_line else deck_xml.frame_paragraphs
+            deck_xml.set_text(shape._element.txBody, make_paragraphs((text_style or style.text).template(), text),
+                              style.anchor, style.wrap, style.margins)
+        return shape
+
+    if fill or style.fill:
+        shape.fill.solid()
+        shape.fill.fore_color.rgb = rgb(str(fill or style.fill))
+    if line or style.line:
+        shape.line.color.rgb = rgb(str(line or style.line))
+        if style.line_width:
+            shape.line.width = Pt(style.line_width)
+    if text is not None:
+        text_frame = shape.text_frame
+        text_frame.text = text
+        for paragraph in text_frame.paragraphs if every_line else text_frame.paragraphs[:1]:
+            apply_font(paragraph, text_style or style.text)
+        if style.anchor:
+            text_frame.vertical_anchor = ANCHORS[style.anchor]
+        if style.wrap is not None:
+            text_frame.word_wrap = style.wrap
+        for name, margin in zip(("margin_left", "margin_top", "margin_right", "margin_bottom"), style.margins or ()):
+            if margin is not None:
+                setattr(text_frame, name, Pt(margin))
+    return shape
+
+
+def fit_title_size(title, max_size, width=TITLE_BOX[2]):
+    """
+    Largest font size up to `max_size` at which each line of `title` stays unwrapped in a box `width` EMU wide
+
+    Title boxes do not wrap, so a line that does not fit runs off the slide;
+    below TITLE_MIN_FONT_SIZE it is left to do so rather than become unreadable.
+    """
+    lines = title.split("\n")
+    height = len(lines) * max_size * deck_textfit.LINE_SPACING + 2 * deck_textfit.TEXT_INSET
+    min_size = max(TITLE_MIN_FONT_SIZE, max_size // 2 + 1)  # two wrapped lines never fit a one-line height
+    return fit_font_size(lines, width / EMU_PER_POINT, height, max_size, min_size) or min_size
+
+
+def add_title_text(slide, x, y, cx, cy, text, style, backend=DEFAULT_BACKEND):
+    """Add an unwrapped heading text box, shrinking `style` so the text fits its width"""
+    return add_text(slide, x, y, cx, cy, text, style.with_size(fit_title_size(text, style.size, cx)), backend)
+
+
+def add_slide_title(slide, title, size, backend=DEFAULT_BACKEND):
+    """
+    Add the standard top-left slide title, into the title placeholder on template slides
+
+    `size` is the largest font size; a title too long for one line at it shrinks to fit.
+    """
+    size = fit_title_size(title, size)
+    if is_template_slide(slide):
+        fill_text_placeholder(slide, 0, title, deck_styles.style("title"), size)
+        return
+    add_text(slide, *TITLE_BOX, title, deck_styles.style("title").with_size(size), backend)
+
+
+def add_title_slide(prs, title, subtitle, tagline=DEFAULT_TAGLINE, backend=DEFAULT_BACKEND):
+    """Add title slide"""
+    slide = new_slide(prs, "title")
+    if is_template_slide(slide):
+        fill_text_placeholder(slide, 0, title)
+        fill_text_placeholder(slide, 1, subtitle)
+    else:
+        set_background(slide, deck_styles.style("cover_background"))
+        add_title_text(slide, Inches(1), Inches(2), Inches(8), Inches(1.5), title, deck_styles.style("cover_title"),
+                       backend)
+        add_title_text(slide, Inches(1), Inches(3.8), Inches(8), Inches(1), subtitle,
+                       deck_styles.style("cover_subtitle"), backend)
+    add_text(slide, Inches(1), Inches(5.2), Inches(8), Inches(0.8), tagline, deck_styles.style("cover_tagline"),
+             backend)
+    return slide
+
+
+def add_content_slide(prs, title, content_items, layout_type="bullet", backend=DEFAULT_BACKEND, fit=True):
+    """
+    Add content slide(s) with bullets, returning the slides added.
+
+    With `fit`, text is shrunk within CONTENT_FONT_SIZES to avoid overflow;
+    content that still does not fit continues on "(cont.)" slides.
+    """
+    if not fit:
+        return [add_content_page(prs, title, content_items, layout_type, backend=backend)]
+    slides = []
+    for items, font_size in fit_content(content_items, layout_type):
+        page_title = f"{title} (cont.)" if slides else title
+        slides.append(add_content_page(prs, page_title, items, layout_type, font_size, backend))
+    return slides
+
+
+def fit_content(content_items, layout_type="bullet"):
+    """Split content into (items, font_size) pages that fit the content area"""
+    max_size, min_size, space_before = CONTENT_FONT_SIZES[layout_type]
+    width = CONTENT_WIDTHS[layout_type] / EMU_PER_POINT
+    height = CONTENT_HEIGHT / EMU_PER_POINT
+
+    def columns(items):
+        if layout_type == "two_column":
+            mid = column_split(items)
+            return items[:mid], items[mid:]
+        return (items,)
+
+    def page_size(items, floor):
+        sizes = [fit_font_size(column, width, height, max_size, floor, space_before,
+                               leading_paragraph=FRAME_DEFAULT_SIZE)
+                 for column in columns(items)]
+        return None if None in sizes else min(sizes)
+
+    size = page_size(content_items, min_size)
+    if size is not None:
+        return [(content_items, size)]
+    pages = paginate(content_items, lambda chunk: page_size(chunk, min_size) is not None)
+    return [(items, page_size(items, min_size) or min_size) for items in pages]
+
+
+def add_content_page(prs, title, content_items, layout_type="bullet", font_size=None, backend=DEFAULT_BACKEND):
+    """Add content slide with bullets or table"""
+    slide = new_slide(prs, "two_column" if layout_type == "two_column" else "content")
+    max_size, _, space_before = CONTENT_FONT_SIZES.get(layout_type, CONTENT_FONT_SIZES["bullet"])
+    font_size = font_size or max_size
+    body = deck_styles.style("body").with_size(font_size, scaled_spacing(space_before, font_size, max_size))
+
+    # Title
+    add_slide_title(slide, title, 40, backend)
+
+    # Content area
+    if is_template_slide(slide):
+        # Body placeholders already carry the layout's size and spacing; only a shrunk fit is inline
+        size, spacing = (None, None) if font_size == max_size else (font_size, body.space_before)
+        columns = {1: content_items}
+        if layout_type == "two_column":
+            mid = column_split(content_items)
+            columns = {1: content_items[:mid], 2: content_items[mid:]}
+        elif layout_type != "bullet":
+            columns = {1: []}
+        for idx, items in columns.items():
+            placeholder = deck_xml.find_placeholder(slide.shapes._spTree, idx)
+            if not items:
+                placeholder.getparent().remove(placeholder)
+                continue
+            deck_xml.fill_placeholder(placeholder, [deck_xml.placeholder_paragraph(item, size, spacing)
+                                                    for item in items])
+
+    elif backend == "lxml":
+        style = body.template()
+        if layout_type == "bullet":
+            columns = [(Inches(0.8), Inches(8.4), content_items)]
+        elif layout_type == "two_column":
+            mid = column_split(content_items)
+            columns = [(Inches(0.8), Inches(4), content_items[:mid]),
+                       (Inches(5.2), Inches(4), content_items[mid:])]
+        else:
+            columns = []
+        for left, width, items in columns:
+            paragraphs = [deck_xml.empty_paragraph()]
+            paragraphs.extend(deck_xml.new_paragraph(style, item) for item in items)
+            deck_xml.add_textbox(slide, left, Inches(1.5), width, Inches(5.5), paragraphs, word_wrap=True)
+
+    elif layout_type == "bullet":
+        content_box = slide.shapes.add_textbox(Inches(0.8), Inches(1.5), Inches(8.4), Inches(5.5))
+        text_frame = content_box.text_frame
+        text_frame.word_wrap = True
+
+        for item in content_items:
+            p = text_frame.add_paragraph()
+            p.text = item
+            p.level = 0
+            apply_font(p, body)
+
+    elif layout_type == "two_column":
+        # Left column
+        left_box = slide.shapes.add_textbox(Inches(0.8), Inches(1.5), Inches(4), Inches(5.5))
+        left_frame = left_box.text_frame
+        left_frame.word_wrap = True
+
+        # Right column
+        right_box = slide.shapes.add_textbox(Inches(5.2), Inches(1.5), Inches(4), Inches(5.5))
+        right_frame = right_box.text_frame
+        right_frame.word_wrap = True
+
+        mid = column_split(content_items)
+        for item in content_items[:mid]:
+            p = left_frame.add_paragraph()
+            p.text = item
+            apply_font(p, body)
+
+        for item in content_items[mid:]:
+            p = right_frame.add_paragraph()
+            p.text = item
+            apply_font(p, body)
+    return slide
+
+
+_planned_splits = {}  # two_column splits computed ahead by plan_layouts()
+
+
+def _column_heights(items):
+    max_size, _, space_before = CONTENT_FONT_SIZES["two_column"]
+    return paragraph_heights(items, CONTENT_WIDTHS["two_column"] / EMU_PER_POINT, max_size, space_before)
+
+
+def column_split(items):
+    """
+    Index splitting two_column items into left and right columns.
+
+    The split balances the columns' estimated heights at the largest font
+    size, so one long paragraph no longer leaves its column overflowing
+    while the other is half empty.
+    """
+    split = _planned_splits.get(tuple(items))
+    if split is None:
+        split = deck_layout.balanced_split(_column_heights(items))
+    return split
+
+
+def plan_layouts(specs, batch=LAYOUT_BATCH):
+    """
+    Yield `specs` unchanged, computing the column splits of each batch of
+    two_column slides in one pass first (vectorized when numpy is installed).
+    """
+    specs = iter(specs)
+    while True:
+        chunk = list(islice(specs, batch))
+        if not chunk:
+            return
+        columns = [tuple(spec.items) for spec in chunk
+                   if spec.kind == "content" and spec.layout_type == "two_column" and not spec.images]
+        _planned_splits.clear()
+        _planned_splits.update(zip(columns, deck_layout.balanced_splits([_column_heights(items)
+                                                                         for items in columns])))
+        yield from chunk
+
+
+def add_image_slide(prs, title, content_items, images, backend=DEFAULT_BACKEND):
+    """Add a content slide with its pictures in a grid, beside the bullets if there are any"""
+    slide = new_slide(prs, "title_only")
+    add_slide_title(slide, title, 40, backend)
+
+    if content_items:
+        max_size, min_size, space_before = CONTENT_FONT_SIZES["two_column"]
+        font_size = fit_font_size(content_items, CONTENT_WIDTHS["two_column"] / EMU_PER_POINT,
+                                  CONTENT_HEIGHT / EMU_PER_POINT, max_size, min_size, space_before,
+                                  leading_paragraph=FRAME_DEFAULT_SIZE) or min_size
+        body = deck_styles.style("body").with_size(font_size, scaled_spacing(space_before, font_size, max_size))
+        if backend == "lxml":
+            paragraphs = [deck_xml.empty_paragraph()]
+            paragraphs.extend(deck_xml.new_paragraph(body.template(), item) for item in content_items)
+            deck_xml.add_textbox(slide, Inches(0.8), Inches(1.5), Inches(4), CONTENT_HEIGHT, paragraphs,
+                                 word_wrap=True)
+        else:
+            text_frame = slide.shapes.add_textbox(Inches(0.8), Inches(1.5), Inches(4), CONTENT_HEIGHT).text_frame
+            text_frame.word_wrap = True
+            for item in content_items:
+                p = text_frame.add_paragraph()
+                p.text = item
+                apply_font(p, body)
+
+    # Pictures: a near-square grid, each one fitted to its cell and centered
+    left, top, width, height = IMAGE_AREA if content_items else IMAGE_AREA_FULL
+    cols = math.ceil(math.sqrt(len(images)))
+    rows = math.ceil(len(images) / cols)
+    cell_w = (width - IMAGE_GAP * (cols - 1)) // cols
+    cell_h = (height - IMAGE_GAP * (rows - 1)) // rows
+    for index, (alt, path) in enumerate(images):
+        picture = deck_media.load_picture(path, cell_w, cell_h)
+        scale = min(cell_w / picture.width, cell_h / picture.height)
+        cx, cy = int(picture.width * scale), int(picture.height * scale)
+        x = left + (index % cols) * (cell_w + IMAGE_GAP) + (cell_w - cx) // 2
+        y = top + (index // cols) * (cell_h + IMAGE_GAP) + (cell_h - cy) // 2
+        shape = slide.shapes.add_picture(io.BytesIO(picture.blob), x, y, cx, cy)
+        shape._element.nvPicPr.cNvPr.set("descr", alt)
+    return slide
+
+
+def add_table_slide(prs, title, headers, rows, backend=DEFAULT_BACKEND, rows_per_slide=TABLE_ROWS_PER_SLIDE):
+    """Add slide(s) with table, continuing on a new slide every rows_per_slide rows"""
+    rows = iter(rows)
+    slides = []
+    page = list(islice(rows, rows_per_slide))
+    while True:
+        page_title = f"{title} (cont.)" if slides else title
+        slides.append(add_table_page(prs, page_title, headers, page, backend))
+        page = list(islice(rows, rows_per_slide))
+        if not page:
+            return slides
+
+
+def add_table_page(prs, title, headers, rows, backend=DEFAULT_BACKEND):
+    """Add one slide with a header row plus `rows`"""
+    slide = new_slide(prs, "title_only")
+    header_style = deck_styles.style("table_header")
+    cell_style = deck_styles.style("table_cell")
+
+    # Title
+    add_slide_title(slide, title, 36, backend)
+
+    # Table
+    rows_count = len(rows) + 1  # +1 for header
+    cols_count = len(headers)
+
+    left = Inches(0.8)
+    top = Inches(1.5)
+    width = Inches(8.4)
+    height = Inches(5)
+
+    table = slide.shapes.add_table(rows_count, cols_count, left, top, width, height).table
+
+    if backend == "lxml":
+        for grid_col in table._tbl.tblGrid.gridCol_lst:
+            grid_col.w = Inches(8.4 / cols_count)
+        deck_xml.fill_table(table._tbl, headers, rows,
+                            header_style=header_style.text.template(),
+                            header_fill=header_style.fill,
+                            cell_style=cell_style.template())
+        return slide
+
+    # Set column widths
+    for column in table.columns:
+        column.width = Inches(8.4 / cols_count)
+
+    # Cells are walked row by row; table.cell(i, j) re-searches the table on every call
+    table_rows = iter(table.rows)
+
+    # Header row
+    for cell, header in zip(next(table_rows).cells, headers):
+        cell.text = header
+        cell.fill.solid()
+        cell.fill.fore_color.rgb = rgb(header_style.fill)
+        apply_font(cell.text_frame.paragraphs[0], header_style.text)
+
+    # Data rows
+    for table_row, row in zip(table_rows, rows):
+        for cell, cell_text in zip(table_row.cells, row):
+            cell.text = str(cell_text)
+            apply_font(cell.text_frame.paragraphs[0], cell_style)
+    return slide
+
+
+def metric_layout(numbers, fit=True):
+    """
+    Fonts and boxes for one slide of (value, label) metrics, or None when they do not fit.
+
+    Returns (number_style, label_style, width, positions, number_height,
+    label_height), sizes in EMU. The grid scale shrinks the fonts; box
+    heights are measured from the scaled fonts (text insets do not scale),
+    and each block must fit its grid cell without its numbers dropping
+    below METRIC_MIN_NUMBER_SIZE. With `fit` False the layout is returned
+    regardless.
+    """
+    scale, positions = deck_layout.metric_grid(len(numbers), METRIC_AREA, METRIC_BLOCK, METRIC_GAP)
+    number_style = deck_styles.style("metric_number")
+    label_style = deck_styles.style("metric_label")
+    if scale < 1:
+        number_style = number_style.with_size(max(METRIC_MIN_FONT_SIZE, round(number_style.size * scale)))
+        label_style = label_style.with_size(max(METRIC_MIN_FONT_SIZE, round(label_style.size * scale)))
+    width = int(METRIC_BLOCK[0] * scale)
+    # Unwrapped boxes grow around their text; a block may spread into the gap around it
+    room_width = (width + METRIC_GAP) / EMU_PER_POINT
+    room_height = (METRIC_BLOCK[1] * scale + METRIC_GAP) / EMU_PER_POINT
+    number_height = max(deck_textfit.text_height([number], room_width, number_style.size) for number, _ in numbers)
+    label_height = max(deck_textfit.text_height([label], room_width, label_style.size) for _, label in numbers)
+    widest = max(max(deck_textfit.text_width(number, size=number_style.size),
+                     deck_textfit.text_width(label, size=label_style.size)) for number, label in numbers)
+    if fit and (number_style.size < METRIC_MIN_NUMBER_SIZE or widest + 2 * deck_textfit.TEXT_INSET > room_width
+            or number_height + label_height > room_height):
+        return None
+    # Center the measured block where the grid put the scaled one
+    shift = (METRIC_BLOCK[1] * scale - (number_height + label_height) * EMU_PER_POINT) / 2
+    positions = [(x, round(y + shift)) for x, y in positions]
+    return (number_style, label_style, width, positions,
+            round(number_height * EMU_PER_POINT), round(label_height * EMU_PER_POINT))
+
+
+def add_big_number_slide(prs, title, numbers, backend=DEFAULT_BACKEND):
+    """
+    Add slide(s) with big numbers/metrics, returning the slides added.
+
+    Metrics go in the grid that keeps them largest; when they no longer fit
+    at a readable size they continue on "(cont.)" slides.
+    """
+    slides = []
+    for page in paginate(list(numbers), lambda chunk: metric_layout(chunk) is not None):
+        page_title = f"{title} (cont.)" if slides else title
+        slides.append(add_big_number_page(prs, page_title, page, backend))
+    return slides
+
+
+def add_big_number_page(prs, title, numbers, backend=DEFAULT_BACKEND):
+    """Add one slide with big numbers/metrics"""
+    slide = new_slide(prs, "title_only")
+
+    # Title
+    add_slide_title(slide, title, 36, backend)
+    if not numbers:
+        return slide
+
+    # A metric that does not fit even on its own slide keeps its smallest layout
+    number_style, label_style, width, positions, number_height, label_height = (
+        metric_layout(numbers) or metric_layout(numbers, fit=False))
+
+    for (number, label), (x, y) in zip(numbers, positions):
+        add_text(slide, x, y, width, number_height, number, number_style, backend)
+        add_text(slide, x, y + number_height, width, label_height, label, label_style, backend)
+    return slide
+
+
+def add_closing_slide(prs, title, subtitle, backend=DEFAULT_BACKEND):
+    """Add closing (thank you) slide"""
+    slide = new_slide(prs, "closing")
+    if is_template_slide(slide):
+        fill_text_placeholder(slide, 0, title)
+        fill_text_placeholder(slide, 1, subtitle)
+        return slide
+    set_background(slide, deck_styles.style("closing_background"))
+
+    add_title_text(slide, Inches(1), Inches(2.5), Inches(8), Inches(2), title, deck_styles.style("closing_title"),
+                   backend)
+    add_title_text(slide, Inches(1), Inches(4.5), Inches(8), Inches(1), subtitle, deck_styles.style("closing_subtitle"),
+                   backend)
+    return slide
+
+
+def add_system_architecture_slide(prs, backend=DEFAULT_BACKEND):
+    """Add the layered system architecture diagram"""
+    slide = new_slide(prs, "title_only")
+    box_style = deck_styles.style("diagram_box")
+    arrow_style = deck_styles.style("diagram_arrow")
+
+    # Title
+    add_slide_title(slide, "🏗️ System Architecture", 36, backend)
+
+    # Architecture layers
+    layers = [
+        ("User Interface & API Gateway", 1.5),
+        ("Orchestration Layer (LLM-based)", 2.5),
+        ("Agent Layer (5 Specialized Agents)", 3.5),
+        ("Tool Layer (UI, API, DB, EDI, Reports)", 4.5),
+        ("Data Layer (Vector DB, PostgreSQL, Redis)", 5.5)
+    ]
+
+    for index, (layer_name, y_pos) in enumerate(layers):
+        add_styled_shape(slide, MSO_SHAPE.RECTANGLE, Inches(1.5), Inches(y_pos), Inches(7), Inches(0.6),
+                         box_style, layer_name, fill=deck_styles.fill_color("diagram_layers", index), backend=backend)
+
+    # Add arrows in the gaps between layers
+    for i in range(len(layers) - 1):
+        add_styled_shape(slide, MSO_SHAPE.DOWN_ARROW, Inches(4.8), Inches(layers[i][1] + 0.65),
+                         Inches(0.4), Inches(0.3), arrow_style, backend=backend)
+    return slide
+
+
+def add_agent_architecture_slide(prs, backend=DEFAULT_BACKEND):
+    """Add the orchestrator and specialized agents diagram"""
+    slide = new_slide(prs, "title_only")
+    box_style = deck_styles.style("diagram_box")
+
+    # Title
+    add_slide_title(slide, "🤖 Specialized Agent Architecture", 32, backend)
+
+    # Central orchestrator, with a heavier outline
+    add_styled_shape(slide, MSO_SHAPE.RECTANGLE, Inches(3.5), Inches(1.8), Inches(3), Inches(0.8),
+                     deck_styles.style("diagram_hub"), "AI Orchestrator\n(GPT-4/Claude)", every_line=True,
+                     backend=backend)
+
+    # Specialized agents in circle
+    agents = [
+        ("Policy\nAgent", 1.5, 3.5),
+        ("Claims\nAgent", 3.5, 3.0),
+        ("Member\nAgent", 5.5, 3.5),
+        ("Integration\nAgent", 5.5, 5.0),
+        ("Security\nAgent", 3.5, 5.5),
+        ("Analytics\nAgent", 1.5, 5.0)
+    ]
+
+    agent_text = box_style.text.with_size(13)
+    for index, (agent_name, x_pos, y_pos) in enumerate(agents):
+        add_styled_shape(slide, MSO_SHAPE.ROUNDED_RECTANGLE, Inches(x_pos), Inches(y_pos),
+                         Inches(1.5), Inches(0.8), box_style, agent_name,
+                         fill=deck_styles.fill_color("diagram_agents", index), text_style=agent_text,
+                         every_line=True, backend=backend)
+    return slide
+
+
+def add_test_flow_slide(prs, backend=DEFAULT_BACKEND):
+    """Add the test execution flow diagram"""
+    slide = new_slide(prs, "title_only")
+    box_style = deck_styles.style("diagram_box")
+    arrow_style = deck_styles.style("diagram_arrow")
+
+    # Title
+    add_slide_title(slide, "📊 Test Execution Flow", 36, backend)
+
+    # Flow steps
+    flow_steps = [
+        "1. User\nRequest",
+        "2. Orchestrator\nAnalysis",
+        "3. Agent\nSelection",
+        "4. Test\nGeneration",
+        "5. Execution",
+        "6. Validation",
+        "7. Results"
+    ]
+
+    x_start = 0.225
+    step_text = box_style.text.with_size(11)
+    for i, step_name in enumerate(flow_steps):
+        add_styled_shape(slide, MSO_SHAPE.ROUNDED_RECTANGLE, Inches(x_start + i * 1.4), Inches(2.8),
+                         Inches(1.15), Inches(1.2), box_style, step_name,
+                         fill=deck_styles.fill_color("diagram_steps", i), text_style=step_text, every_line=True,
+                         backend=backend)
+
+        # Add arrow in the gap to the next step
+        if i < len(flow_steps) - 1:
+            add_styled_shape(slide, MSO_SHAPE.RIGHT_ARROW, Inches(x_start + i * 1.4 + 1.175), Inches(3.3),
+                             Inches(0.2), Inches(0.2), arrow_style, backend=backend)
+    return slide
+
+
+def _style_color(value, default):
+    """Mermaid style color ('#4A90E2' or '#4a9') to RGBColor"""
+    if not value or not value.startswith("#"):
+        return default
+    value = value[1:]
+    if len(value) == 3:
+        value = "".join(char * 2 for char in value)
+    try:
+        return RGBColor.from_string(value[:6].upper())
+    except ValueError:
+        return default
+
+
+def _contrast_text(fill):
+    """Dark text on light fills, white text on dark ones"""
+    red, green, blue = fill
+    return rgb(deck_styles.color("text") if 0.299 * red + 0.587 * green + 0.114 * blue > 150 else deck_styles.WHITE)
+
+
+def _connection_site(box, x, y):
+    """Index of the box-edge midpoint (top, left, bottom, right) closest to (x, y)"""
+    sites = ((box["x"] + box["w"] / 2, box["y"]), (box["x"], box["y"] + box["h"] / 2),
+             (box["x"] + box["w"] / 2, box["y"] + box["h"]), (box["x"] + box["w"], box["y"] + box["h"] / 2))
+    return min(range(4), key=lambda i: (sites[i][0] - x) ** 2 + (sites[i][1] - y) ** 2)
+
+
+def _add_arrowheads(line, start, end):
+    """Triangle arrowheads at the start and/or end of a line"""
+    ln = line._get_or_add_ln()
+    if start:
+        ln.append(ln.makeelement(qn("a:headEnd"), {"type": "triangle"}))
+    if end:
+        ln.append(ln.makeelement(qn("a:tailEnd"), {"type": "triangle"}))
+
+
+def add_mermaid_slide(prs, title, layout):
+    """
+    Add a diagram slide from a deck_mermaid layout.
+
+    Nodes become native autoshapes inside their subgraph boxes; one-segment
+    edges become connectors glued to their shapes, longer routed edges
+    become open freeform polylines.
+    """
+    slide = new_slide(prs, "title_only")
+    add_slide_title(slide, title, 32)
+    if not layout["nodes"]:
+        return slide
+
+    left, top, width, height = DIAGRAM_AREA
+    scale = min(width / (layout["width"] * EMU_PER_POINT), height / (layout["height"] * EMU_PER_POINT),
+                DIAGRAM_MAX_SCALE)
+    left += (width - layout["width"] * EMU_PER_POINT * scale) / 2
+    font_size = max(DIAGRAM_MIN_FONT_SIZE, deck_mermaid.NODE_FONT_SIZE * scale)
+    group_style = deck_styles.style("diagram_group")
+    node_style = deck_styles.style("diagram_node")
+    edge_style = deck_styles.style("diagram_edge")
+    label_style = deck_styles.style("diagram_label")
+    group_text = group_style.text.with_size(font_size)
+    node_text = node_style.text.with_size(font_size)
+    label_text = label_style.text.with_size(max(DIAGRAM_MIN_FONT_SIZE, font_size - 1))
+
+    def emu(value, origin=0):
+        return int(origin + value * EMU_PER_POINT * scale)
+
+    for group in layout["groups"]:
+        add_styled_shape(slide, MSO_SHAPE.RECTANGLE, emu(group["x"], left), emu(group["y"], top),
+                         emu(group["w"]), emu(group["h"]), group_style, group["title"], text_style=group_text)
+
+    shapes = {}
+    default_fill = rgb(node_style.fill)
+    default_line = rgb(node_style.line)
+    for node in layout["nodes"]:
+        fill = _style_color(node["style"].get("fill"), default_fill)
+        text_color = _style_color(node["style"].get("color"), _contrast_text(fill))
+        shape = add_styled_shape(slide, MERMAID_SHAPES.get(node["shape"], MSO_SHAPE.RECTANGLE),
+                                 emu(node["x"], left), emu(node["y"], top), emu(node["w"]), emu(node["h"]),
+                                 node_style, node["label"], fill=fill,
+                                 line=_style_color(node["style"].get("stroke"), default_line),
+                                 text_style=node_text.with_color(str(text_color)), every_line=True)
+        shapes[node["id"]] = (shape, node)
+
+    for edge in layout["edges"]:
+        points = [(emu(x, left), emu(y, top)) for x, y in edge["points"]]
+        if len(points) == 2:
+            line_shape = slide.shapes.add_connector(MSO_CONNECTOR.STRAIGHT, *points[0], *points[1])
+            for end, node_id, (x, y) in (("begin", edge["source"], edge["points"][0]),
+                                         ("end", edge["target"], edge["points"][-1])):
+                shape, node = shapes[node_id]
+                if node["shape"] in GLUED_SHAPES:
+                    getattr(line_shape, f"{end}_connect")(shape, _connection_site(node, x, y))
+        else:
+            builder = slide.shapes.build_freeform(*points[0])
+            builder.add_line_segments(points[1:], close=False)
+            line_shape = builder.convert_to_shape()
+            line_shape.fill.background()
+        deck_xml.style_shape(line_shape._element, line=edge_style.line,
+                             line_width=edge_style.line_width * (2 if edge["style"] == "thick" else 1),
+                             dash="dash" if edge["style"] == "dotted" else None,
+                             head=edge["arrow"] == "both", tail=edge["arrow"] != "none")
+
+        if edge["label"]:
+            mid_x, mid_y = emu(edge["label_at"][0], left), emu(edge["label_at"][1], top)
+            label_width, label_height = (emu(size) for size in deck_mermaid.label_size(edge["label"]))
+            deck_xml.add_textbox(slide, mid_x - label_width // 2, mid_y - label_height // 2, label_width,
+                                 label_height, deck_xml.frame_paragraphs(label_text.template(), edge["label"]),
+                                 fill=label_style.fill, margins=label_style.margins)
+    return slide
+
+
+_layout_cache_dir = None  # where mermaid_layout() keeps layouts, set per build by use_layout_cache()
+
+
+def use_layout_cache(directory):
+    """Keep the Mermaid layouts of the deck being built in `directory` (None: lay out in memory)"""
+    global _layout_cache_dir
+    _layout_cache_dir = directory
+
+
+def mermaid_layout(spec):
+    """Layout of a Mermaid diagram spec, from the layout cache of the deck being built"""
+    cache = deck_mermaid.LayoutCache(_layout_cache_dir) if _layout_cache_dir else None
+    return deck_mermaid.cached_layout(spec.items, cache)
+
+
+def iter_mermaid_specs(path):
+    """One diagram SlideSpec per Mermaid flowchart in `path`"""
+    for heading, block in deck_mermaid.iter_mermaid_blocks(path):
+        yield SlideSpec(number=0, kind="mermaid", title=heading, items=block,
+                        digest=deck_mermaid.source_key(block), source=path)
+
+
+def _drawio_shape(style):
+    """Autoshape for a draw.io vertex style, or None for a plain text cell"""
+    if "text" in style:
+        return None
+    for name in (style.get("shape"), *style):
+        if name in DRAWIO_SHAPES:
+            return DRAWIO_SHAPES[name]
+    return MSO_SHAPE.ROUNDED_RECTANGLE if style.get("rounded") == "1" else MSO_SHAPE.RECTANGLE
+
+
+def _perimeter_point(cell, toward):
+    """Where the line from the center of `cell` toward `toward` leaves its bounding box"""
+    cx, cy = cell.x + cell.width / 2, cell.y + cell.height / 2
+    dx, dy = toward[0] - cx, toward[1] - cy
+    if not dx and not dy:
+        return cx, cy
+    scale = min(cell.width / 2 / abs(dx) if dx else float("inf"),
+                cell.height / 2 / abs(dy) if dy else float("inf"))
+    return cx + dx * scale, cy + dy * scale
+
+
+def _edge_points(edge, vertices):
+    """Polyline of a draw.io edge: terminal perimeter points around its waypoints"""
+    source, target = vertices.get(edge.source), vertices.get(edge.target)
+
+    def center(cell):
+        return cell.x + cell.width / 2, cell.y + cell.height / 2
+
+    first = edge.points[0] if edge.points else (center(target) if target else edge.target_point)
+    last = edge.points[-1] if edge.points else (center(source) if source else edge.source_point)
+    start = _perimeter_point(source, first) if source else edge.source_point
+    end = _perimeter_point(target, last) if target else edge.target_point
+    if start is None or end is None:
+        return None
+    return [start, *edge.points, end]
+
+
+def _style_text(text_frame, text, style, scale):
+    """Apply a draw.io cell's label and font style to a text frame"""
+    text_frame.word_wrap = style.get("whiteSpace") == "wrap"
+    text_frame.margin_left = Pt(float(style.get("spacingLeft", 0)) * scale + 2)
+    text_frame.margin_top = Pt(float(style.get("spacingTop", 0)) * scale + 2)
+    text_frame.margin_right = text_frame.margin_bottom = Pt(2)
+    text_frame.text = text
+    text_frame.vertical_anchor = DRAWIO_VERTICAL_ALIGN.get(style.get("verticalAlign", "middle"), MSO_ANCHOR.MIDDLE)
+    font_style = int(style.get("fontStyle", 0))
+    for paragraph in text_frame.paragraphs:
+        paragraph.font.size = Pt(max(DIAGRAM_MIN_FONT_SIZE, float(style.get("fontSize", 12)) * scale))
+        paragraph.font.bold = bool(font_style & 1)
+        paragraph.font.italic = bool(font_style & 2)
+        paragraph.font.underline = bool(font_style & 4)
+        paragraph.font.color.rgb = _style_color(style.get("fontColor"), rgb(deck_styles.color("text")))
+        paragraph.alignment = DRAWIO_ALIGN.get(style.get("align", "center"), PP_ALIGN.CENTER)
+
+
+def _style_line(line, style, scale, default_color):
+    """Apply draw.io strokeColor/strokeWidth/dashed to a shape outline"""
+    if style.get("strokeColor") == "none":
+        line.fill.background()
+        return
+    line.color.rgb = _style_color(style.get("strokeColor"), default_color)
+    line.width = Pt(max(0.5, float(style.get("strokeWidth", 1)) * scale))
+    if style.get("dashed") == "1":
+        line.dash_style = MSO_LINE_DASH_STYLE.DASH
+
+
+def add_drawio_slide(prs, cells):
+    """
+    Add a slide reproducing one draw.io page from its cells.
+
+    The page keeps its own geometry, scaled uniformly to fit the slide;
+    vertices become autoshapes or text boxes with their fill, stroke and
+    font styles, edges become connectors (polylines when they have
+    waypoints) glued to the shapes they join.
+    """
+    slide = new_slide(prs, "blank")
+    vertices = {cell.id: cell for cell in cells if not cell.edge}
+    routes = {cell.id: _edge_points(cell, vertices) for cell in cells if cell.edge}
+    labels = {}
+    for cell in vertices.values():
+        if cell.parent in routes and cell.value:
+            labels.setdefault(cell.parent, []).append(cell.value)
+    xs = [value for cell in vertices.values() for value in (cell.x, cell.x + cell.width)]
+    ys = [value for cell in vertices.values() for value in (cell.y, cell.y + cell.height)]
+    for points in filter(None, routes.values()):
+        xs.extend(x for x, _ in points)
+        ys.extend(y for _, y in points)
+    if not xs:
+        return slide
+
+    min_x, min_y = min(xs), min(ys)
+    area_width = prs.slide_width - 2 * DRAWIO_MARGIN
+    area_height = prs.slide_height - 2 * DRAWIO_MARGIN
+    scale = min(area_width / max(max(xs) - min_x, 1), area_height / max(max(ys) - min_y, 1))
+    left = DRAWIO_MARGIN + (area_width - (max(xs) - min_x) * scale) / 2
+    top = DRAWIO_MARGIN + (area_height - (max(ys) - min_y) * scale) / 2
+    point_scale = scale / EMU_PER_POINT  # font points per draw.io unit
+
+    def emu_x(x):
+        return int(left + (x - min_x) * scale)
+
+    def emu_y(y):
+        return int(top + (y - min_y) * scale)
+
+    shapes = {}
+    for cell in cells:
+        style = cell.style
+        if not cell.edge:
+            if cell.parent in routes:
+                continue  # edge labels are drawn with their edge
+            x, y = emu_x(cell.x), emu_y(cell.y)
+            width, height = int(cell.width * scale), int(cell.height * scale)
+            autoshape = _drawio_shape(style)
+            if autoshape is None:
+                shape = slide.shapes.add_textbox(x, y, width, height)
+            else:
+                shape = slide.shapes.add_shape(autoshape, x, y, width, height)
+                _style_line(shape.line, style, point_scale, rgb(deck_styles.color("text")))
+            if style.get("fillColor", "none" if autoshape is None else "") == "none":
+                shape.fill.background()
+            else:
+                shape.fill.solid()
+                shape.fill.fore_color.rgb = _style_color(style.get("fillColor"), rgb(deck_styles.WHITE))
+            if cell.value:
+                _style_text(shape.text_frame, cell.value, style, point_scale)
+            shapes[cell.id] = (shape, autoshape)
+            continue
+
+        points = routes[cell.id]
+        if points is None:
+            continue
+        emu_points = [(emu_x(x), emu_y(y)) for x, y in points]
+        if len(emu_points) == 2:
+            line_shape = slide.shapes.add_connector(MSO_CONNECTOR.STRAIGHT, *emu_points[0], *emu_points[1])
+            for end, node_id in (("begin", cell.source), ("end", cell.target)):
+                shape, autoshape = shapes.get(node_id, (None, None))
+                if autoshape in (MSO_SHAPE.RECTANGLE, MSO_SHAPE.ROUNDED_RECTANGLE, MSO_SHAPE.DIAMOND):
+                    box = {"x": shape.left, "y": shape.top, "w": shape.width, "h": shape.height}
+                    getattr(line_shape, f"{end}_connect")(
+                        shape, _connection_site(box, *emu_points[0 if end == "begin" else -1]))
+        else:
+            builder = slide.shapes.build_freeform(*emu_points[0])
+            builder.add_line_segments(emu_points[1:], close=False)
+            line_shape = builder.convert_to_shape()
+            line_shape.fill.background()
+        _style_line(line_shape.line, style, point_scale, rgb(deck_styles.color("edge")))
+        _add_arrowheads(line_shape.line, style.get("startArrow", "none") != "none",
+                        style.get("endArrow", "classic") != "none")
+
+        text = "\n".join(filter(None, [cell.value] + labels.get(cell.id, [])))
+        if text:
+            (x1, y1), (x2, y2) = emu_points[len(emu_points) // 2 - 1], emu_points[len(emu_points) // 2]
+            width = int(max(deck_textfit.text_width(line, size=12) for line in text.split("\n")) * EMU_PER_POINT)
+            height = int(len(text.split("\n")) * 12 * 1.4 * EMU_PER_POINT)
+            label_box = slide.shapes.add_textbox((x1 + x2) // 2 - width // 2, (y1 + y2) // 2 - height // 2,
+                                                 width, height)
+            _style_text(label_box.text_frame, text, style, point_scale)
+    return slide
+
+
+class _FixedDateWorkbook:
+    """Workbook writer mixin: stamp WORKBOOK_CREATED so the embedded .xlsx is reproducible"""
+
+    @contextmanager
+    def _open_worksheet(self, xlsx_file):
+        with super()._open_worksheet(xlsx_file) as (workbook, worksheet):
+            workbook.set_properties({"created": WORKBOOK_CREATED})
+            yield workbook, worksheet
+
+
+class _CategoryWorkbookWriter(_FixedDateWorkbook, CategoryWorkbookWriter):
+    pass
+
+
+class _XyWorkbookWriter(_FixedDateWorkbook, XyWorkbookWriter):
+    pass
+
+
+class _CategoryChartData(CategoryChartData):
+    @lazyproperty
+    def _workbook_writer(self):
+        return _CategoryWorkbookWriter(self)
+
+
+class _XyChartData(XyChartData):
+    @lazyproperty
+    def _workbook_writer(self):
+        return _XyWorkbookWriter(self)
+
+
+def chart_data(table, chart_type="line"):
+    """(XL_CHART_TYPE, chart data) plotting a deck_chart.SeriesTable as `chart_type`"""
+    if table.labels is None and chart_type in XY_CHART_TYPES:
+        data = _XyChartData()
+        for name, ys in table.series:
+            series = data.add_series(name)
+            for x, y in zip(table.xs, ys):
+                if not math.isnan(y):
+                    series.add_data_point(x, y)
+        return XY_CHART_TYPES[chart_type], data
+    data = _CategoryChartData()
+    data.categories = table.labels if table.labels is not None else [f"{x:g}" for x in table.xs]
+    for name, ys in table.series:
+        data.add_series(name, [None if math.isnan(y) else y for y in ys])
+    return CHART_TYPES[chart_type], data
+
+
+def chart_table(spec):
+    """The deck_chart.SeriesTable a chart SlideSpec plots: its CSV `source`, else its table"""
+    if spec.source:
+        return deck_chart.read_csv(spec.source)
+    return deck_chart.table_from_rows(spec.headers, spec.rows)
+
+
+def add_chart_slide(prs, title, table, chart_type="line", backend=DEFAULT_BACKEND):
+    """
+    Add a native, editable chart of a deck_chart.SeriesTable.
+
+    The data is embedded in the chart's workbook; series longer than
+    deck_chart.MAX_POINTS are downsampled first so the deck stays small.
+    Series take the theme colors in CHART_SERIES_COLORS order.
+    """
+    slide = new_slide(prs, "title_only")
+    add_slide_title(slide, title, 36, backend)
+    if not len(table):
+        return slide
+
+    xl_type, data = chart_data(deck_chart.downsample(table), chart_type)
+    chart = slide.shapes.add_chart(xl_type, *CHART_AREA, data).chart
+    chart.font.size = Pt(CHART_FONT_SIZE)
+    chart.font.color.rgb = rgb(deck_styles.style("body").color)
+    chart.has_legend = len(table.series) > 1
+    if chart.has_legend:
+        chart.legend.position = XL_LEGEND_POSITION.BOTTOM
+        chart.legend.include_in_layout = False
+    for index, series in enumerate(chart.plots[0].series):
+        color = rgb(deck_styles.color(CHART_SERIES_COLORS[index % len(CHART_SERIES_COLORS)]))
+        if chart_type in ("column", "bar", "area"):
+            series.format.fill.solid()
+            series.format.fill.fore_color.rgb = color
+        elif chart_type == "line":
+            series.format.line.color.rgb = color
+            series.format.line.width = CHART_LINE_WIDTH
+        else:
+            series.marker.format.fill.solid()
+            series.marker.format.fill.fore_color.rgb = color
+            series.format.line.fill.background()
+    return slide
+
+
+def iter_drawio_specs(path):
+    """One diagram SlideSpec per page of a draw.io file, read as the deck reaches it"""
+    for page in deck_drawio.iter_drawio_pages(path):
+        yield SlideSpec(number=0, kind="drawio", title=page.name, items=page.cells,
+                        digest=page.digest, source=path)
+
+
+# Architecture diagrams, rendered ahead of the closing slide
+DIAGRAM_SLIDES = {
+    "system-architecture": add_system_architecture_slide,
+    "agent-architecture": add_agent_architecture_slide,
+    "test-flow": add_test_flow_slide,
+}
+
+
+def render_slide(prs, spec, backend=DEFAULT_BACKEND):
+    """Render one SlideSpec with the matching add_*_slide helper; returns the slides added"""
+    if spec.kind == "diagram":
+        return [DIAGRAM_SLIDES[spec.title](prs, backend)]
+    if spec.kind == "mermaid":
+        return [add_mermaid_slide(prs, spec.title, mermaid_layout(spec))]
+    if spec.kind == "drawio":
+        return [add_drawio_slide(prs, spec.items)]
+    if spec.kind == "title":
+        return [add_title_slide(prs, spec.title, spec.subtitle, spec.tagline or DEFAULT_TAGLINE, backend)]
+    if spec.kind == "closing":
+        return [add_closing_slide(prs, spec.title, spec.subtitle, backend)]
+    if spec.kind == "table":
+        return add_table_slide(prs, spec.title, spec.headers, spec.rows, backend)
+    if spec.kind == "big_number":
+        return add_big_number_slide(prs, spec.title, spec.numbers, backend)
+    if spec.kind == "chart":
+        return [add_chart_slide(prs, spec.title, chart_table(spec), spec.chart, backend)]
+    if spec.images:
+        return [add_image_slide(prs, spec.title, spec.items, spec.images, backend)]
+    return add_content_slide(prs, spec.title, spec.items, spec.layout_type, backend)
+
+
+def iter_deck_specs(source=DEFAULT_SOURCE, diagrams=True, mermaid=None, drawio=None, results=None):
+    """
+    Yield the deck's SlideSpecs in order, diagrams ahead of the closing slide
+
+    With `drawio` (a .drawio file) each of its pages becomes a diagram slide;
+    with `mermaid` (a Markdown file of Mermaid flowcharts) the diagrams are
+    laid out from those flowcharts. Otherwise the built-in diagram slides
+    are used. `results` (JUnit XML / JSON files, see deck_results) add test
+    result summary slides after the diagrams. Diagram and results sources
+    are only read when the deck reaches them.
+    """
+    if not diagrams:
+        pending = iter(())
+    elif drawio:
+        pending = iter_drawio_specs(drawio)
+    elif mermaid:
+        pending = iter_mermaid_specs(mermaid)
+    else:
+        pending = (SlideSpec(number=0, kind="diagram", title=name) for name in DIAGRAM_SLIDES)
+    if results:
+        pending = chain(pending, deck_results.iter_result_specs(results))
+    for spec in iter_slide_specs(source):
+        if spec.kind == "closing":
+            yield from pending
+        yield spec
+    yield from pending
+
+
+def style_fingerprint(template=None):
+    """Hash of the active theme, template and renderer source behind every slide"""
+    hasher = hashlib.sha256()
+    if template:
+        with open(template, "rb") as handle:
+            hasher.update(handle.read())
+    theme = deck_styles.current_theme()
+    hasher.update(repr((theme.name, theme.colors, theme.styles, theme.palettes)).encode("utf-8"))
+    hasher.update(DEFAULT_TAGLINE.encode("utf-8"))
+    for module_file in (__file__, deck_xml.__file__, deck_textfit.__file__, deck_mermaid.__file__,
+                        deck_drawio.__file__, deck_styles.__file__, deck_media.__file__,
+                        deck_layout.__file__, deck_template.__file__, deck_chart.__file__, deck_markdown.__file__,
+                        deck_results.__file__):
+        with open(os.path.abspath(module_file), "rb") as handle:
+            hasher.update(handle.read())
+    return hasher.hexdigest()
+
+
+def slide_helper_name(spec):
+    """Name of the add_*_slide helper render_slide() dispatches `spec` to"""
+    if spec.kind == "diagram":
+        return DIAGRAM_SLIDES[spec.title].__name__
+    if spec.images:
+        return "add_image_slide"
+    return f"add_{spec.kind}_slide"
+
+
+def render_parts(specs, backend=DEFAULT_BACKEND, profiler=None, template=None):
+    """
+    Yield the (slide_xml, rels_xml, media) parts of `specs`, one section at a time.
+
+    Slides are rendered into a scratch presentation and dropped from it as
+    soon as their XML is taken, so memory does not grow with the deck.
+    """
+    scratch = new_presentation(template)
+    for spec in specs:
+        if profiler is None:
+            slides = render_slide(scratch, spec, backend)
+        else:
+            slides, event = profiler.call(slide_helper_name(spec), render_slide, scratch, spec, backend,
+                                          slide=spec.number, kind=spec.kind, title=spec.title)
+            profiler.add_slides(event, slides)
+        parts = [slide_part(slide) for slide in slides]
+        drop_slides(scratch)
+        yield from parts
+
+
+def _render_shard(specs, backend, template, theme, layout_cache_dir):
+    """Worker task of render_sharded(): the parts of one shard of specs, in order"""
+    deck_styles.use_theme(theme)
+    use_layout_cache(layout_cache_dir)
+    return list(render_parts(plan_layouts(specs), backend, template=template))
+
+
+def render_sharded(specs, workers=None, backend=DEFAULT_BACKEND, template=None, shard_size=SHARD_SIZE):
+    """
+    Yield the parts of `specs` like render_parts(), rendered in `workers` processes.
+
+    Specs are cut into shards of `shard_size` as they are parsed, and each
+    shard renders into its own scratch presentation in a worker. Shards
+    come back in deck order; at most two per worker are in flight, so a
+    huge deck never sits in memory whole. write_package() merges the
+    parts: slides are renumbered and shared pictures and charts, named by
+    content in every worker, are written once.
+    """
+    specs = iter(specs)
+    workers = workers or os.cpu_count() or 1
+    theme = deck_styles.current_theme().name
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        while True:
+            while len(pending) < 2 * workers:
+                shard = list(islice(specs, shard_size))
+                if not shard:
+                    break
+                pending.append(pool.submit(_render_shard, shard, backend, template, theme, _layout_cache_dir))
+            if not pending:
+                return
+            yield from pending.popleft().result()
+
+
+def create_presentation(source=DEFAULT_SOURCE, output=DEFAULT_OUTPUT, diagrams=True, backend=DEFAULT_BACKEND,
+                        profiler=None, mermaid=None, drawio=None, theme=None, stream=False, template=None,
+                        results=None, workers=None):
+    """
+    Create a professional PowerPoint presentation from the pitch deck
+
+    Pass a deck_profile.SlideProfiler as `profiler` to time every helper
+    call and prs.save(); without one the build runs uninstrumented.
+    `theme` names a deck_styles theme; by default the active one is kept.
+    See write_presentation() for `stream`, `template` and `workers`.
+    """
+    if theme:
+        deck_styles.use_theme(theme)
+    specs = iter_deck_specs(source, diagrams, mermaid, drawio, results)
+    return write_presentation(specs, output, backend, profiler, stream, template, workers)
+
+
+def write_presentation(specs, output=DEFAULT_OUTPUT, backend=DEFAULT_BACKEND, profiler=None, stream=False,
+                       template=None, workers=None):
+    """
+    Render SlideSpecs, from any mix of sources, to `output`; returns the slide count.
+
+    With `stream`, each slide is deflated into the output as soon as it is
+    rendered and then released, and the parts listing the slides are
+    written last, so peak memory stays flat however long the deck is.
+    The profile then has no separate prs.save() event.
+
+    With `workers` above 1 the deck is streamed the same way, but its
+    slides are rendered in that many processes (see render_sharded()),
+    giving the same bytes as a streamed build. It cannot be profiled.
+
+    With `template` (see deck_template) slides are built on its layouts:
+    titles and bullets go into placeholders and inherit the master's
+    formatting, so each slide's XML holds little more than its text.
+
+    Either way the .pptx is reproducible: the same specs give the same
+    bytes, and an existing output with those bytes is not rewritten.
+    Mermaid layouts are kept in the output's sidecar cache.
+    """
+    use_layout_cache(deck_mermaid.default_cache_dir(output))
+    if workers is not None and workers > 1:
+        if profiler is not None:
+            raise ValueError("a sharded build cannot be profiled")
+        with atomic_output(output) as tmp_path:
+            return write_package(tmp_path, read_skeleton(new_presentation(template)),
+                                 render_sharded(specs, workers, backend, template))
+
+    specs = plan_layouts(specs)
+    if stream:
+        with atomic_output(output) as tmp_path:
+            return write_package(tmp_path, read_skeleton(new_presentation(template)),
+                                 render_parts(specs, backend, profiler, template))
+
+    prs = new_presentation(template)
+
+    # Slides are parsed and rendered one section at a time
+    if profiler is None:
+        for spec in specs:
+            render_slide(prs, spec, backend)
+    else:
+        for spec in specs:
+            slides, event = profiler.call(slide_helper_name(spec), render_slide, prs, spec, backend,
+                                          slide=spec.number, kind=spec.kind, title=spec.title)
+            profiler.add_slides(event, slides)
+
+    # Save presentation
+    with atomic_output(output) as tmp_path:
+        if profiler is None:
+            save_presentation(prs, tmp_path)
+        else:
+            _, event = profiler.call("prs.save", save_presentation, prs, tmp_path)
+            event["bytes"] = os.path.getsize(tmp_path)
+    return len(prs.slides)
+
+
+def build_incremental(source=DEFAULT_SOURCE, output=DEFAULT_OUTPUT, diagrams=True, cache_dir=None,
+                      backend=DEFAULT_BACKEND, mermaid=None, drawio=None, theme=None, template=None,
+                      results=None):
+    """
+    Rebuild the deck re-rendering only slides whose source section changed.
+
+    Rendered slide parts live in a sidecar cache next to the output; clean
+    slides are spliced from the cache into a fresh package. Switching
+    `theme` or `template` invalidates every cached slide. Returns (total_slides,
+    rendered_slides).
+    """
+    if theme:
+        deck_styles.use_theme(theme)
+    cache = SlideCache(cache_dir or output + ".cache")
+    use_layout_cache(os.path.join(cache.directory, "mermaid"))
+    fingerprint = style_fingerprint(template)
+    scratch = new_presentation(template)
+    skeleton = read_skeleton(scratch)
+    keys = []
+    rendered = []
+
+    def parts():
+        for spec in iter_deck_specs(source, diagrams, mermaid, drawio, results):
+            key = slide_key(fingerprint, spec)
+            keys.append(key)
+            spec_parts = cache.get(key)
+            if spec_parts is None:
+                spec_parts = [slide_part(slide) for slide in render_slide(scratch, spec, backend)]
+                drop_slides(scratch)
+                cache.put(key, spec_parts)
+                rendered.append(len(spec_parts))
+            yield from spec_parts
+
+    with atomic_output(output) as tmp_path:
+        total = write_package(tmp_path, skeleton, parts())
+    cache.prune(keys)
+    return total, sum(rendered)
+
+
+def compare_backends(source=DEFAULT_SOURCE, diagrams=True, mermaid=None, drawio=None, theme=None, template=None,
+                     results=None):
+    """
+    Render every slide with both backends and return the specs whose XML differs.
+
+    Slides are compared in canonical (C14N) form, so attribute order does
+    not count as a difference.
+    """
+    from lxml import etree
+
+    if theme:
+        deck_styles.use_theme(theme)
+    fast, proxy = new_presentation(template), new_presentation(template)
+    mismatches = []
+    for spec in iter_deck_specs(source, diagrams, mermaid, drawio, results):
+        fast_xml = [etree.tostring(slide.part._element, method="c14n")
+                    for slide in render_slide(fast, spec, "lxml")]
+        proxy_xml = [etree.tostring(slide.part._element, method="c14n")
+                     for slide in render_slide(proxy, spec, "proxy")]
+        if fast_xml != proxy_xml:
+            mismatches.append(spec)
+    return mismatches
@@ -0,0 +1,472 @@
+#!/usr/bin/env python3
+"""
+Streaming ingest of test results into summary slides
+Usage: python deck_results.py nightly/*.xml report.json -j 4
+
+Reads JUnit XML and JSON result files (a JSON array of test records, an
+object with a "tests" array such as pytest-json-report output, or JSON
+Lines in .jsonl / .ndjson files) one test case at a time: every case is
+folded into per-suite and per-agent totals and a fixed-size heap of the
+slowest tests, then released, so memory stays bounded however many cases
+a nightly run produces. The totals become a big-number slide and
+paginated tables.
+
+A JUnit case's suite is its `<testsuite>` name, else its classname. Its
+agent is its "agent" property (JUnit `<property name="agent">`, a JSON
+"agent" key), falling back to the suite.
+"""
+
+import argparse
+import hashlib
+import heapq
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from xml.etree.ElementTree import XMLPullParser
+
+from deck_markdown import SlideSpec
+
+CHUNK_SIZE = 1 << 16
+SLOWEST_COUNT = 10  # tests on the "slowest" table
+NAME_WIDTH = 60  # longer test and suite names are shortened in tables
+
+STATUSES = ("passed", "failed", "error", "skipped")
+# Result spellings of common runners -> STATUSES
+STATUS_ALIASES = {
+    "pass": "passed", "ok": "passed", "success": "passed", "xpassed": "passed",
+    "fail": "failed", "failure": "failed",
+    "errored": "error", "broken": "error",
+    "skip": "skipped", "pending": "skipped", "xfailed": "skipped", "disabled": "skipped",
+}
+# Children of <testcase> that set its status
+JUNIT_OUTCOMES = {"failure": "failed", "error": "error", "skipped": "skipped"}
+
+
+class ResultsError(ValueError):
+    """A results file that is neither JUnit XML nor a JSON results document"""
+
+
+@dataclass
+class TestCase:
+    """One test result"""
+    __slots__ = ("suite", "name", "status", "seconds", "agent")
+    suite: str
+    name: str
+    status: str
+    seconds: float
+    agent: str
+
+
+class SuiteTotals:
+    """Aggregates of the cases of one suite (or agent)"""
+    __slots__ = ("tests", "failed", "errors", "skipped", "seconds")
+
+    def __init__(self):
+        self.tests = self.failed = self.errors = self.skipped = 0
+        self.seconds = 0.0
+
+    def add(self, case):
+        self.tests += 1
+        self.seconds += case.seconds
+        if case.status == "failed":
+            self.failed += 1
+        elif case.status == "error":
+            self.errors += 1
+        elif case.status == "skipped":
+            self.skipped += 1
+
+    def merge(self, other):
+        self.tests += other.tests
+        self.failed += other.failed
+        self.errors += other.errors
+        self.skipped += other.skipped
+        self.seconds += other.seconds
+
+    @property
+    def failures(self):
+        """Failed and errored cases"""
+        return self.failed + self.errors
+
+    @property
+    def pass_rate(self):
+        """Percentage of the cases that ran (not skipped) that passed"""
+        ran = self.tests - self.skipped
+        return 100.0 * (ran - self.failures) / ran if ran else 100.0
+
+
+class ResultSummary:
+    """
+    Single-pass aggregate of any number of test cases.
+
+    Memory grows with the number of suites and agents, not cases: the
+    slowest tests are kept in a min-heap of `slowest` entries, ordered by
+    (seconds, suite, name) so the same cases give the same summary in any
+    order - and summaries of separate files merge to the serial result.
+    """
+
+    def __init__(self, slowest=SLOWEST_COUNT):
+        self.limit = slowest
+        self.total = SuiteTotals()
+        self.suites = {}
+        self.agents = {}
+        self.runs = []  # (results file name, SuiteTotals) per file, in the order given
+        self._slowest = []
+
+    def add(self, case):
+        self.total.add(case)
+        suite = self.suites.get(case.suite)
+        if suite is None:
+            suite = self.suites[case.suite] = SuiteTotals()
+        suite.add(case)
+        agent = self.agents.get(case.agent)
+        if agent is None:
+            agent = self.agents[case.agent] = SuiteTotals()
+        agent.add(case)
+        entry = (case.seconds, case.suite, case.name)
+        if len(self._slowest) < self.limit:
+            heapq.heappush(self._slowest, entry)
+        elif entry > self._slowest[0]:
+            heapq.heapreplace(self._slowest, entry)
+
+    def merge(self, other):
+        """Fold another summary into this one"""
+        self.total.merge(other.total)
+        for mine, theirs in ((self.suites, other.suites), (self.agents, other.agents)):
+            for name, totals in theirs.items():
+                mine.setdefault(name, SuiteTotals()).merge(totals)
+        for entry in other._slowest:
+            if len(self._slowest) < self.limit:
+                heapq.heappush(self._slowest, entry)
+            elif entry > self._slowest[0]:
+                heapq.heapreplace(self._slowest, entry)
+
+    def slowest(self):
+        """(seconds, suite, name) of the slowest cases, slowest first"""
+        return sorted(self._slowest, reverse=True)
+
+
+def _local(tag):
+    """Tag name without its XML namespace"""
+    return tag.rpartition("}")[2]
+
+
+def _seconds(value):
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _status(value):
+    status = str(value or "passed").lower()
+    status = STATUS_ALIASES.get(status, status)
+    return status if status in STATUSES else "error"
+
+
+def _iter_events(handle):
+    """(event, element) pairs for start/end tags, parsed incrementally"""
+    parser = XMLPullParser(events=("start", "end"))
+    for chunk in iter(lambda: handle.read(CHUNK_SIZE), b""):
+        parser.feed(chunk)
+        yield from parser.read_events()
+    parser.close()
+    yield from parser.read_events()
+
+
+def iter_junit_cases(path):
+    """
+    Yield a TestCase per `<testcase>` of a JUnit XML file.
+
+    Each case is released (with its output and failure text) once read,
+    so only the currently open suites stay in memory.
+    """
+    default_suite = os.path.splitext(os.path.basename(path))[0]
+    stack = []
+    suites = []
+    open_cases = 0
+    with open(path, "rb") as handle:
+        for event, element in _iter_events(handle):
+            tag = _local(element.tag)
+            if event == "start":
+                stack.append(element)
+                if tag == "testcase":
+                    open_cases += 1
+                elif tag == "testsuite":
+                    suites.append(element.get("name") or (suites[-1] if suites else None))
+                continue
+
+            stack.pop()
+            if tag == "testcase":
+                open_cases -= 1
+            elif open_cases:
+                continue  # read along with its test case
+            if tag == "testcase":
+                status, agent = "passed", None
+                for child in element:
+                    child_tag = _local(child.tag)
+                    if child_tag in JUNIT_OUTCOMES and status == "passed":
+                        status = JUNIT_OUTCOMES[child_tag]
+                    elif child_tag == "properties":
+                        for prop in child:
+                            if prop.get("name") == "agent":
+                                agent = prop.get("value")
+                suite = (suites[-1] if suites else None) or element.get("classname") or default_suite
+                yield TestCase(suite, element.get("name", ""), status, _seconds(element.get("time")),
+                               agent or suite)
+            elif tag == "testsuite":
+                suites.pop()
+            element.clear()
+            if stack:
+                stack[-1].remove(element)
+
+
+def _json_case(record, default_suite):
+    """TestCase from one JSON test record (generic keys or pytest-json-report's)"""
+    nodeid = record.get("nodeid", "")
+    module, _, test = nodeid.rpartition("::")
+    suite = record.get("suite") or record.get("classname") or module or default_suite
+    name = record.get("name") or test or nodeid
+    if "duration" in record or "time" in record:
+        seconds = _seconds(record.get("duration", record.get("time")))
+    else:  # pytest-json-report: per-phase durations
+        seconds = sum(_seconds(record[phase].get("duration")) for phase in ("setup", "call", "teardown")
+                      if isinstance(record.get(phase), dict))
+    agent = record.get("agent") or (record.get("metadata") or {}).get("agent") or suite
+    return TestCase(str(suite), str(name), _status(record.get("status", record.get("outcome"))), seconds,
+                    str(agent))
+
+
+class _JsonStream:
+    """Incremental reader of JSON values from a text file, one buffered chunk at a time"""
+
+    def __init__(self, handle):
+        self.handle = handle
+        self.buffer = ""
+        self.pos = 0
+        self.decoder = json.JSONDecoder()
+
+    def peek(self):
+        """Next non-whitespace character, or "" at the end of the file"""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in " \t\r\n":
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise ResultsError(f"expected {char!r} at offset {self.pos}")
+        self.pos += 1
+
+    def value(self):
+        """Decode the next complete value, reading more of the file as needed"""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A number may continue in the next chunk
+            if end == len(self.buffer) and self.buffer[end - 1].isdigit() and self._fill():
+                continue
+            self.pos = end
+            return value
+
+    def _fill(self):
+        chunk = self.handle.read(CHUNK_SIZE)
+        if not chunk:
+            return False
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def items(self):
+        """Yield the elements of the array starting here"""
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield self.value()
+            separator = self.peek()
+            self.pos += 1
+            if separator == "]":
+                return
+            if separator != ",":
+                raise ResultsError(f"expected ',' or ']' at offset {self.pos - 1}")
+
+
+def iter_json_cases(path, lines=False):
+    """
+    Yield a TestCase per test record of a JSON results file.
+
+    A top-level array, or the "tests" array of a top-level object, is
+    decoded one record at a time; other keys of the object are skipped.
+    With `lines`, the file is JSON Lines: one record after another.
+    """
+    default_suite = os.path.splitext(os.path.basename(path))[0]
+    with open(path, encoding="utf-8") as handle:
+        stream = _JsonStream(handle)
+        if lines:
+            records = _json_lines(stream)
+        elif stream.peek() == "[":
+            records = stream.items()
+        elif stream.peek() == "{":
+            records = _object_tests(stream)
+        else:
+            raise ResultsError(f"{path}: expected a JSON array or object of test results")
+        for record in records:
+            if isinstance(record, dict):
+                yield _json_case(record, default_suite)
+
+
+def _object_tests(stream):
+    stream.expect("{")
+    while stream.peek() not in ("}", ""):
+        key = stream.value()
+        stream.expect(":")
+        if key == "tests" and stream.peek() == "[":
+            yield from stream.items()
+        else:
+            stream.value()
+        if stream.peek() == ",":
+            stream.pos += 1
+
+
+def _json_lines(stream):
+    while stream.peek():
+        yield stream.value()
+
+
+def iter_cases(path):
+    """TestCases of a JUnit XML (.xml) or JSON (.json, .jsonl, .ndjson) results file"""
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".xml":
+        return iter_junit_cases(path)
+    if ext in (".json", ".jsonl", ".ndjson"):
+        return iter_json_cases(path, lines=ext != ".json")
+    raise ResultsError(f"{path}: unknown results format (expected .xml, .json, .jsonl or .ndjson)")
+
+
+def summarize_file(path, slowest=SLOWEST_COUNT):
+    """ResultSummary of one results file"""
+    summary = ResultSummary(slowest)
+    for case in iter_cases(path):
+        summary.add(case)
+    return summary
+
+
+def summarize(paths, workers=None, slowest=SLOWEST_COUNT):
+    """
+    ResultSummary of every file in `paths`; several files are read in
+    parallel by `workers` processes and their summaries merged in order.
+    """
+    paths = list(paths)
+    if len(paths) == 1 or workers == 1:
+        summaries = [summarize_file(path, slowest) for path in paths]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            summaries = list(pool.map(summarize_file, paths, [slowest] * len(paths)))
+    summary = ResultSummary(slowest)
+    for path, part in zip(paths, summaries):
+        summary.merge(part)
+        summary.runs.append((os.path.splitext(os.path.basename(path))[0], part.total))
+    return summary
+
+
+def shorten(text, width=NAME_WIDTH):
+    """`text` cut to `width` characters with an ellipsis"""
+    return text if len(text) <= width else text[:width - 1] + "…"
+
+
+def format_seconds(seconds):
+    """Human duration: 850 ms, 12.3 s, 4m 05s, 2h 13m"""
+    if seconds < 1:
+        return f"{seconds * 1000:.0f} ms"
+    if seconds < 60:
+        return f"{seconds:.1f} s"
+    minutes, seconds = divmod(round(seconds), 60)
+    if minutes < 60:
+        return f"{minutes}m {seconds:02d}s"
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h {minutes:02d}m"
+
+
+def _spec(kind, title, **fields):
+    digest = hashlib.sha256(repr((kind, title, sorted(fields.items()))).encode("utf-8")).hexdigest()
+    return SlideSpec(number=0, kind=kind, title=title, digest=digest, **fields)
+
+
+def result_specs(summary, title="🧪 Test Results"):
+    """
+    SlideSpecs for a ResultSummary: the headline numbers, then tables of
+    every suite (worst first), the slowest tests and, when anything
+    failed, failures by agent. Tables paginate like any deck table.
+    Several results files are taken as successive runs and also get a
+    pass-rate trend chart.
+    """
+    total = summary.total
+    numbers = [(f"{total.tests:,}", "Tests Run"), (f"{total.pass_rate:.1f}%", "Pass Rate"),
+               (f"{total.failures:,}", "Failures"), (format_seconds(total.seconds), "Total Test Time")]
+    if total.skipped:
+        numbers.append((f"{total.skipped:,}", "Skipped"))
+    specs = [_spec("big_number", title, numbers=numbers)]
+
+    suites = sorted(summary.suites.items(), key=lambda item: (-item[1].failures, item[0]))
+    specs.append(_spec("table", "📋 Results by Suite",
+                       headers=["Suite", "Tests", "Failures", "Skipped", "Pass Rate", "Time"],
+                       rows=[[shorten(name), f"{totals.tests:,}", f"{totals.failures:,}", f"{totals.skipped:,}",
+                              f"{totals.pass_rate:.1f}%", format_seconds(totals.seconds)]
+                             for name, totals in suites]))
+    if summary.slowest():
+        specs.append(_spec("table", "🐢 Slowest Tests", headers=["Test", "Suite", "Time"],
+                           rows=[[shorten(name), shorten(suite), format_seconds(seconds)]
+                                 for seconds, suite, name in summary.slowest()]))
+    failing = sorted(((name, totals) for name, totals in summary.agents.items() if totals.failures),
+                     key=lambda item: (-item[1].failures, item[0]))
+    if failing:
+        specs.append(_spec("table", "🚨 Failures by Agent", headers=["Agent", "Failures", "Tests", "Failure Rate"],
+                           rows=[[shorten(name), f"{totals.failures:,}", f"{totals.tests:,}",
+                                  f"{100 - totals.pass_rate:.1f}%"] for name, totals in failing]))
+    if len(summary.runs) > 1:
+        specs.append(_spec("chart", "📈 Pass Rate by Run", chart="line", headers=["Run", "Pass Rate (%)"],
+                           rows=[[name, f"{totals.pass_rate:.2f}"] for name, totals in summary.runs]))
+    return specs
+
+
+def iter_result_specs(paths, workers=None):
+    """result_specs() of the summary of `paths`, ingested when the deck reaches them"""
+    yield from result_specs(summarize(paths, workers))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Summarize JUnit XML / JSON test results")
+    parser.add_argument("results", nargs="+", help="results files (.xml, .json, .jsonl, .ndjson)")
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count(), help="files read in parallel")
+    parser.add_argument("--slowest", type=int, default=SLOWEST_COUNT, help="slowest tests to list")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    try:
+        summary = summarize(args.results, args.workers, args.slowest)
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}")
+        return 1
+    elapsed = time.perf_counter() - started
+    total = summary.total
+    print(f"🧪 {total.tests:,} tests in {len(summary.suites):,} suites: {total.pass_rate:.1f}% passed, "
+          f"{total.failures:,} failed, {total.skipped:,} skipped ({format_seconds(total.seconds)})")
+    for seconds, suite, name in summary.slowest():
+        print(f"🐢 {format_seconds(seconds):>9}  {suite} :: {name}")
+    print(f"⏱️  Ingested in {elapsed:.2f}s ({total.tests / elapsed if elapsed else 0:,.0f} tests/s)")
+    return 1 if total.failures else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
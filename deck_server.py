@@ -0,0 +1,575 @@
+#!/usr/bin/env python3
+"""
+Render service: a long-lived local server that turns slide-spec JSON into .pptx bytes
+Usage: python deck_server.py serve --port 8765 -j 4 --template deck-template.pptx
+       python deck_server.py render report.json -o report.pptx --server http://127.0.0.1:8765
+
+Worker processes import python-pptx, parse the default and every --template
+presentation and render a warm-up deck once at startup, so a request pays
+only for its own slides. A request is POSTed to /render as JSON:
+
+    {"theme": "emerald", "template": "deck-template.pptx", "slides": [
+        {"kind": "title", "title": "Nightly Report", "subtitle": "Build 1234"},
+        {"kind": "content", "title": "Highlights", "items": ["All suites green"]},
+        {"kind": "table", "title": "Suites", "headers": ["Suite", "Passed"], "rows": [["api", "120"]]},
+        {"kind": "chart", "chart": "line", "title": "Pass Rate", "headers": ["Run", "%"], "rows": [["1", "97"]]}
+    ]}
+
+Slides take the fields of deck_markdown.SlideSpec (`number` defaults to
+the slide's position) except the ones naming files: pictures and CSV chart
+data are not read from the server's disk. Instead of `slides`, `markdown` may hold the text of
+a `## Slide N:` deck. `template` names a template the server was started
+with. The response is the .pptx, with X-Slides, X-Queue-Ms and X-Render-Ms
+headers.
+
+At most `workers` requests render at once and `queue` more wait for a
+worker; beyond that the server answers 503 at once. GET /metrics reports
+queue depth and latency percentiles over the recent requests, GET /health
+the pool size. With --socket the server listens on a Unix socket instead
+of a TCP port.
+"""
+
+import argparse
+import http.client
+import io
+import json
+import os
+import signal
+import socket
+import socketserver
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from deck_markdown import CHART_TYPES, LAYOUT_TYPES, SLIDE_KINDS, SlideSpec, iter_slide_specs
+from deck_styles import DEFAULT_THEME, THEMES
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_SERVER = f"http://{DEFAULT_HOST}:{DEFAULT_PORT}"
+MAX_REQUEST_BYTES = 32 << 20
+LATENCY_WINDOW = 1000  # most recent requests the latency percentiles cover
+PPTX_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.presentationml.presentation"
+
+# SlideSpec fields a request may set, by the JSON shape each takes. Fields naming
+# files (images, chart CSV `source`) are left out: requests never read server paths
+SPEC_FIELDS = {
+    "number": "an integer", "kind": "a string", "title": "a string", "subtitle": "a string", "tagline": "a string",
+    "items": "a list of strings", "layout_type": "a string", "headers": "a list of strings",
+    "rows": "a list of rows of strings", "numbers": "a list of [value, label] pairs", "chart": "a string",
+}
+
+# Rendered in every worker at startup so imports, templates and caches are warm
+WARMUP_SLIDES = [
+    {"kind": "title", "title": "Warm-up", "subtitle": "Render service"},
+    {"kind": "content", "title": "Warm-up", "items": ["Bullet", "  • Sub-bullet"]},
+    {"kind": "content", "title": "Warm-up", "items": ["Left", "Right"], "layout_type": "two_column"},
+    {"kind": "table", "title": "Warm-up", "headers": ["A", "B"], "rows": [["1", "2"]]},
+    {"kind": "big_number", "title": "Warm-up", "numbers": [["80%", "Less effort"]]},
+    {"kind": "chart", "chart": "line", "title": "Warm-up", "headers": ["x", "y"], "rows": [["1", "2"], ["2", "3"]]},
+    {"kind": "closing", "title": "Warm-up", "subtitle": "Done"},
+]
+
+
+class RequestError(ValueError):
+    """A render request that does not describe a buildable deck"""
+
+
+class QueueFull(RuntimeError):
+    """Every worker is busy and the wait queue is full"""
+
+
+def _is_cell(value):
+    """Table cells and metric values may be strings or plain numbers"""
+    return isinstance(value, str) or (isinstance(value, (int, float)) and not isinstance(value, bool))
+
+
+def _has_shape(value, shape):
+    if shape == "an integer":
+        return isinstance(value, int) and not isinstance(value, bool)
+    if shape == "a string":
+        return isinstance(value, str)
+    if not isinstance(value, list):
+        return False
+    if shape == "a list of strings":
+        return all(isinstance(item, str) for item in value)
+    if shape == "a list of rows of strings":
+        return all(isinstance(row, list) and all(map(_is_cell, row)) for row in value)
+    return all(isinstance(pair, list) and len(pair) == 2 and all(map(_is_cell, pair)) for pair in value)
+
+
+def spec_from_dict(data, number):
+    """Build a SlideSpec from one request slide object, checking its kind and the type of every field"""
+    if not isinstance(data, dict):
+        raise RequestError(f"slide {number}: expected an object, got {type(data).__name__}")
+    unknown = sorted(set(data) - set(SPEC_FIELDS))
+    if unknown:
+        raise RequestError(f"slide {number}: unknown field(s) {', '.join(unknown)}")
+    for name, value in data.items():
+        if not _has_shape(value, SPEC_FIELDS[name]):
+            raise RequestError(f"slide {number}: `{name}` must be {SPEC_FIELDS[name]}")
+    kind = data.get("kind", "content")
+    if kind not in SLIDE_KINDS:
+        raise RequestError(f"slide {number}: kind must be one of {', '.join(SLIDE_KINDS)}, not {kind!r}")
+    if kind == "chart" and data.get("chart", "line") not in CHART_TYPES:
+        raise RequestError(f"slide {number}: chart must be one of {', '.join(CHART_TYPES)}")
+    if data.get("layout_type", "bullet") not in LAYOUT_TYPES:
+        raise RequestError(f"slide {number}: layout_type must be one of {', '.join(LAYOUT_TYPES)}")
+    spec = SlideSpec(**{"number": number, "title": "", **data, "kind": kind})
+    spec.numbers = [(str(value), str(label)) for value, label in spec.numbers]
+    spec.rows = [[str(cell) for cell in row] for row in spec.rows]
+    if kind == "chart":
+        spec.chart = spec.chart or "line"
+    check_slide_data(spec)
+    return spec
+
+
+def check_slide_data(spec):
+    """Reject table and chart slides with nothing to lay out, which would otherwise fail mid-render"""
+    if spec.kind == "table" and not spec.headers:
+        raise RequestError(f"slide {spec.number}: a table needs at least one header")
+    if spec.kind == "chart" and len(spec.headers) < 2:
+        raise RequestError(f"slide {spec.number}: a chart needs an x column and at least one series column")
+
+
+def parse_request(request, templates=()):
+    """
+    Validate a decoded /render request; returns (specs, theme, template path or None).
+
+    `templates` maps the template names a request may use to their paths.
+    """
+    if not isinstance(request, dict):
+        raise RequestError("request must be a JSON object")
+    theme = request.get("theme") or DEFAULT_THEME
+    if theme not in THEMES:
+        raise RequestError(f"theme must be one of {', '.join(THEMES)}")
+    template = request.get("template")
+    if template is not None and template not in templates:
+        raise RequestError(f"template {template!r} is not loaded (start the server with --template)")
+    if ("slides" in request) == ("markdown" in request):
+        raise RequestError("request needs exactly one of `slides` or `markdown`")
+    if "markdown" in request:
+        if not isinstance(request["markdown"], str):
+            raise RequestError("`markdown` must be a string")
+        specs = list(iter_slide_specs(request["markdown"].splitlines()))
+        for spec in specs:
+            if spec.images or spec.source:
+                raise RequestError(f"slide {spec.number}: images and `<!-- data: -->` files are not "
+                                   "served; send chart data as a table")
+            check_slide_data(spec)
+    else:
+        if not isinstance(request["slides"], list):
+            raise RequestError("`slides` must be a list")
+        specs = [spec_from_dict(slide, number) for number, slide in enumerate(request["slides"], 1)]
+    if not specs:
+        raise RequestError("request has no slides")
+    return specs, theme, templates[template] if template is not None else None
+
+
+# Per-worker state: (scratch presentation, skeleton) for each template, built once
+_presentations = {}
+
+
+def _presentation(template):
+    from deck_package import read_skeleton
+    from deck_render import new_presentation
+
+    if template not in _presentations:
+        _presentations[template] = new_presentation(template), read_skeleton(new_presentation(template))
+    return _presentations[template]
+
+
+def _warm_worker(templates):
+    """Worker initializer: import the renderer, parse every template and render the warm-up deck once"""
+    warmup = [spec_from_dict(slide, number) for number, slide in enumerate(WARMUP_SLIDES, 1)]
+    for template in (None, *templates):
+        render_request(warmup, DEFAULT_THEME, template)
+
+
+def render_request(specs, theme=DEFAULT_THEME, template=None, backend="lxml"):
+    """
+    Render `specs` to .pptx bytes on this process's warm scratch presentation.
+
+    Returns (pptx bytes, slide count, render seconds). The output is the
+    same as a streamed build of the same specs.
+    """
+    import deck_styles
+    from deck_package import drop_slides, slide_part, write_package
+    from deck_render import plan_layouts, render_slide
+
+    started = time.perf_counter()
+    deck_styles.use_theme(theme)
+    scratch, skeleton = _presentation(template)
+
+    def parts():
+        for spec in plan_layouts(specs):
+            spec_parts = [slide_part(slide) for slide in render_slide(scratch, spec, backend)]
+            drop_slides(scratch)
+            yield from spec_parts
+
+    buffer = io.BytesIO()
+    try:
+        count = write_package(buffer, skeleton, parts())
+    finally:
+        drop_slides(scratch)
+    return buffer.getvalue(), count, time.perf_counter() - started
+
+
+def percentiles(values):
+    """p50 / p95 / p99 / max of `values` in milliseconds (nearest rank)"""
+    if not values:
+        return {}
+    ordered = sorted(values)
+
+    def rank(q):
+        return ordered[min(len(ordered) - 1, max(0, round(q * len(ordered)) - 1))]
+
+    return {name: round(value * 1000, 2)
+            for name, value in (("p50", rank(0.5)), ("p95", rank(0.95)), ("p99", rank(0.99)), ("max", ordered[-1]))}
+
+
+class RenderService:
+    """
+    A warm worker pool with a bounded queue and latency metrics.
+
+    At most `workers` requests render at once and `queue` more wait;
+    render() raises QueueFull beyond that instead of letting work pile up.
+    """
+
+    def __init__(self, workers=None, queue=None, templates=()):
+        self.workers = workers or os.cpu_count() or 1
+        self.queue = self.workers * 4 if queue is None else queue
+        self.templates = {}
+        for path in templates:
+            path = os.path.abspath(path)
+            self.templates[os.path.basename(path)] = path
+            self.templates[path] = path
+        self._slots = threading.BoundedSemaphore(self.workers + self.queue)
+        self._lock = threading.Lock()
+        self._restart_lock = threading.Lock()
+        self._in_flight = 0
+        self._samples = deque(maxlen=LATENCY_WINDOW)
+        self.counts = {"requests": 0, "failed": 0, "rejected": 0, "slides": 0}
+        self._pool = self._start_pool()
+
+    def _start_pool(self):
+        paths = sorted(set(self.templates.values()))
+        pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_warm_worker, initargs=(paths,))
+        # Start (and warm) every worker now rather than on the first requests
+        for future in [pool.submit(os.getpid) for _ in range(self.workers)]:
+            future.result()
+        return pool
+
+    def render(self, request):
+        """Render a decoded request; returns (pptx bytes, slides, queue seconds, render seconds)"""
+        specs, theme, template = parse_request(request, self.templates)
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.counts["rejected"] += 1
+            raise QueueFull(f"{self.workers} worker(s) busy and {self.queue} request(s) queued")
+        started = time.perf_counter()
+        with self._lock:
+            self._in_flight += 1
+            pool = self._pool
+        try:
+            data, slides, render_seconds = pool.submit(render_request, specs, theme, template).result()
+        except BrokenProcessPool:
+            self._finish(None)
+            self._restart_pool(pool)
+            raise
+        except Exception:
+            self._finish(None)
+            raise
+        finally:
+            self._slots.release()
+        total = time.perf_counter() - started
+        queue_seconds = max(0.0, total - render_seconds)
+        self._finish((total, queue_seconds, render_seconds), slides)
+        return data, slides, queue_seconds, render_seconds
+
+    def _finish(self, sample, slides=0):
+        with self._lock:
+            self._in_flight -= 1
+            if sample is None:
+                self.counts["failed"] += 1
+            else:
+                self.counts["requests"] += 1
+                self.counts["slides"] += slides
+                self._samples.append(sample)
+
+    def _restart_pool(self, broken):
+        # A worker died (out of memory, killed); later requests get a fresh pool
+        with self._restart_lock:
+            if self._pool is not broken:
+                return  # another request already replaced it
+            broken.shutdown(wait=False, cancel_futures=True)
+            pool = self._start_pool()
+            with self._lock:
+                self._pool = pool
+
+    def metrics(self):
+        """Queue depth, request counts and latency percentiles as a JSON-ready dict"""
+        with self._lock:
+            samples = list(self._samples)
+            in_flight = self._in_flight
+            counts = dict(self.counts)
+        totals, queued, rendered = zip(*samples) if samples else ((), (), ())
+        return {"workers": self.workers, "queue_limit": self.queue, "in_flight": in_flight,
+                "queued": max(0, in_flight - self.workers), **counts, "window": len(samples),
+                "latency_ms": {"total": percentiles(totals), "queue": percentiles(queued),
+                               "render": percentiles(rendered)}}
+
+    def close(self):
+        self._pool.shutdown(cancel_futures=True)
+
+
+class RenderHandler(BaseHTTPRequestHandler):
+    """HTTP front end of the server's RenderService"""
+    server_version = "DeckRender/1.0"
+    protocol_version = "HTTP/1.1"
+
+    def address_string(self):
+        # Unix socket peers have no address
+        return self.client_address[0] if isinstance(self.client_address, tuple) else "local"
+
+    def log_message(self, format, *args):
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+    def _send(self, status, body, content_type="application/json", headers=()):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, status, document, headers=()):
+        self._send(status, json.dumps(document).encode("utf-8"), headers=headers)
+
+    def do_GET(self):
+        service = self.server.service
+        if self.path == "/metrics":
+            self._send_json(200, service.metrics())
+        elif self.path == "/health":
+            self._send_json(200, {"status": "ok", "workers": service.workers})
+        else:
+            self._send_json(404, {"error": f"no such endpoint: {self.path}"})
+
+    def do_POST(self):
+        if self.path != "/render":
+            self._send_json(404, {"error": f"no such endpoint: {self.path}"})
+            return
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > MAX_REQUEST_BYTES:
+            self.close_connection = True
+            self._send_json(413, {"error": f"request larger than {MAX_REQUEST_BYTES} bytes"})
+            return
+        try:
+            request = json.loads(self.rfile.read(length))
+            data, slides, queue_seconds, render_seconds = self.server.service.render(request)
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            self._send_json(400, {"error": f"invalid JSON: {e}"})
+        except RequestError as e:
+            self._send_json(400, {"error": str(e)})
+        except QueueFull as e:
+            self._send_json(503, {"error": str(e)}, headers=[("Retry-After", "1")])
+        except Exception as e:
+            self._send_json(500, {"error": f"{type(e).__name__}: {e}"})
+        else:
+            self._send(200, data, PPTX_CONTENT_TYPE,
+                       headers=[("X-Slides", str(slides)), ("X-Queue-Ms", f"{queue_seconds * 1000:.2f}"),
+                                ("X-Render-Ms", f"{render_seconds * 1000:.2f}")])
+
+
+class UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """ThreadingHTTPServer's Unix socket counterpart"""
+    daemon_threads = True
+
+    def server_bind(self):
+        if os.path.exists(self.server_address):
+            os.remove(self.server_address)  # stale socket from a previous run
+        super().server_bind()
+        os.chmod(self.server_address, 0o600)
+
+
+def make_server(service, host=DEFAULT_HOST, port=DEFAULT_PORT, socket_path=None, quiet=False):
+    """An HTTP server for `service` on host:port, or on the Unix socket `socket_path`"""
+    if socket_path:
+        server = UnixHTTPServer(socket_path, RenderHandler)
+    else:
+        server = ThreadingHTTPServer((host, port), RenderHandler)
+    server.service = service
+    server.quiet = quiet
+    return server
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    """http.client connection over a Unix socket"""
+
+    def __init__(self, path, timeout=None):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.socket_path)
+
+
+def connect(server=DEFAULT_SERVER, timeout=None):
+    """A connection to `server`: an http://host:port URL or a Unix socket path"""
+    if server.startswith("http://"):
+        host, _, port = server[len("http://"):].rstrip("/").partition(":")
+        return http.client.HTTPConnection(host, int(port or 80), timeout=timeout)
+    return UnixHTTPConnection(server, timeout=timeout)
+
+
+def render_remote(request, server=DEFAULT_SERVER, timeout=None):
+    """
+    POST `request` (a dict) to a render server.
+
+    Returns (pptx bytes, {"slides", "queue_ms", "render_ms", "total_ms"});
+    raises RuntimeError with the server's message on an error response.
+    """
+    body = json.dumps(request).encode("utf-8")
+    started = time.perf_counter()
+    connection = connect(server, timeout)
+    try:
+        connection.request("POST", "/render", body, {"Content-Type": "application/json"})
+        response = connection.getresponse()
+        data = response.read()
+    finally:
+        connection.close()
+    if response.status != 200:
+        try:
+            message = json.loads(data)["error"]
+        except (ValueError, KeyError, TypeError):
+            message = data.decode("utf-8", "replace")
+        raise RuntimeError(f"HTTP {response.status}: {message}")
+    return data, {"slides": int(response.getheader("X-Slides")),
+                  "queue_ms": float(response.getheader("X-Queue-Ms")),
+                  "render_ms": float(response.getheader("X-Render-Ms")),
+                  "total_ms": (time.perf_counter() - started) * 1000}
+
+
+def fetch_metrics(server=DEFAULT_SERVER, timeout=None):
+    """The server's /metrics document"""
+    connection = connect(server, timeout)
+    try:
+        connection.request("GET", "/metrics")
+        return json.loads(connection.getresponse().read())
+    finally:
+        connection.close()
+
+
+def load_request(path):
+    """A request dict from a JSON request file, or a Markdown deck wrapped as `markdown`"""
+    with open(path, encoding="utf-8") as handle:
+        if path.endswith(".md"):
+            return {"markdown": handle.read()}
+        return json.load(handle)
+
+
+def serve(args):
+    started = time.perf_counter()
+    service = RenderService(args.workers, args.queue, args.template or ())
+    server = make_server(service, args.host, args.port, args.socket, args.quiet)
+    where = args.socket or f"http://{args.host}:{server.server_address[1]}"
+    print(f"🚀 Render service on {where}: {service.workers} warm worker(s), "
+          f"queue of {service.queue}, ready in {time.perf_counter() - started:.2f}s")
+
+    def stop(signum, frame):
+        raise KeyboardInterrupt
+
+    signal.signal(signal.SIGTERM, stop)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+        if args.socket and os.path.exists(args.socket):
+            os.remove(args.socket)
+        print("👋 Render service stopped")
+    return 0
+
+
+def render(args):
+    request = load_request(args.request)
+    if args.theme:
+        request["theme"] = args.theme
+    if args.template:
+        request["template"] = args.template
+    latencies = []
+    for _ in range(args.repeat):
+        data, timing = render_remote(request, args.server)
+        latencies.append(timing["total_ms"] / 1000)
+    tmp_path = f"{args.output}.tmp"
+    with open(tmp_path, "wb") as handle:
+        handle.write(data)
+    os.replace(tmp_path, args.output)
+    print(f"✅ {args.output}: {timing['slides']} slides, {len(data)} bytes")
+    print(f"⏱️  {timing['total_ms']:.1f} ms round trip (queue {timing['queue_ms']:.1f} ms, "
+          f"render {timing['render_ms']:.1f} ms)")
+    if args.repeat > 1:
+        summary = ", ".join(f"{name} {value:.1f}" for name, value in percentiles(latencies).items())
+        print(f"📊 {args.repeat} requests, round trip ms: {summary}")
+    return 0
+
+
+def metrics(args):
+    print(json.dumps(fetch_metrics(args.server), indent=2))
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local render service for slide-spec JSON")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve_parser = commands.add_parser("serve", help="run the render service")
+    serve_parser.add_argument("--host", default=DEFAULT_HOST, help=f"address to listen on (default: {DEFAULT_HOST})")
+    serve_parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"TCP port (default: {DEFAULT_PORT})")
+    serve_parser.add_argument("--socket", metavar="PATH", help="listen on a Unix socket instead of a TCP port")
+    serve_parser.add_argument("-j", "--workers", type=int, default=os.cpu_count(), help="warm worker processes")
+    serve_parser.add_argument("--queue", type=int, metavar="N",
+                              help="requests that may wait for a worker before new ones get 503 (default: 4 per worker)")
+    serve_parser.add_argument("--template", action="append", metavar="PATH",
+                              help="master template .pptx to preload; requests name it by path or file name "
+                                   "(repeatable)")
+    serve_parser.add_argument("--quiet", action="store_true", help="do not log each request")
+    serve_parser.set_defaults(run=serve)
+
+    render_parser = commands.add_parser("render", help="send a request to a running service")
+    render_parser.add_argument("request", help="request .json file, or a Markdown deck (.md)")
+    render_parser.add_argument("-o", "--output", required=True, help="output .pptx path")
+    render_parser.add_argument("--server", default=DEFAULT_SERVER,
+                               help=f"server URL or Unix socket path (default: {DEFAULT_SERVER})")
+    render_parser.add_argument("--theme", choices=THEMES, help="override the request's theme")
+    render_parser.add_argument("--template", help="override the request's template")
+    render_parser.add_argument("-n", "--repeat", type=int, default=1,
+                               help="send the request N times and report latency percentiles")
+    render_parser.set_defaults(run=render)
+
+    metrics_parser = commands.add_parser("metrics", help="print a running service's metrics")
+    metrics_parser.add_argument("--server", default=DEFAULT_SERVER,
+                                help=f"server URL or Unix socket path (default: {DEFAULT_SERVER})")
+    metrics_parser.set_defaults(run=metrics)
+
+    args = parser.parse_args(argv)
+    if args.run is render and args.repeat < 1:
+        render_parser.error("--repeat must be at least 1")
+    try:
+        return args.run(args)
+    except (OSError, RuntimeError, RequestError) as e:
+        print(f"❌ Error: {e}")
+        return 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Named slide styles and swappable color themes
+Every slide helper asks the registry for a style by name ("title", "body",
+"table_header", "metric_number", "diagram_box", ...) instead of building
+its own colors and font sizes; shapes drawn in a run of colors (diagram
+layers, flow steps, agents) take them in order from a named palette. A theme resolves each name once into a
+frozen TextStyle/ShapeStyle; the renderers turn those into cached XML
+fragments, so applying a style is one clone per shape.
+Pure Python (no python-pptx), so the CLI can list themes cheaply.
+"""
+
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+
+DEFAULT_THEME = "professional-blue"
+WHITE = "FFFFFF"
+
+
+@dataclass(frozen=True)
+class TextStyle:
+    """Paragraph formatting: size in points, color as 'RRGGBB', align as an a:pPr/@algn value"""
+    size: float
+    color: str
+    bold: bool = None
+    italic: bool = None
+    space_before: float = None
+    align: str = None
+
+    def template(self):
+        """Arguments for deck_xml.paragraph_template()"""
+        return (self.size, self.color, self.bold, self.italic, self.space_before, self.align)
+
+    def with_size(self, size, space_before=None):
+        """This style at another font size (and paragraph spacing), cached"""
+        if space_before is None:
+            return _variant(self, (("size", size),))
+        return _variant(self, (("size", size), ("space_before", space_before)))
+
+    def with_color(self, color):
+        """This style in another 'RRGGBB' color, cached"""
+        return _variant(self, (("color", color),))
+
+
+@dataclass(frozen=True)
+class ShapeStyle:
+    """
+    Fill, outline and text of a shape.
+
+    `line_width` is in points, `anchor` is an a:bodyPr/@anchor value and
+    `margins` are (left, top, right, bottom) text insets in points, None
+    keeping the default inset.
+    """
+    fill: str = None
+    line: str = None
+    line_width: float = None
+    text: TextStyle = None
+    anchor: str = None
+    wrap: bool = None
+    margins: tuple = None
+
+
+@dataclass(frozen=True)
+class Theme:
+    """A named palette and the style registry built from it"""
+    name: str
+    colors: dict = field(hash=False, compare=False)
+    styles: dict = field(hash=False, compare=False)
+    palettes: dict = field(default_factory=dict, hash=False, compare=False)
+
+
+@lru_cache(maxsize=None)
+def _variant(style, changes):
+    return replace(style, **dict(changes))
+
+
+def build_theme(name, title, accent, text, success, background, node_fill, edge, group_fill, group_line,
+                layer_fills=None, step_fills=None, agent_fills=None, hub_fill=None, hub_line=None):
+    """
+    Resolve a palette ('RRGGBB' strings) into the full style registry
+
+    The built-in diagram slides fill their architecture layers, flow steps
+    and agents from `layer_fills`, `step_fills` and `agent_fills` (cycled;
+    `accent` when not given) and outline the orchestrator hub in `hub_line`.
+    """
+    colors = {
+        "title": title, "accent": accent, "text": text, "success": success, "background": background,
+        "node_fill": node_fill, "edge": edge, "group_fill": group_fill, "group_line": group_line,
+    }
+    palettes = {
+        "diagram_layers": tuple(layer_fills or (accent,)),
+        "diagram_steps": tuple(step_fills or (accent,)),
+        "diagram_agents": tuple(agent_fills or (accent,)),
+    }
+    box_text = TextStyle(16, WHITE, bold=True, align="ctr")
+    styles = {
+        # Title and closing slides
+        "cover_title": TextStyle(54, title, bold=True, align="ctr"),
+        "cover_subtitle": TextStyle(32, accent, align="ctr"),
+        "cover_tagline": TextStyle(24, text, italic=True, align="ctr"),
+        "cover_background": ShapeStyle(fill=background),
+        "closing_title": TextStyle(60, WHITE, bold=True, align="ctr"),
+        "closing_subtitle": TextStyle(28, WHITE, align="ctr"),
+        "closing_background": ShapeStyle(fill=accent),
+        # Content, table and big-number slides
+        "title": TextStyle(40, title, bold=True),
+        "body": TextStyle(20, text),
+        "table_header": ShapeStyle(fill=accent, text=TextStyle(16, WHITE, bold=True)),
+        "table_cell": TextStyle(14, text),
+        "metric_number": TextStyle(48, success, bold=True, align="ctr"),
+        "metric_label": TextStyle(16, text, align="ctr"),
+        # Diagram slides
+        "diagram_box": ShapeStyle(line=WHITE, line_width=2, text=box_text, anchor="ctr"),
+        "diagram_hub": ShapeStyle(fill=hub_fill or success, line=hub_line or title, line_width=3, text=box_text,
+                                  anchor="ctr"),
+        "diagram_arrow": ShapeStyle(fill=edge, line=edge),
+        "diagram_group": ShapeStyle(fill=group_fill, line=group_line, line_width=1,
+                                    text=TextStyle(12, title, bold=True, align="l"), anchor="t",
+                                    margins=(2, 2, None, None)),
+        "diagram_node": ShapeStyle(fill=node_fill, line=accent, line_width=1.25,
+                                   text=TextStyle(12, text, align="ctr"), anchor="ctr", wrap=True,
+                                   margins=(0, 0, 0, 0)),
+        "diagram_edge": ShapeStyle(line=edge, line_width=1),
+        "diagram_label": ShapeStyle(fill=WHITE, text=TextStyle(11, edge, align="ctr"), margins=(0, 0, 0, 0)),
+    }
+    return Theme(name, colors, styles, palettes)
+
+
+THEMES = {
+    theme.name: theme for theme in (
+        build_theme(DEFAULT_THEME, title="1A237E", accent="4A90E2", text="212121", success="4CAF50",
+                    background="F0F8FF", node_fill="E3F2FD", edge="646464", group_fill="F5F7FA",
+                    group_line="BDBDBD",
+                    layer_fills=("64B5F6", "4A90E2", "42A5F5", "2980B9", "3498DB"),
+                    step_fills=("42A5F5", "4A90E2", "2980B9", "3498DB", "1E88E5", "1976D2", "1565C0"),
+                    agent_fills=("4CAF50", "2196F3", "9C27B0", "FF5722", "F44336", "009688"),
+                    hub_fill="FF9800", hub_line="E67E22"),
+        build_theme("emerald", title="004D40", accent="26A69A", text="263238", success="F9A825",
+                    background="E0F2F1", node_fill="E0F2F1", edge="546E7A", group_fill="F1F8E9",
+                    group_line="A5D6A7",
+                    layer_fills=("4DB6AC", "26A69A", "009688", "00897B", "00796B"),
+                    step_fills=("4DB6AC", "26A69A", "009688", "00897B", "00796B", "00695C", "004D40"),
+                    agent_fills=("43A047", "00897B", "5E35B1", "F4511E", "E53935", "3949AB"),
+                    hub_fill="F9A825", hub_line="F57F17"),
+        build_theme("monochrome", title="000000", accent="424242", text="212121", success="000000",
+                    background="F5F5F5", node_fill="EEEEEE", edge="616161", group_fill="FAFAFA",
+                    group_line="9E9E9E",
+                    layer_fills=("9E9E9E", "757575", "616161", "424242", "212121"),
+                    step_fills=("9E9E9E", "8A8A8A", "757575", "616161", "525252", "424242", "212121"),
+                    agent_fills=("616161", "424242", "757575", "525252", "212121", "8A8A8A"),
+                    hub_fill="000000", hub_line="757575"),
+    )
+}
+
+_active = THEMES[DEFAULT_THEME]
+
+
+def use_theme(name):
+    """Make `name` the theme every slide helper draws its styles from"""
+    global _active
+    if name not in THEMES:
+        raise ValueError(f"unknown theme: {name} (choose from {', '.join(THEMES)})")
+    _active = THEMES[name]
+    return _active
+
+
+def current_theme():
+    """The theme styles are currently resolved from"""
+    return _active
+
+
+def style(name):
+    """The active theme's TextStyle or ShapeStyle called `name`"""
+    return _active.styles[name]
+
+
+def color(name):
+    """The active theme's palette color `name` as 'RRGGBB'"""
+    return _active.colors[name]
+
+
+def fill_color(palette, index):
+    """Fill `index` (0-based, cycling) of the active theme's color run `palette`, e.g. "diagram_layers" """
+    fills = _active.palettes[palette]
+    return fills[index % len(fills)]
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Master templates with placeholder layouts
+Usage: python deck_template.py -o deck-template.pptx --theme emerald
+
+A template is a .pptx whose slide master and layouts carry the deck's
+title and body formatting. Built on one, slides use real layouts and fill
+their placeholders with bare text that inherits size, color and position
+from the master, instead of every slide repeating that formatting inline.
+write_template() bakes a deck_styles theme into such a file; any template
+keeping the standard Office layout names works too.
+"""
+
+import argparse
+
+from lxml import etree
+from pptx import Presentation
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls, qn
+from pptx.util import Inches
+
+import deck_styles
+from deck_package import save_presentation
+
+DEFAULT_TEMPLATE = "deck-template.pptx"
+
+# Slide kind -> layout name; "title_only" carries tables, metrics and diagrams
+LAYOUT_NAMES = {
+    "title": "Title Slide",
+    "content": "Title and Content",
+    "two_column": "Two Content",
+    "title_only": "Title Only",
+    "closing": "Section Header",
+    "blank": "Blank",
+}
+
+# Placeholder geometry matching the Blank-layout text boxes, in inches
+TITLE_BOX = (0.5, 0.3, 9, 0.8)
+BODY_BOX = (0.8, 1.5, 8.4, 5.5)
+COLUMN_BOXES = ((0.8, 1.5, 4, 5.5), (5.2, 1.5, 4, 5.5))
+COVER_BOXES = ((1, 2, 8, 1.5), (1, 3.8, 8, 1))
+CLOSING_BOXES = ((1, 2.5, 8, 2), (1, 4.5, 8, 1))
+
+# Children of a:lvlNpPr in schema order, and the bullet elements replaced by a:buNone
+_LEVEL_ORDER = ("lnSpc", "spcBef", "spcAft", "buClrTx", "buClr", "buSzTx", "buSzPct", "buSzPts",
+                "buFontTx", "buFont", "buNone", "buAutoNum", "buChar", "buBlip", "tabLst", "defRPr", "extLst")
+_BULLETS = ("buNone", "buAutoNum", "buChar", "buBlip", "buFont", "buFontTx")
+
+
+class TemplateError(ValueError):
+    """A template missing a layout the deck needs"""
+
+
+def template_layouts(prs):
+    """{slide kind: layout} for every LAYOUT_NAMES entry of a template presentation"""
+    by_name = {layout.name: layout for layout in prs.slide_layouts}
+    missing = [name for name in LAYOUT_NAMES.values() if name not in by_name]
+    if missing:
+        raise TemplateError(f"template has no {', '.join(repr(name) for name in missing)} layout")
+    return {kind: by_name[name] for kind, name in LAYOUT_NAMES.items()}
+
+
+def _insert_ordered(parent, child):
+    """Insert `child` into an a:lvlNpPr ahead of the elements that follow it in the schema"""
+    rank = _LEVEL_ORDER.index(etree.QName(child).localname)
+    for index, sibling in enumerate(parent):
+        name = etree.QName(sibling).localname
+        if name in _LEVEL_ORDER and _LEVEL_ORDER.index(name) > rank:
+            parent.insert(index, child)
+            return
+    parent.append(child)
+
+
+def _restyle_level(level, style, space_before=None):
+    """Make a:lvlNpPr `level` carry TextStyle `style`: no bullet or indent, its size, weight and color"""
+    level.set("marL", "0")
+    level.set("indent", "0")
+    level.set("algn", style.align or "l")
+    for child in list(level):
+        if etree.QName(child).localname in _BULLETS + ("spcBef",):
+            level.remove(child)
+    spacing = space_before if space_before is not None else style.space_before
+    if spacing is not None:
+        _insert_ordered(level, parse_xml(f'<a:spcBef {nsdecls("a")}><a:spcPts val="{int(spacing * 100)}"/>'
+                                         f'</a:spcBef>'))
+    _insert_ordered(level, parse_xml(f'<a:buNone {nsdecls("a")}/>'))
+
+    defRPr = level.find(qn("a:defRPr"))
+    if defRPr is None:
+        defRPr = parse_xml(f'<a:defRPr {nsdecls("a")}/>')
+        _insert_ordered(level, defRPr)
+    defRPr.set("sz", str(int(style.size * 100)))
+    for attribute, value in (("b", style.bold), ("i", style.italic)):
+        if value is not None:
+            defRPr.set(attribute, str(int(value)))
+    for fill in defRPr.findall(qn("a:solidFill")) + defRPr.findall(qn("a:noFill")):
+        defRPr.remove(fill)
+    fill = parse_xml(f'<a:solidFill {nsdecls("a")}><a:srgbClr val="{style.color}"/></a:solidFill>')
+    line = defRPr.find(qn("a:ln"))
+    if line is None:
+        defRPr.insert(0, fill)
+    else:
+        line.addnext(fill)
+
+
+def _style_placeholder(placeholder, box, style, space_before=None, anchor=None):
+    """Position a master or layout placeholder and give its first level `style`"""
+    placeholder.left, placeholder.top, placeholder.width, placeholder.height = (Inches(v) for v in box)
+    txBody = placeholder._element.txBody
+    lstStyle = txBody.find(qn("a:lstStyle"))
+    for child in list(lstStyle):
+        lstStyle.remove(child)
+    level = parse_xml(f'<a:lvl1pPr {nsdecls("a")}/>')
+    lstStyle.append(level)
+    _restyle_level(level, style, space_before)
+    if anchor:
+        txBody.find(qn("a:bodyPr")).set("anchor", anchor)
+
+
+def _set_layout_background(layout, color):
+    cSld = layout._element.cSld
+    for old in cSld.findall(qn("p:bg")):
+        cSld.remove(old)
+    cSld.insert(0, parse_xml(f'<p:bg {nsdecls("a", "p")}><p:bgPr><a:solidFill><a:srgbClr val="{color}"/>'
+                             f'</a:solidFill><a:effectLst/></p:bgPr></p:bg>'))
+
+
+def _placeholders(layout):
+    """A layout's title/body placeholders in idx order (date, footer and slide number excluded)"""
+    return sorted((ph for ph in layout.placeholders if ph.placeholder_format.idx < 10),
+                  key=lambda ph: ph.placeholder_format.idx)
+
+
+def write_template(path, theme=None):
+    """
+    Write a template whose master and layouts carry `theme` (default: the
+    active one), with placeholders where the Blank-layout helpers put text.
+    """
+    from deck_render import CONTENT_FONT_SIZES
+
+    if theme:
+        deck_styles.use_theme(theme)
+    style = deck_styles.style
+    prs = Presentation()
+    prs.slide_width, prs.slide_height = Inches(10), Inches(7.5)
+
+    # Master: every layout's title and body text inherit from here
+    master = prs.slide_master
+    tx_styles = master._element.find(qn("p:txStyles"))
+    bullet_size, _, bullet_spacing = CONTENT_FONT_SIZES["bullet"]
+    _restyle_level(tx_styles.find(qn("p:titleStyle")).find(qn("a:lvl1pPr")), style("title"), 0)
+    body = style("body").with_size(bullet_size)
+    _restyle_level(tx_styles.find(qn("p:bodyStyle")).find(qn("a:lvl1pPr")), body, bullet_spacing)
+    title_placeholder, body_placeholder = _placeholders(master)[:2]
+    _style_placeholder(title_placeholder, TITLE_BOX, style("title"), 0, anchor="t")
+    _style_placeholder(body_placeholder, BODY_BOX, body, bullet_spacing)
+
+    layouts = template_layouts(prs)
+    column_size, _, column_spacing = CONTENT_FONT_SIZES["two_column"]
+    for placeholder, box in zip(_placeholders(layouts["two_column"])[1:], COLUMN_BOXES):
+        _style_placeholder(placeholder, box, style("body").with_size(column_size), column_spacing)
+
+    cover = layouts["title"]
+    _set_layout_background(cover, style("cover_background").fill)
+    for placeholder, box, name in zip(_placeholders(cover), COVER_BOXES, ("cover_title", "cover_subtitle")):
+        _style_placeholder(placeholder, box, style(name), 0, anchor="t")
+
+    closing = layouts["closing"]
+    _set_layout_background(closing, style("closing_background").fill)
+    for placeholder, box, name in zip(_placeholders(closing), CLOSING_BOXES, ("closing_title", "closing_subtitle")):
+        _style_placeholder(placeholder, box, style(name), 0, anchor="t")
+
+    save_presentation(prs, path)
+    return path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write a master template carrying a deck theme")
+    parser.add_argument("-o", "--output", default=DEFAULT_TEMPLATE, help=f"template path (default: {DEFAULT_TEMPLATE})")
+    parser.add_argument("--theme", choices=deck_styles.THEMES, default=deck_styles.DEFAULT_THEME,
+                        help=f"theme baked into the master (default: {deck_styles.DEFAULT_THEME})")
+    args = parser.parse_args(argv)
+    write_template(args.output, args.theme)
+    print(f"✅ Template written: {args.output} ({args.theme})")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
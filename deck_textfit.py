@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Text measurement and fitting for slide text boxes
+Font metrics are loaded once per font; word and paragraph measurements are
+memoized, so fitting every paragraph of a large deck costs little more
+than a dictionary lookup per repeated word.
+"""
+
+import os
+import unicodedata
+from functools import lru_cache
+
+EMU_PER_POINT = 12700
+LINE_SPACING = 1.2  # single-spaced line height as a multiple of the font size
+TEXT_INSET = 7.2  # default left/right and top/bottom text frame insets, in points
+REFERENCE_SIZE = 100  # size fonts are measured at before scaling
+
+DEFAULT_FONT = "Calibri"
+
+# File names tried for each font family, first match wins
+FONT_FILES = {
+    "Calibri": ("calibri.ttf", "Calibri.ttf", "Carlito-Regular.ttf", "carlito-regular.ttf"),
+}
+FALLBACK_FONT_FILES = ("LiberationSans-Regular.ttf", "DejaVuSans.ttf", "Arial.ttf", "arial.ttf")
+FONT_DIRS = (
+    "/usr/share/fonts",
+    "/usr/local/share/fonts",
+    os.path.expanduser("~/.fonts"),
+    os.path.expanduser("~/.local/share/fonts"),
+    "/Library/Fonts",
+    "/System/Library/Fonts",
+    "C:\\Windows\\Fonts",
+)
+
+# Approximate advance widths (in em) used when no font file is available
+_NARROW = set("ijlI.,:;'|!`()[]{}ft")
+_WIDE = set("mwMW@%")
+
+
+def _find_font_file(font):
+    names = FONT_FILES.get(font, (font + ".ttf",)) + FALLBACK_FONT_FILES
+    search_dirs = [d for d in os.environ.get("DECK_FONT_PATH", "").split(os.pathsep) if d] + list(FONT_DIRS)
+    for directory in search_dirs:
+        for root, _, files in os.walk(directory):
+            for name in names:
+                if name in files:
+                    return os.path.join(root, name)
+    return None
+
+
+@lru_cache(maxsize=None)
+def load_font(font=DEFAULT_FONT):
+    """Return a Pillow font at REFERENCE_SIZE for `font`, or None to use estimated metrics"""
+    try:
+        from PIL import ImageFont
+    except ImportError:
+        return None
+    path = _find_font_file(font)
+    if path is None:
+        return None
+    try:
+        return ImageFont.truetype(path, REFERENCE_SIZE)
+    except OSError:
+        return None
+
+
+@lru_cache(maxsize=None)
+def metrics_fingerprint(font=DEFAULT_FONT):
+    """Identify the metrics text_width() uses for `font`: the font file Pillow loads, or "estimated" """
+    if load_font(font) is None:
+        return "estimated"
+    path = _find_font_file(font)
+    stat = os.stat(path)
+    return f"{path}:{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def _estimated_em_width(char):
+    if char == " ":
+        return 0.23
+    if unicodedata.east_asian_width(char) in ("W", "F") or ord(char) >= 0x1F000:
+        return 1.0
+    if unicodedata.combining(char) or unicodedata.category(char) in ("Mn", "Cf"):
+        return 0.0
+    if char in _NARROW:
+        return 0.27
+    if char in _WIDE:
+        return 0.85
+    if char.isupper():
+        return 0.6
+    return 0.5
+
+
+@lru_cache(maxsize=1 << 16)
+def _reference_width(text, font):
+    measured = load_font(font)
+    if measured is not None:
+        return measured.getlength(text)
+    return REFERENCE_SIZE * sum(_estimated_em_width(char) for char in text)
+
+
+@lru_cache(maxsize=1 << 16)
+def text_width(text, font=DEFAULT_FONT, size=18):
+    """Width of a single run of `text`, in points"""
+    return _reference_width(text, font) * size / REFERENCE_SIZE
+
+
+@lru_cache(maxsize=1 << 16)
+def paragraph_lines(text, width, font=DEFAULT_FONT, size=18):
+    """Number of lines `text` wraps to in a box `width` points wide (greedy word wrap)"""
+    if not text.strip() or width <= 0:
+        return 1
+    space = text_width(" ", font, size)
+    lines, line_width = 1, 0.0
+    for word in text.split(" "):
+        word_width = text_width(word, font, size)
+        if line_width and line_width + space + word_width > width:
+            lines += 1
+            line_width = word_width
+        else:
+            line_width += (space if line_width else 0.0) + word_width
+        # A single word wider than the box breaks across lines on its own
+        while line_width > width:
+            lines += 1
+            line_width -= width
+    return lines
+
+
+def text_height(items, width, size, space_before=0, font=DEFAULT_FONT, leading_paragraph=None):
+    """
+    Height in points of `items` as paragraphs in a box `width` points wide.
+
+    `leading_paragraph` is the size of an empty first paragraph the frame
+    already holds (new text boxes start with one), or None.
+    """
+    height = 2 * TEXT_INSET
+    if leading_paragraph:
+        height += leading_paragraph * LINE_SPACING
+    line_height = size * LINE_SPACING
+    inner_width = width - 2 * TEXT_INSET
+    for item in items:
+        height += space_before + paragraph_lines(item, inner_width, font, size) * line_height
+    return height
+
+
+def paragraph_heights(items, width, size, space_before=0, font=DEFAULT_FONT):
+    """Height in points of each of `items` as a paragraph in a box `width` points wide"""
+    line_height = size * LINE_SPACING
+    inner_width = width - 2 * TEXT_INSET
+    return [space_before + paragraph_lines(item, inner_width, font, size) * line_height for item in items]
+
+
+def scaled_spacing(space_before, size, max_size):
+    """Paragraph spacing for `size`, shrunk in proportion to the font (whole points)"""
+    return round(space_before * size / max_size)
+
+
+def fit_font_size(items, width, height, max_size, min_size, space_before=0, font=DEFAULT_FONT,
+                  leading_paragraph=None):
+    """
+    Largest whole point size in [min_size, max_size] at which `items` fit, or None.
+
+    `space_before` is the spacing at max_size; it shrinks with the font.
+    """
+    for size in range(int(max_size), int(min_size) - 1, -1):
+        spacing = scaled_spacing(space_before, size, max_size)
+        if text_height(items, width, size, spacing, font, leading_paragraph) <= height:
+            return size
+    return None
+
+
+def paginate(items, fits):
+    """
+    Split `items` into consecutive chunks for which `fits(chunk)` holds.
+
+    Chunks prefer to end at a blank separator item when one falls in the
+    second half of the chunk; blank items are dropped from chunk edges.
+    An item that does not fit on its own still gets a chunk of its own.
+    """
+    pages, chunk = [], []
+    for item in items:
+        if not chunk and not item:
+            continue
+        if not chunk or fits(chunk + [item]):
+            chunk.append(item)
+            continue
+        carry = []
+        if "" in chunk[len(chunk) // 2:]:
+            cut = len(chunk) - chunk[::-1].index("")
+            chunk, carry = chunk[:cut], chunk[cut:]
+        pages.append(_strip_blank(chunk))
+        chunk = carry + ([item] if item else [])
+    if _strip_blank(chunk):
+        pages.append(_strip_blank(chunk))
+    return pages or [[]]
+
+
+def _strip_blank(chunk):
+    start, end = 0, len(chunk)
+    while start < end and not chunk[start]:
+        start += 1
+    while end > start and not chunk[end - 1]:
+        end -= 1
+    return chunk[start:end]
@@ -0,0 +1,472 @@
+#!/usr/bin/env python3
+"""
+Post-build validation of .pptx decks
+Usage: python deck_validate.py Agentic_Testing_Framework_Pitch_Deck.pptx decks/ -j 8
+
+Each package is read one part at a time: the content types, presentation
+and relationship parts, then one slide at a time, so memory stays flat
+however large the deck. Problems reported:
+
+- overflow: text that needs more height than its box (tables: more than
+  its frame), or a line wider than a box that does not wrap, measured
+  with deck_textfit's metrics
+- off-slide: shapes reaching past the slide edges (the deck's slide size,
+  10x7.5in for these decks); tables and text boxes that resize to their
+  text count at the size they grow to
+- overlap: shapes partly covering each other. A shape entirely inside
+  another (text on a panel, nodes in a group box) is layering, not
+  overlap, and connectors and freeform edges are ignored
+- dangling: relationships to missing parts, r:id references with no
+  relationship, and parts without a content type
+
+Decks are checked in parallel worker processes.
+"""
+
+import argparse
+import glob
+import os
+import posixpath
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+from lxml import etree
+
+from deck_textfit import LINE_SPACING, paragraph_lines, text_width
+
+CHECKS = ("overflow", "off-slide", "overlap", "dangling")
+
+NS = {
+    "a": "http://schemas.openxmlformats.org/drawingml/2006/main",
+    "p": "http://schemas.openxmlformats.org/presentationml/2006/main",
+    "r": "http://schemas.openxmlformats.org/officeDocument/2006/relationships",
+    "pr": "http://schemas.openxmlformats.org/package/2006/relationships",
+    "ct": "http://schemas.openxmlformats.org/package/2006/content-types",
+}
+R_PREFIX = f"{{{NS['r']}}}"
+R_REFERENCES = etree.XPath("//@*[namespace-uri() = $ns]")  # r:id, r:embed, r:link... attributes
+
+EMU_PER_POINT = 12700
+EMU_PER_INCH = 914400
+DEFAULT_SLIDE_SIZE = (9144000, 6858000)  # 10 x 7.5 in
+DEFAULT_FONT_SIZE = 18
+BODY_INSETS = (91440, 45720, 91440, 45720)  # a:bodyPr lIns, tIns, rIns, bIns defaults
+CELL_MARGINS = (91440, 45720, 91440, 45720)  # a:tcPr marL, marT, marR, marB defaults
+EDGE_TOLERANCE = EMU_PER_POINT  # shapes may touch an edge or each other by up to 1pt
+OVERFLOW_TOLERANCE = 2  # points of estimated text height beyond the box that still pass
+WORKER_CHUNK = 8  # decks handed to a worker at a time
+
+CONTENT_TYPES_PART = "[Content_Types].xml"
+PRESENTATION_PART = "ppt/presentation.xml"
+CONNECTOR_TAGS = {f"{{{NS['p']}}}cxnSp"}
+SHAPE_TAGS = {f"{{{NS['p']}}}{name}" for name in ("sp", "cxnSp", "pic", "graphicFrame", "grpSp")}
+
+
+@dataclass
+class Problem:
+    """One finding: the slide it is on (None for package-level parts), check, shape or part, and details"""
+    slide: int
+    check: str
+    subject: str
+    message: str
+
+    def __str__(self):
+        where = f"slide {self.slide}" if self.slide else "package"
+        return f"{where}: {self.check} - {self.subject}: {self.message}"
+
+
+def _inches(emu):
+    return f"{emu / EMU_PER_INCH:.2f}in"
+
+
+def _int(element, name, default=0):
+    return int(element.get(name, default)) if element is not None else default
+
+
+def _parse(package, name):
+    return etree.fromstring(package.read(name))
+
+
+def rels_part(name):
+    """Name of the relationships part of the part `name`"""
+    directory, base = posixpath.split(name)
+    return posixpath.join(directory, "_rels", base + ".rels")
+
+
+def read_rels(package, name, names):
+    """{rId: (target part name or None if external, target as written)} of the part `name`"""
+    rels = {}
+    rels_name = rels_part(name)
+    if rels_name not in names:
+        return rels
+    source_dir = posixpath.dirname(name)
+    for rel in _parse(package, rels_name).iterfind("pr:Relationship", NS):
+        target = rel.get("Target", "")
+        if rel.get("TargetMode") == "External":
+            rels[rel.get("Id")] = (None, target)
+        elif target.startswith("/"):
+            rels[rel.get("Id")] = (target[1:], target)
+        else:
+            rels[rel.get("Id")] = (posixpath.normpath(posixpath.join(source_dir, target)), target)
+    return rels
+
+
+def check_package_parts(package, names, rels):
+    """
+    Dangling relationships of every part, and parts with no content type.
+
+    Every relationship part is read once, into `rels` ({source part: read_rels()}).
+    """
+    problems = []
+    types = _parse(package, CONTENT_TYPES_PART)
+    extensions = {default.get("Extension", "").lower() for default in types.iterfind("ct:Default", NS)}
+    overrides = {override.get("PartName", "").lstrip("/") for override in types.iterfind("ct:Override", NS)}
+    for name in sorted(names):
+        if name == CONTENT_TYPES_PART or name.endswith("/"):
+            continue
+        extension = name.rsplit(".", 1)[1].lower() if "." in posixpath.basename(name) else ""
+        if name not in overrides and extension not in extensions:
+            problems.append(Problem(None, "dangling", name, "part has no content type"))
+        if name.endswith(".rels"):
+            directory, base = posixpath.split(name)
+            source = posixpath.join(posixpath.dirname(directory), base[:-len(".rels")])
+            rels[source] = read_rels(package, source, names)
+            for rel_id, (target, written) in rels[source].items():
+                if target is not None and target not in names:
+                    problems.append(Problem(None, "dangling", name, f"{rel_id} targets missing part {written}"))
+    return problems
+
+
+def _name(shape):
+    c_nv_pr = shape.find("*/p:cNvPr", NS)
+    return c_nv_pr.get("name", "?") if c_nv_pr is not None else "?"
+
+
+def _box(shape):
+    """(x, y, cx, cy) in EMU of a top-level shape, picture, graphic frame or group, or None"""
+    xfrm = shape.find("p:spPr/a:xfrm", NS)
+    if xfrm is None:
+        xfrm = shape.find("p:xfrm", NS)
+    if xfrm is None:
+        xfrm = shape.find("p:grpSpPr/a:xfrm", NS)
+    if xfrm is None:
+        return None
+    off, ext = xfrm.find("a:off", NS), xfrm.find("a:ext", NS)
+    return _int(off, "x"), _int(off, "y"), _int(ext, "cx"), _int(ext, "cy")
+
+
+def iter_shapes(tree, transform=None):
+    """Yield (shape, box) for every shape under a p:spTree / p:grpSp, groups included, in slide EMU"""
+    for shape in tree:
+        if shape.tag not in SHAPE_TAGS:
+            continue
+        box = _box(shape)
+        if box is not None and transform is not None:
+            (x0, y0, sx, sy, ox, oy) = transform
+            box = (round(ox + (box[0] - x0) * sx), round(oy + (box[1] - y0) * sy),
+                   round(box[2] * sx), round(box[3] * sy))
+        yield shape, box
+        if shape.tag == f"{{{NS['p']}}}grpSp" and box is not None:
+            xfrm = shape.find("p:grpSpPr/a:xfrm", NS)
+            ch_off, ch_ext = xfrm.find("a:chOff", NS), xfrm.find("a:chExt", NS)
+            sx = box[2] / _int(ch_ext, "cx", 1) if _int(ch_ext, "cx") else 1.0
+            sy = box[3] / _int(ch_ext, "cy", 1) if _int(ch_ext, "cy") else 1.0
+            yield from iter_shapes(shape, (_int(ch_off, "x"), _int(ch_off, "y"), sx, sy, box[0], box[1]))
+
+
+def _paragraph_text(p):
+    return "".join("\n" if child.tag == f"{{{NS['a']}}}br" else child.findtext("a:t", "", NS)
+                   for child in p if child.tag in (f"{{{NS['a']}}}r", f"{{{NS['a']}}}br", f"{{{NS['a']}}}fld"))
+
+
+def _paragraph_size(p, levels):
+    """Font size of an a:p in points from its runs, paragraph defaults or the body's list styles; None if inherited"""
+    level = _int(p.find("a:pPr", NS), "lvl")
+    for path in ("a:r/a:rPr", "a:pPr/a:defRPr", "a:endParaRPr"):
+        r_pr = p.find(path, NS)
+        if r_pr is not None and r_pr.get("sz"):
+            return int(r_pr.get("sz")) / 100
+    return levels.get(level)
+
+
+def _spacing(p_pr, name, size):
+    """Points of a:spcBef / a:spcAft, or the line spacing multiple for a:lnSpc"""
+    spacing = p_pr.find(f"a:{name}", NS) if p_pr is not None and len(p_pr) else None
+    points = spacing.find("a:spcPts", NS) if spacing is not None else None
+    percent = spacing.find("a:spcPct", NS) if spacing is not None else None
+    if name == "lnSpc":
+        if points is not None:
+            return int(points.get("val")) / 100 / (size * LINE_SPACING)
+        return int(percent.get("val")) / 100000 if percent is not None else 1.0
+    if points is not None:
+        return int(points.get("val")) / 100
+    return int(percent.get("val")) / 100000 * size if percent is not None else 0.0
+
+
+def text_extent(tx_body, width, placeholder=False):
+    """
+    Estimated (height, widest unwrapped line) in points of a p:txBody / a:txBody `width` points wide.
+
+    Returns None when a font size is inherited from a layout (placeholders),
+    which this check cannot see without loading the master.
+    """
+    body_pr = tx_body.find("a:bodyPr", NS)
+    wrap = body_pr is None or body_pr.get("wrap") != "none"
+    autofit = body_pr.find("a:normAutofit", NS) if body_pr is not None else None
+    scale = _int(autofit, "fontScale", 100000) / 100000
+    line_scale = 1 - _int(autofit, "lnSpcReduction") / 100000
+    levels = {}  # list level -> size from a:lstStyle/a:lvlNpPr/a:defRPr
+    for def_r_pr in tx_body.iterfind("a:lstStyle/*/a:defRPr", NS):
+        if def_r_pr.get("sz"):
+            levels[int(etree.QName(def_r_pr.getparent()).localname[3:-3]) - 1] = int(def_r_pr.get("sz")) / 100
+
+    height, widest = 0.0, 0.0
+    for p in tx_body.iterfind("a:p", NS):
+        size = _paragraph_size(p, levels)
+        if size is None:
+            if placeholder:
+                return None
+            size = DEFAULT_FONT_SIZE
+        size *= scale
+        p_pr = p.find("a:pPr", NS)
+        line_height = size * LINE_SPACING * _spacing(p_pr, "lnSpc", size) * line_scale
+        height += _spacing(p_pr, "spcBef", size) + _spacing(p_pr, "spcAft", size)
+        for text in _paragraph_text(p).split("\n"):
+            lines = paragraph_lines(text, width, size=size) if wrap else 1
+            height += lines * line_height
+            if not wrap:
+                widest = max(widest, text_width(text, size=size))
+    return height, widest
+
+
+def text_box(shape, box):
+    """
+    (box, problem message or None) for the text of a p:sp.
+
+    A shape that resizes to its text (a:spAutoFit) has its box grown to the
+    estimated text extent; a fixed box its text does not fit in gets a message.
+    """
+    tx_body = shape.find("p:txBody", NS)
+    if tx_body is None or not "".join(tx_body.itertext()).strip():
+        return box, None
+    body_pr = tx_body.find("a:bodyPr", NS)
+    if body_pr is not None and body_pr.get("vert", "horz") != "horz":
+        return box, None  # vertical text
+    left, top, right, bottom = (_int(body_pr, name, default)
+                                for name, default in zip(("lIns", "tIns", "rIns", "bIns"), BODY_INSETS))
+    width = (box[2] - left - right) / EMU_PER_POINT
+    placeholder = shape.find("p:nvSpPr/p:nvPr/p:ph", NS) is not None
+    extent = text_extent(tx_body, width, placeholder)
+    if extent is None:
+        return box, None
+    height, widest = extent
+    if body_pr is not None and body_pr.find("a:spAutoFit", NS) is not None:
+        x, y, cx, cy = box
+        grown = max(cx, round(widest * EMU_PER_POINT) + left + right)
+        # An unwrapped line widens the box away from its alignment: centered text grows both ways
+        p_pr = tx_body.find("a:p/a:pPr", NS)
+        align = p_pr.get("algn", "l") if p_pr is not None else "l"
+        x -= {"l": 0, "ctr": (grown - cx) // 2, "r": grown - cx}.get(align, 0)
+        return (x, y, grown, max(cy, round(height * EMU_PER_POINT) + top + bottom)), None
+    room = (box[3] - top - bottom) / EMU_PER_POINT
+    if widest > width + OVERFLOW_TOLERANCE:
+        return box, f"a line is {widest - width:.0f}pt wider than its {width:.0f}pt box"
+    if height > room + OVERFLOW_TOLERANCE:
+        return box, f"text needs {_inches(height * EMU_PER_POINT)}, box holds {_inches(room * EMU_PER_POINT)}"
+    return box, None
+
+
+def table_height(frame):
+    """Height in EMU of the a:tbl in a graphic frame once its rows grow to fit their text"""
+    table = frame.find("a:graphic/a:graphicData/a:tbl", NS)
+    widths = [_int(column, "w") for column in table.iterfind("a:tblGrid/a:gridCol", NS)]
+    total = 0
+    for row in table.iterfind("a:tr", NS):
+        row_height = _int(row, "h")
+        column = 0
+        for cell in row.iterfind("a:tc", NS):
+            span = _int(cell, "gridSpan", 1)
+            if cell.get("hMerge") != "1" and cell.get("vMerge") != "1" and cell.find("a:txBody", NS) is not None:
+                tc_pr = cell.find("a:tcPr", NS)
+                left, top, right, bottom = (_int(tc_pr, name, default) for name, default
+                                            in zip(("marL", "marT", "marR", "marB"), CELL_MARGINS))
+                width = (sum(widths[column:column + span]) - left - right) / EMU_PER_POINT
+                height, _ = text_extent(cell.find("a:txBody", NS), width)
+                row_height = max(row_height, round(height * EMU_PER_POINT) + top + bottom)
+            column += span
+        total += row_height
+    return total
+
+
+def _edges(box, size):
+    """Edges `box` reaches past, with the distance, e.g. ['right by 0.43in']"""
+    x, y, cx, cy = box
+    width, height = size
+    past = (("left", -x), ("top", -y), ("right", x + cx - width), ("bottom", y + cy - height))
+    return [f"{edge} by {_inches(distance)}" for edge, distance in past if distance > EDGE_TOLERANCE]
+
+
+def _overlaps(boxes):
+    """(i, j) pairs of `boxes` that partly overlap; a box inside another does not count"""
+    order = sorted(range(len(boxes)), key=lambda index: boxes[index][0])
+    for position, i in enumerate(order):
+        x, y, cx, cy = boxes[i]
+        for j in order[position + 1:]:
+            ox, oy, ocx, ocy = boxes[j]
+            if ox >= x + cx - EDGE_TOLERANCE:
+                break  # sorted by left edge: no later box reaches back into this one
+            overlap_x = min(x + cx, ox + ocx) - max(x, ox)
+            overlap_y = min(y + cy, oy + ocy) - max(y, oy)
+            if overlap_x <= EDGE_TOLERANCE or overlap_y <= EDGE_TOLERANCE:
+                continue
+            if (overlap_x >= min(cx, ocx) - EDGE_TOLERANCE and overlap_y >= min(cy, ocy) - EDGE_TOLERANCE):
+                continue  # the smaller box lies inside the larger one
+            yield tuple(sorted((i, j)))
+
+
+def is_line(shape):
+    """True for connectors and unfilled freeforms (drawn edges), which overlap what they join by design"""
+    if shape.tag in CONNECTOR_TAGS:
+        return True
+    return shape.find("p:spPr/a:custGeom", NS) is not None and shape.find("p:spPr/a:noFill", NS) is not None
+
+
+def check_slide(root, rels, number, size=DEFAULT_SLIDE_SIZE, checks=CHECKS):
+    """Problems of one parsed slide part; `rels` is its read_rels() mapping"""
+    problems = []
+    if "dangling" in checks:
+        for value in R_REFERENCES(root, ns=NS["r"]):
+            if value not in rels:
+                problems.append(Problem(number, "dangling", f"r:{value.attrname[len(R_PREFIX):]}",
+                                        f"{value} has no relationship in the slide's rels"))
+
+    tree = root.find("p:cSld/p:spTree", NS)
+    if tree is None:
+        return problems
+    top_level = []  # (name, box) of the shapes overlap is checked between
+    for shape, box in iter_shapes(tree):
+        if box is None:
+            continue
+        is_top_level = shape.getparent() is tree
+        if shape.find("a:graphic/a:graphicData/a:tbl", NS) is not None:
+            grown = table_height(shape)
+            if "overflow" in checks and grown > box[3] + EDGE_TOLERANCE:
+                problems.append(Problem(number, "overflow", _name(shape),
+                                        f"table rows grow to {_inches(grown)}, frame is {_inches(box[3])}"))
+            box = box[:3] + (max(box[3], grown),)
+        elif shape.tag == f"{{{NS['p']}}}sp":
+            box, message = text_box(shape, box)
+            if message and "overflow" in checks:
+                problems.append(Problem(number, "overflow", _name(shape), message))
+        if not is_top_level:
+            continue
+        if "off-slide" in checks:
+            edges = _edges(box, size)
+            if edges:
+                problems.append(Problem(number, "off-slide", _name(shape), "past the " + ", ".join(edges)))
+        if not is_line(shape) and box[2] > 0 and box[3] > 0:
+            top_level.append((_name(shape), box))
+
+    if "overlap" in checks:
+        for i, j in _overlaps([box for _, box in top_level]):
+            problems.append(Problem(number, "overlap", top_level[i][0], f"partly covers {top_level[j][0]}"))
+    return problems
+
+
+def validate_package(path, checks=CHECKS):
+    """
+    Check one .pptx; returns its Problems, package-level ones first.
+
+    Only presentation.xml, the relationship parts and one slide part at a
+    time are parsed; pictures, charts and workbooks are never read.
+    """
+    problems = []
+    with zipfile.ZipFile(path) as package:
+        names = set(package.namelist())
+        rels = {}
+        if "dangling" in checks:
+            problems.extend(check_package_parts(package, names, rels))
+        presentation = _parse(package, PRESENTATION_PART)
+        slide_size = presentation.find("p:sldSz", NS)
+        size = (_int(slide_size, "cx"), _int(slide_size, "cy")) if slide_size is not None else DEFAULT_SLIDE_SIZE
+        presentation_rels = read_rels(package, PRESENTATION_PART, names)
+        slide_ids = presentation.iterfind("p:sldIdLst/p:sldId", NS)
+        for number, slide_id in enumerate(slide_ids, 1):
+            rel_id = slide_id.get(f"{R_PREFIX}id")
+            target = presentation_rels.get(rel_id, (None, None))[0]
+            if target is None or target not in names:
+                if "dangling" in checks:
+                    problems.append(Problem(number, "dangling", PRESENTATION_PART,
+                                            f"slide {rel_id} has no slide part"))
+                continue
+            slide_rels = rels[target] if target in rels else read_rels(package, target, names)
+            problems.extend(check_slide(_parse(package, target), slide_rels, number, size, checks))
+    return problems
+
+
+def validate_one(path, checks=CHECKS):
+    """Check one deck in a worker; returns (path, problems, seconds, error)"""
+    started = time.perf_counter()
+    try:
+        problems, error = validate_package(path, checks), None
+    except (OSError, KeyError, zipfile.BadZipFile, etree.XMLSyntaxError) as e:
+        problems, error = [], f"{type(e).__name__}: {e}"
+    return path, problems, time.perf_counter() - started, error
+
+
+def validate_files(paths, workers=None, checks=CHECKS):
+    """Check `paths` across `workers` processes; yields validate_one() results in path order"""
+    if workers == 1 or len(paths) < 2:
+        for path in paths:
+            yield validate_one(path, checks)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(validate_one, paths, [checks] * len(paths), chunksize=WORKER_CHUNK)
+
+
+def collect_decks(patterns):
+    """Expand directories and glob patterns into a sorted, de-duplicated list of .pptx files"""
+    decks = set()
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            decks.update(glob.glob(os.path.join(pattern, "*.pptx")))
+        else:
+            decks.update(path for path in glob.glob(pattern) if os.path.isfile(path))
+    return sorted(decks)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check built .pptx decks for overflow, off-slide shapes, "
+                                                 "overlaps and broken parts")
+    parser.add_argument("inputs", nargs="+", help=".pptx files, directories or glob patterns")
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count(), help="worker processes")
+    parser.add_argument("--skip", action="append", choices=CHECKS, default=[], help="skip a check (repeatable)")
+    parser.add_argument("-q", "--quiet", action="store_true", help="only list decks with problems")
+    args = parser.parse_args(argv)
+
+    decks = collect_decks(args.inputs)
+    if not decks:
+        parser.error("no .pptx files matched")
+    checks = tuple(check for check in CHECKS if check not in args.skip)
+
+    started = time.perf_counter()
+    failed = 0
+    for path, problems, _, error in validate_files(decks, args.workers, checks):
+        if error:
+            failed += 1
+            print(f"❌ {path}: {error}")
+        elif problems:
+            failed += 1
+            print(f"❌ {path}: {len(problems)} problem(s)")
+            for problem in problems:
+                print(f"   - {problem}")
+        elif not args.quiet:
+            print(f"✅ {path}")
+    print(f"📊 {len(decks)} deck(s) checked in {time.perf_counter() - started:.2f}s: "
+          f"{len(decks) - failed} clean, {failed} with problems")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Watch mode: rebuild the deck whenever its sources change
+One warm process keeps python-pptx, the style templates and the text
+measurement caches loaded, and polls the sources' mtimes (no platform
+watcher needed). Rebuilds go through build_incremental, so only slides
+whose section changed are re-rendered; the rest are spliced in from the
+slide cache.
+"""
+
+import os
+import time
+
+from deck_markdown import iter_slide_specs
+from deck_render import build_incremental
+
+POLL_INTERVAL = 0.1  # seconds between mtime checks
+DEBOUNCE = 0.15  # sources must be quiet this long before a rebuild
+
+
+def watched_paths(source, mermaid=None, drawio=None, template=None, results=()):
+    """The deck, its diagram source, template and results files, and every picture and chart CSV it shows"""
+    paths = {os.path.abspath(path) for path in (source, mermaid, drawio, template, *(results or ())) if path}
+    try:
+        for spec in iter_slide_specs(source):
+            paths.update(path for _, path in spec.images)
+            if spec.kind == "chart" and spec.source:
+                paths.add(os.path.abspath(spec.source))
+    except OSError:
+        pass  # the deck is being replaced; its own path is still watched
+    return sorted(paths)
+
+
+def snapshot(paths):
+    """(mtime, size) per path; None for a path that is missing right now"""
+    state = {}
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            state[path] = (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            state[path] = None
+    return state
+
+
+def wait_for_change(paths, state, interval=POLL_INTERVAL, debounce=DEBOUNCE):
+    """
+    Block until `paths` differ from `state` and then stay unchanged for
+    `debounce` seconds (editors often save in several writes, or via a
+    temporary file and a rename). A path appearing or disappearing is a
+    change like any other; missing paths (a picture the deck names but
+    that does not exist yet) do not hold the rebuild back. Returns the
+    new state.
+    """
+    while True:
+        time.sleep(interval)
+        current = snapshot(paths)
+        if current == state:
+            continue
+        while True:
+            time.sleep(debounce)
+            settled = snapshot(paths)
+            if settled == current:
+                return settled
+            current = settled
+
+
+def watch(source, output, diagrams=True, backend=None, mermaid=None, drawio=None, theme=None, template=None,
+          results=None, interval=POLL_INTERVAL, debounce=DEBOUNCE):
+    """Build `output`, then rebuild it after every change to its sources until interrupted"""
+    options = {"diagrams": diagrams, "mermaid": mermaid, "drawio": drawio, "theme": theme, "template": template,
+               "results": results}
+    if backend:
+        options["backend"] = backend
+    try:
+        while True:
+            paths = watched_paths(source, mermaid, drawio, template, results)
+            state = snapshot(paths)
+            started = time.perf_counter()
+            try:
+                total, rendered = build_incremental(source, output, **options)
+            except Exception as e:
+                print(f"❌ Build failed: {e}")
+            else:
+                elapsed = (time.perf_counter() - started) * 1000
+                print(f"♻️  {time.strftime('%H:%M:%S')} re-rendered {rendered} of {total} slides "
+                      f"in {elapsed:.0f} ms → {output}")
+            print(f"👀 Watching {len(paths)} file(s) - Ctrl+C to stop", flush=True)
+            wait_for_change(paths, state, interval, debounce)
+    except KeyboardInterrupt:
+        print("\n👋 Stopped watching")
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Fast lxml rendering backend for the deck helpers
+Builds each pre-styled `<a:p>` / `<p:sp>` fragment once per style, then
+clones it and substitutes only text and geometry, instead of going through
+python-pptx's per-paragraph property setters.
+"""
+
+from copy import deepcopy
+from functools import lru_cache
+
+from lxml.etree import XPath
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls, nsmap
+
+
+def _hex(color):
+    """RGBColor (or hex string) to the 'RRGGBB' form used in a:srgbClr"""
+    return str(color).upper()
+
+
+@lru_cache(maxsize=None)
+def paragraph_template(size, color, bold=None, italic=None, space_before=None, align=None):
+    """
+    Return the cached, run-less `<a:p>` for one paragraph style.
+
+    `size` and `space_before` are in points, `color` is an RGBColor or hex
+    string and `align` an a:pPr/@algn value such as "ctr". The XML matches
+    what the python-pptx font/space_before/alignment setters produce.
+    """
+    algn = f' algn="{align}"' if align else ""
+    spacing = f'<a:spcBef><a:spcPts val="{int(space_before * 100)}"/></a:spcBef>' if space_before else ""
+    attrs = f' sz="{int(size * 100)}"'
+    if bold is not None:
+        attrs += f' b="{int(bold)}"'
+    if italic is not None:
+        attrs += f' i="{int(italic)}"'
+    return parse_xml(
+        f'<a:p {nsdecls("a")}><a:pPr{algn}>{spacing}<a:defRPr{attrs}><a:solidFill>'
+        f'<a:srgbClr val="{_hex(color)}"/></a:solidFill></a:defRPr></a:pPr></a:p>'
+    )
+
+
+def new_paragraph(style, text):
+    """Clone the paragraph template for `style` (a paragraph_template args tuple) with `text`"""
+    p = deepcopy(paragraph_template(*style))
+    p.append_text(text)
+    return p
+
+
+@lru_cache(maxsize=None)
+def _empty_paragraph_template():
+    return parse_xml(f'<a:p {nsdecls("a")}/>')
+
+
+def empty_paragraph():
+    """The bare `<a:p/>` a new text frame starts with"""
+    return deepcopy(_empty_paragraph_template())
+
+
+def frame_paragraphs(style, text):
+    """
+    Paragraphs for `text_frame.text = text` followed by styling paragraphs[0].
+
+    Like the python-pptx setter, each line of `text` becomes its own
+    paragraph and only the first one carries the style.
+    """
+    first, *rest = text.split("\n")
+    paragraphs = [new_paragraph(style, first)]
+    for line in rest:
+        p = empty_paragraph()
+        p.append_text(line)
+        paragraphs.append(p)
+    return paragraphs
+
+
+def styled_paragraphs(style, text):
+    """One paragraph per line of `text`, every one of them carrying `style`"""
+    return [new_paragraph(style, line) for line in text.split("\n")]
+
+
+@lru_cache(maxsize=None)
+def _placeholder_paragraph_template(size=None, space_before=None):
+    spacing = f'<a:spcBef><a:spcPts val="{int(space_before * 100)}"/></a:spcBef>' if space_before is not None else ""
+    font = f'<a:defRPr sz="{int(size * 100)}"/>' if size else ""
+    properties = f"<a:pPr>{spacing}{font}</a:pPr>" if spacing or font else ""
+    return parse_xml(f'<a:p {nsdecls("a")}>{properties}</a:p>')
+
+
+def placeholder_paragraph(text, size=None, space_before=None):
+    """
+    `text` as a paragraph that inherits all formatting from its placeholder,
+    except a font `size` and `space_before` (points) when given.
+    """
+    p = deepcopy(_placeholder_paragraph_template(size, space_before))
+    p.append_text(text)
+    return p
+
+
+_placeholder_path = XPath("p:sp[p:nvSpPr/p:nvPr/p:ph[@idx = $idx or (not(@idx) and $idx = 0)]]",
+                          namespaces=nsmap("p"))
+
+
+def find_placeholder(spTree, idx):
+    """The placeholder `<p:sp>` with index `idx` in a slide's shape tree (a title's idx is 0)"""
+    return _placeholder_path(spTree, idx=idx)[0]
+
+
+def fill_placeholder(sp, paragraphs):
+    """Replace the paragraphs of placeholder shape `sp` with the `<a:p>` elements in `paragraphs`"""
+    txBody = sp.get_or_add_txBody()
+    for p in txBody.p_lst:
+        txBody.remove(p)
+    for p in paragraphs:
+        txBody.append(p)
+
+
+def _insets(margins):
+    """a:bodyPr inset attributes for (left, top, right, bottom) margins in points"""
+    if not margins:
+        return ""
+    names = ("lIns", "tIns", "rIns", "bIns")
+    return "".join(f' {name}="{int(margin * 12700)}"' for name, margin in zip(names, margins)
+                   if margin is not None)
+
+
+@lru_cache(maxsize=None)
+def _textbox_template(word_wrap, fill=None, margins=None):
+    wrap = "square" if word_wrap else "none"
+    background = f'<a:solidFill><a:srgbClr val="{_hex(fill)}"/></a:solidFill>' if fill else "<a:noFill/>"
+    return parse_xml(
+        f'<p:sp {nsdecls("a", "p")}><p:nvSpPr><p:cNvPr id="0" name=""/><p:cNvSpPr txBox="1"/>'
+        f'<p:nvPr/></p:nvSpPr><p:spPr><a:xfrm><a:off x="0" y="0"/><a:ext cx="0" cy="0"/></a:xfrm>'
+        f'<a:prstGeom prst="rect"><a:avLst/></a:prstGeom>{background}</p:spPr>'
+        f'<p:txBody><a:bodyPr wrap="{wrap}"{_insets(margins)}><a:spAutoFit/></a:bodyPr><a:lstStyle/>'
+        f'</p:txBody></p:sp>'
+    )
+
+
+def add_textbox(slide, x, y, cx, cy, paragraphs, word_wrap=False, fill=None, margins=None):
+    """
+    Append a text box holding the `<a:p>` elements in `paragraphs` to `slide`.
+
+    Mirrors slide.shapes.add_textbox(): same shape id/name sequence and
+    geometry, but the body is assembled from pre-styled fragments. `fill`
+    gives the box a solid background and `margins` (left, top, right,
+    bottom, in points) override its text insets.
+    """
+    spTree = slide.shapes._spTree
+    shape_id = spTree.max_shape_id + 1
+    sp = deepcopy(_textbox_template(bool(word_wrap), fill, margins))
+
+    cNvPr = sp.nvSpPr.cNvPr
+    cNvPr.set("id", str(shape_id))
+    cNvPr.set("name", f"TextBox {shape_id - 1}")
+    xfrm = sp.spPr.xfrm
+    xfrm.off.set("x", str(int(x)))
+    xfrm.off.set("y", str(int(y)))
+    xfrm.ext.set("cx", str(int(cx)))
+    xfrm.ext.set("cy", str(int(cy)))
+
+    txBody = sp.txBody
+    for p in paragraphs:
+        txBody.append(p)
+    spTree.append(sp)
+    return sp
+
+
+@lru_cache(maxsize=None)
+def _solid_fill(color):
+    return parse_xml(f'<a:solidFill {nsdecls("a")}><a:srgbClr val="{_hex(color)}"/></a:solidFill>')
+
+
+@lru_cache(maxsize=None)
+def _line(color, width=None, dash=None, head=False, tail=False):
+    w = f' w="{int(width * 12700)}"' if width else ""
+    return parse_xml(
+        f'<a:ln {nsdecls("a")}{w}><a:solidFill><a:srgbClr val="{_hex(color)}"/></a:solidFill>'
+        + (f'<a:prstDash val="{dash}"/>' if dash else "")
+        + ('<a:headEnd type="triangle"/>' if head else "")
+        + ('<a:tailEnd type="triangle"/>' if tail else "")
+        + '</a:ln>'
+    )
+
+
+def style_shape(sp, fill=None, line=None, line_width=None, dash=None, head=False, tail=False):
+    """
+    Give a new autoshape, connector or freeform its fill and outline in one go.
+
+    Appends cached `<a:solidFill>` / `<a:ln>` clones to its spPr; `line_width`
+    is in points, `dash` an a:prstDash value and `head` / `tail` add
+    triangle arrowheads.
+    """
+    spPr = sp.spPr
+    if fill:
+        spPr.append(deepcopy(_solid_fill(fill)))
+    if line:
+        spPr.append(deepcopy(_line(line, line_width, dash, head, tail)))
+
+
+def set_text(txBody, paragraphs, anchor=None, wrap=None, margins=None):
+    """Replace a shape's paragraphs and set its anchor, wrapping and insets (points)"""
+    bodyPr = txBody.bodyPr
+    if anchor:
+        bodyPr.set("anchor", anchor)
+    if wrap is not None:
+        bodyPr.set("wrap", "square" if wrap else "none")
+    for name, margin in zip(("lIns", "tIns", "rIns", "bIns"), margins or ()):
+        if margin is not None:
+            bodyPr.set(name, str(int(margin * 12700)))
+    txBody.clear_content()
+    for p in paragraphs:
+        txBody.append(p)
+
+
+def fill_table(tbl, headers, rows, header_style, header_fill, cell_style):
+    """
+    Fill a freshly added `<a:tbl>` in one pass over its rows and cells.
+
+    Walks tr/tc elements directly rather than resolving table.cell(i, j)
+    proxies, cloning one styled paragraph per cell.
+    """
+    tr_lst = tbl.tr_lst
+    for tc, header in zip(tr_lst[0].tc_lst, headers):
+        _set_cell(tc, frame_paragraphs(header_style, header))
+        tc.get_or_add_tcPr().append(deepcopy(_solid_fill(header_fill)))
+
+    for tr, row in zip(tr_lst[1:], rows):
+        for tc, cell_text in zip(tr.tc_lst, row):
+            _set_cell(tc, frame_paragraphs(cell_style, str(cell_text)))
+
+
+def _set_cell(tc, paragraphs):
+    txBody = tc.get_or_add_txBody()
+    txBody.clear_content()
+    for p in paragraphs:
+        txBody.append(p)
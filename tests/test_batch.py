@@ -0,0 +1,36 @@
+"""deck_batch converts slide decks and prose documents alike"""
+
+import os
+import sys
+
+from pptx import Presentation
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from deck_batch import convert_batch  # noqa: E402
+from deck_markdown import iter_section_specs  # noqa: E402
+
+HEALTH_INSURANCE = os.path.join(ROOT, "agentic-testing-framework-health-insurance.md")
+
+
+def slide_titles(path):
+    return [slide.shapes[0].text_frame.text for slide in Presentation(path).slides]
+
+
+def test_prose_document_converts_to_its_sections(tmp_path):
+    [(source, output, slides, _, error)] = convert_batch([HEALTH_INSURANCE], str(tmp_path), workers=1)
+    assert error is None
+    titles = slide_titles(output)
+    assert slides == len(titles)
+    sections = [spec.title for spec in iter_section_specs(HEALTH_INSURANCE)]
+    assert sections[0] == "Framework Overview"
+    assert [title for title in titles if not title.endswith("(cont.)")] == sections
+
+
+def test_source_without_sections_fails(tmp_path):
+    source = tmp_path / "notes.md"
+    source.write_text("# Notes\n\nJust a paragraph.\n", encoding="utf-8")
+    [(_, output, slides, _, error)] = convert_batch([str(source)], str(tmp_path / "out"), workers=1)
+    assert slides == 0 and "no `## Slide N:` or `## ` sections" in error
+    assert not os.path.exists(output)
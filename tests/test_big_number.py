@@ -0,0 +1,38 @@
+"""Big-number slides keep every metric readable and inside its own block"""
+
+import os
+import sys
+
+import pytest
+from pptx import Presentation
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from deck_render import METRIC_MIN_NUMBER_SIZE, create_presentation  # noqa: E402
+from deck_validate import validate_package  # noqa: E402
+
+
+def build_metrics(tmp_path, count):
+    lines = ["## Slide 1: Metrics", "<!-- slide: big_number -->", ""]
+    lines += [f"- **{index * 7}%** Metric label {index}" for index in range(count)]
+    source = tmp_path / "metrics.md"
+    source.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    output = str(tmp_path / "metrics.pptx")
+    create_presentation(str(source), output, diagrams=False)
+    return output
+
+
+@pytest.mark.parametrize("count", [1, 4, 7, 20, 100])
+def test_metrics_validate_clean(tmp_path, count):
+    assert validate_package(build_metrics(tmp_path, count)) == []
+
+
+def test_crowded_metrics_continue_on_more_slides(tmp_path):
+    slides = Presentation(build_metrics(tmp_path, 100)).slides
+    assert len(slides) > 1
+    assert slides[1].shapes[0].text_frame.text == "Metrics (cont.)"
+    numbers = [shape for slide in slides for shape in list(slide.shapes)[1::2]]
+    assert len(numbers) == 100
+    sizes = [int(size) / 100 for shape in numbers for size in shape._element.xpath(".//a:defRPr/@sz")]
+    assert len(sizes) == 100 and min(sizes) >= METRIC_MIN_NUMBER_SIZE
@@ -0,0 +1,29 @@
+"""deck_chart keeps x labels only for categorical data and orders numeric x for downsampling"""
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from deck_chart import MAX_POINTS, downsample, table_from_rows  # noqa: E402
+
+
+def test_numeric_x_has_no_labels_and_is_sorted():
+    table = table_from_rows(["Day", "Runs"], [["3", "30"], ["1", "10"], ["2", "20"]])
+    assert table.labels is None
+    assert list(table.xs) == [1, 2, 3]
+    assert list(table.series[0][1]) == [10, 20, 30]
+
+
+def test_label_after_numbers_makes_every_x_a_label():
+    table = table_from_rows(["Release", "Tests"], [["1", "10"], ["1250000", "20"], ["2.0-rc", "30"]])
+    assert table.labels == ["1", "1250000", "2.0-rc"]
+    assert list(table.xs) == [0, 1, 2]
+
+
+def test_shuffled_long_series_downsamples_like_sorted():
+    count = MAX_POINTS * 4
+    rows = [[str(x), str((x * 37) % 101)] for x in range(count)]
+    shuffled = rows[1::2] + rows[::2]
+    assert downsample(table_from_rows(["x", "y"], shuffled)).xs == downsample(table_from_rows(["x", "y"], rows)).xs
@@ -0,0 +1,23 @@
+"""Incremental builds re-render every slide when the code that parses or renders them changes"""
+
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import deck_markdown  # noqa: E402
+import deck_results  # noqa: E402
+from deck_render import style_fingerprint  # noqa: E402
+
+
+@pytest.mark.parametrize("module", [deck_markdown, deck_results], ids=lambda module: module.__name__)
+def test_parser_source_is_part_of_the_fingerprint(monkeypatch, tmp_path, module):
+    before = style_fingerprint()
+    edited = tmp_path / os.path.basename(module.__file__)
+    with open(module.__file__, encoding="utf-8") as handle:
+        edited.write_text(handle.read() + "\n# edited\n", encoding="utf-8")
+    monkeypatch.setattr(module, "__file__", str(edited))
+    assert style_fingerprint() != before
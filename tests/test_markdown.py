@@ -0,0 +1,27 @@
+"""check_deck reports content a slide kind cannot show"""
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from deck_markdown import DEFAULT_SOURCE, check_deck  # noqa: E402
+
+BIG_NUMBER = """## Slide 1: Metrics
+<!-- slide: big_number -->
+
+- **40%** Faster releases
+- **3 days** Full regression
+- Dashboards for every team
+
+Rolled out across all squads.
+"""
+
+
+def test_big_number_slide_warns_about_other_items():
+    assert check_deck(BIG_NUMBER.splitlines()) == ["Slide 1: 2 item(s) are not shown on a big_number slide"]
+
+
+def test_shipped_deck_is_clean():
+    assert check_deck(DEFAULT_SOURCE) == []
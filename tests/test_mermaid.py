@@ -0,0 +1,51 @@
+"""Mermaid layouts keep edge labels clear and report what they could not parse"""
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from deck_markdown import DEFAULT_MERMAID_SOURCE  # noqa: E402
+from deck_mermaid import (check_mermaid, iter_mermaid_blocks, label_size, layout_graph,  # noqa: E402
+                          parse_flowchart)
+
+ARCHITECTURE = DEFAULT_MERMAID_SOURCE
+
+
+def label_boxes(layout):
+    boxes = []
+    for edge in layout["edges"]:
+        if edge["label"]:
+            width, height = label_size(edge["label"])
+            boxes.append((edge["label_at"][0] - width / 2, edge["label_at"][1] - height / 2, width, height))
+    return boxes
+
+
+def crosses(box, other):
+    return (box[0] < other[0] + other[2] and other[0] < box[0] + box[2]
+            and box[1] < other[1] + other[3] and other[1] < box[1] + box[3])
+
+
+def inside(box, other):
+    return (other[0] <= box[0] and box[0] + box[2] <= other[0] + other[2]
+            and other[1] <= box[1] and box[1] + box[3] <= other[1] + other[3])
+
+
+def test_edge_labels_clear_nodes_borders_and_each_other():
+    for heading, block in iter_mermaid_blocks(ARCHITECTURE):
+        layout = layout_graph(parse_flowchart(block))
+        labels = label_boxes(layout)
+        nodes = [(node["x"], node["y"], node["w"], node["h"]) for node in layout["nodes"]]
+        groups = [(group["x"], group["y"], group["w"], group["h"]) for group in layout["groups"]]
+        for i, box in enumerate(labels):
+            assert not any(crosses(box, node) for node in nodes), heading
+            assert all(inside(box, group) for group in groups if crosses(box, group)), heading
+            assert not any(crosses(box, other) for other in labels[i + 1:]), heading
+
+
+def test_parse_warnings_reach_the_layout(tmp_path):
+    source = tmp_path / "diagrams.md"
+    source.write_text("## Broken\n\n```mermaid\ngraph TD\n    A --> B\n    end\n```\n", encoding="utf-8")
+    assert check_mermaid(str(source)) == ["Broken: line 3: 'end' without subgraph"]
+    assert check_mermaid(ARCHITECTURE) == []
@@ -0,0 +1,40 @@
+"""deck_server rejects requests it cannot render as RequestErrors (HTTP 400), not crashes"""
+
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from deck_server import RequestError, main, parse_request  # noqa: E402
+
+ONE_COLUMN_CHART = """## Slide 1: Trend
+<!-- chart: line -->
+
+| Release |
+|---------|
+| 1.0 |
+"""
+
+
+@pytest.mark.parametrize("slide", [
+    {"kind": "table", "title": "Empty", "headers": [], "rows": []},
+    {"kind": "chart", "title": "No series", "headers": ["Release"], "rows": [["1.0"]]},
+    {"kind": "chart", "title": "No table"},
+])
+def test_slides_without_data_are_bad_requests(slide):
+    with pytest.raises(RequestError):
+        parse_request({"slides": [slide]})
+
+
+def test_markdown_chart_without_series_is_a_bad_request():
+    with pytest.raises(RequestError):
+        parse_request({"markdown": ONE_COLUMN_CHART})
+
+
+def test_render_needs_at_least_one_request(tmp_path):
+    with pytest.raises(SystemExit) as error:
+        main(["render", "-n", "0", "-o", str(tmp_path / "deck.pptx"), str(tmp_path / "request.json")])
+    assert error.value.code == 2
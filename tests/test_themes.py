@@ -0,0 +1,46 @@
+"""The built-in diagram slides take every color from the active theme"""
+
+import os
+import re
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import deck_styles  # noqa: E402
+from deck_render import DIAGRAM_SLIDES, new_presentation  # noqa: E402
+
+A_NS = "http://schemas.openxmlformats.org/drawingml/2006/main"
+
+
+@pytest.fixture(autouse=True)
+def default_theme():
+    yield
+    deck_styles.use_theme(deck_styles.DEFAULT_THEME)
+
+
+def theme_colors(theme):
+    """Every 'RRGGBB' value the theme's palette, palettes and styles name"""
+    return set(re.findall(r"'([0-9A-F]{6})'", repr((theme.colors, theme.styles, theme.palettes))))
+
+
+def diagram_slide_colors(theme):
+    """{diagram name: set of srgbClr values} for the built-in diagram slides under `theme`"""
+    deck_styles.use_theme(theme)
+    prs = new_presentation()
+    return {name: {element.get("val") for element in add_slide(prs).part._element.iter(f"{{{A_NS}}}srgbClr")}
+            for name, add_slide in DIAGRAM_SLIDES.items()}
+
+
+@pytest.mark.parametrize("theme", sorted(deck_styles.THEMES))
+def test_diagram_slides_use_theme_colors(theme):
+    allowed = theme_colors(deck_styles.THEMES[theme])
+    for name, used in diagram_slide_colors(theme).items():
+        assert used and used <= allowed, f"{name}: {sorted(used - allowed)} not in the {theme} theme"
+
+
+def test_monochrome_diagrams_are_grey():
+    for name, used in diagram_slide_colors("monochrome").items():
+        assert all(color[0:2] == color[2:4] == color[4:6] for color in used), (name, sorted(used))
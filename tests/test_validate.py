@@ -0,0 +1,21 @@
+"""The shipped decks pass deck_validate with their built-in, Mermaid and draw.io diagrams"""
+
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from deck_markdown import DEFAULT_DRAWIO_SOURCE, DEFAULT_MERMAID_SOURCE, DEFAULT_SOURCE  # noqa: E402
+from deck_render import create_presentation  # noqa: E402
+from deck_validate import validate_package  # noqa: E402
+
+
+@pytest.mark.parametrize("diagrams", [{}, {"mermaid": DEFAULT_MERMAID_SOURCE}, {"drawio": DEFAULT_DRAWIO_SOURCE}],
+                         ids=["built-in", "mermaid", "drawio"])
+def test_default_deck_validates_clean(tmp_path, diagrams):
+    output = str(tmp_path / "deck.pptx")
+    create_presentation(DEFAULT_SOURCE, output, **diagrams)
+    assert [str(problem) for problem in validate_package(output)] == []